@@ -0,0 +1,196 @@
+"""읽기 전용 JSON API (모바일 클라이언트 폴링용).
+
+    GET /api/groups/            모임 목록 (discovery 와 같은 q / category / region / cursor / size)
+    GET /api/groups/<id>/       모임 상세 (다가오는 일정, 최근 게시글)
+
+ETag / Last-Modified 는 Group.updated_at (모임과 하위 데이터의 마지막 변경 시각) 으로 만든다.
+상세는 Group 행 한 번만 읽어 변경이 없으면 하위 테이블을 보지 않고 304 를 돌려준다.
+상세는 async 뷰로, 변경이 있으면 모임 정보 / 일정 / 게시글을 함께 조회한다 (async_loaders.py).
+"""
+import hashlib
+
+from django.db.models import Count, Q
+from django.http import JsonResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.http import require_GET
+
+from .async_loaders import gather_sections, run_section
+from .facets import VISIBLE_STATUSES
+from .models import ActivitySchedule, BoardPost, Group, RSVP
+from .pagination import keyset_page, parse_page_size, rank_page
+from .routers import replica_reads
+from .search import search_groups
+
+# 상세 응답에 담을 다가오는 일정 / 최근 게시글 수
+DETAIL_SCHEDULE_LIMIT = 5
+DETAIL_POST_LIMIT = 5
+
+LIST_FIELDS = [
+    "id", "name", "category", "region", "status",
+    "member_count", "max_members", "created_at", "updated_at",
+]
+
+# 한글을 \uXXXX 로 늘리지 않고, 공백 없이
+COMPACT_JSON = {"ensure_ascii": False, "separators": (",", ":")}
+
+
+def _timestamp(dt):
+    return int(dt.timestamp())
+
+
+def http_validators(etag, last_modified):
+    """get_conditional_response 에 넘길 (따옴표 붙인 ETag, Last-Modified 타임스탬프)."""
+    return quote_etag(etag), (_timestamp(last_modified) if last_modified else None)
+
+
+def with_validators(response, etag, last_modified):
+    """응답(200/304)에 ETag / Last-Modified / Cache-Control 을 붙인다."""
+    response.headers.setdefault("ETag", etag)
+    if last_modified:
+        response.headers.setdefault("Last-Modified", http_date(last_modified))
+    # 캐시해도 되지만 쓸 때마다 다시 확인하도록
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def _conditional_json(request, etag, last_modified, build_payload):
+    """If-None-Match / If-Modified-Since 가 맞으면 304, 아니면 build_payload() 를 JSON 으로."""
+    etag, last_modified = http_validators(etag, last_modified)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = JsonResponse(build_payload(), json_dumps_params=COMPACT_JSON)
+    return with_validators(response, etag, last_modified)
+
+
+async def _aconditional_json(request, etag, last_modified, build_payload):
+    """_conditional_json 의 async 판. build_payload 는 코루틴 함수."""
+    etag, last_modified = http_validators(etag, last_modified)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = JsonResponse(await build_payload(), json_dumps_params=COMPACT_JSON)
+    return with_validators(response, etag, last_modified)
+
+
+def _list_item(group):
+    return {
+        "id": group.id,
+        "name": group.name,
+        "category": group.category,
+        "region": group.region,
+        "status": group.status,
+        "member_count": group.member_count,
+        "max_members": group.max_members,
+        "updated_at": group.updated_at.isoformat(),
+    }
+
+
+@require_GET
+@replica_reads
+def group_list(request):
+    groups = Group.objects.filter(status__in=VISIBLE_STATUSES).only(*LIST_FIELDS)
+
+    category = request.GET.get("category", "")
+    region = request.GET.get("region", "")
+    if category:
+        groups = groups.filter(category=category)
+    if region:
+        groups = groups.filter(region__icontains=region)
+
+    # 랭킹 상위 N 개는 필터를 적용한 모임 안에서 고른다
+    query = request.GET.get("q", "")
+    ranked = False
+    if query:
+        groups, ranked = search_groups(groups, query)
+
+    page_size = parse_page_size(request.GET.get("size"))
+    paginate = rank_page if ranked else keyset_page
+    items, next_cursor = paginate(groups, request.GET.get("cursor"), page_size)
+
+    # 목록 ETag: 이 페이지에 든 모임들과 각각의 변경 시각
+    fingerprint = "|".join(f"{group.id}:{group.updated_at.timestamp()}" for group in items)
+    etag = hashlib.sha1(f"{fingerprint}|{next_cursor}".encode()).hexdigest()
+    last_modified = max((group.updated_at for group in items), default=None)
+
+    return _conditional_json(
+        request, etag, last_modified,
+        lambda: {"results": [_list_item(group) for group in items], "next_cursor": next_cursor},
+    )
+
+
+def _detail_group(group_id):
+    group = Group.objects.select_related("leader").get(pk=group_id)
+    return {
+        "id": group.id,
+        "name": group.name,
+        "category": group.category,
+        "region": group.region,
+        "status": group.status,
+        "description": group.description,
+        "member_count": group.member_count,
+        "max_members": group.max_members,
+        "leader": group.leader.nickname if group.leader else None,
+        "created_at": group.created_at.isoformat(),
+        "updated_at": group.updated_at.isoformat(),
+    }
+
+
+def _detail_schedules(group_id, schedules_from):
+    schedules = (
+        ActivitySchedule.objects.filter(group_id=group_id, date_time__gte=schedules_from)
+        .annotate(attendees=Count("rsvp", filter=Q(rsvp__attendance_status=RSVP.AttendanceStatus.ATTENDING)))
+        .order_by("date_time", "id")[:DETAIL_SCHEDULE_LIMIT]
+    )
+    return [
+        {
+            "id": schedule.id,
+            "title": schedule.title,
+            "date_time": schedule.date_time.isoformat(),
+            "location": schedule.location,
+            "fee": schedule.participation_fee,
+            "attendees": schedule.attendees,
+        }
+        for schedule in schedules
+    ]
+
+
+def _detail_posts(group_id):
+    posts = (
+        BoardPost.objects.filter(group_id=group_id)
+        .only("id", "title", "is_notice", "created_at")
+        .order_by("-is_notice", "-created_at", "-id")[:DETAIL_POST_LIMIT]
+    )
+    return [
+        {"id": post.id, "title": post.title, "is_notice": post.is_notice, "created_at": post.created_at.isoformat()}
+        for post in posts
+    ]
+
+
+async def _detail_payload(group_id, schedules_from):
+    # 모임 정보 / 다가오는 일정 / 최근 게시글은 서로 독립적이므로 함께 조회한다
+    sections = await gather_sections(
+        group=run_section(lambda: _detail_group(group_id)),
+        schedules=run_section(lambda: _detail_schedules(group_id, schedules_from)),
+        posts=run_section(lambda: _detail_posts(group_id)),
+    )
+    return {
+        **sections["group"],
+        "upcoming_schedules": sections["schedules"],
+        "recent_posts": sections["posts"],
+    }
+
+
+@require_GET
+@replica_reads
+async def group_detail(request, group_id):
+    updated_at = await Group.objects.filter(pk=group_id).values_list("updated_at", flat=True).afirst()
+    if updated_at is None:
+        return JsonResponse({"detail": "존재하지 않는 모임입니다."}, status=404, json_dumps_params=COMPACT_JSON)
+
+    # "다가오는 일정" 은 날짜가 지나면 바뀌므로 오늘 날짜도 검증값에 넣는다
+    today_start = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+    etag = f"g{group_id}-{updated_at.timestamp():.6f}-{today_start.date().isoformat()}"
+    return await _aconditional_json(
+        request, etag, max(updated_at, today_start), lambda: _detail_payload(group_id, today_start)
+    )
@@ -1,6 +1,34 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_migrate
+
+
+def _restore_search_index(sender, using, **kwargs):
+    from django.db import connections
+
+    from .search import install_search_index
+
+    install_search_index(connections[using])
 
 
 class MainConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'club_management'
+
+    def ready(self):
+        post_migrate.connect(_restore_search_index, sender=self)
+
+        # 새 DB 연결마다 SQLite PRAGMA 적용 (운영 모드)
+        from .sqlite_pragmas import apply_sqlite_pragmas
+
+        connection_created.connect(apply_sqlite_pragmas)
+
+        # 요청별 SQL 계측: 어느 스레드에서 열린 연결이든 요청의 recorder 로 기록
+        from .middleware import install_query_recorder
+
+        connection_created.connect(install_query_recorder)
+
+        # 모델 변경 → 모임 캐시 버전 갱신
+        from . import signals  # noqa: F401
+
+        # 종료 시 남은 게시글 조회수 반영은 조회를 받은 프로세스에서만 등록한다 (view_counter.record_view)
@@ -0,0 +1,90 @@
+"""async 뷰(ASGI)용 모임 상세 로더.
+
+loaders.py 는 모임 요약, 내 역할, 탭 데이터를 하나씩 차례로 조회한다.
+여기서는 서로 기다릴 필요가 없는 섹션을 asyncio.gather 로 함께 기다려
+응답 시간이 섹션 시간의 합이 아니라 가장 느린 섹션의 시간에 가깝도록 한다.
+
+- 가벼운 단일 조회(내 역할, 모임 변경 시각)는 async ORM(afirst 등)으로
+- 여러 쿼리로 된 섹션(모임 요약, 탭 데이터, API 일정/게시글)은 동기 로더를 run_section 으로
+
+Django 의 async ORM 과 sync_to_async 기본값(thread_sensitive=True)은 요청의 DB 연결 하나로
+쿼리를 차례로 보낸다. ASYNC_PARALLEL_SECTIONS = True(ASGI 기본값, config/asgi.py)이면 run_section 이
+섹션마다 이벤트 루프의 스레드 풀(= 스레드별 DB 연결)을 써서 쿼리가 실제로 겹친다.
+- 연결 비용: 워커마다 스레드 풀 크기(min(32, CPU 수 + 4))만큼 연결이 더 열릴 수 있다 (CONN_MAX_AGE 동안 유지)
+- 다른 연결은 커밋 전 데이터를 볼 수 없으므로 ATOMIC_REQUESTS 와 함께 켜지 않는다.
+False 이면 섹션이 요청 스레드에서 차례로 실행되어 응답 시간은 섹션 시간의 합이 된다.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+
+from .group_cache import acached_group_section, aget_group_version
+from .loaders import (
+    build_group_tab,
+    load_club_summary,
+    parse_page_number,
+    role_flags,
+    tab_section_name,
+)
+from .membership import aget_roles
+
+
+def _on_own_connection(builder):
+    def run():
+        try:
+            return builder()
+        finally:
+            # 요청이 끝날 때처럼 이 스레드의 연결을 정리한다 (CONN_MAX_AGE 를 따름)
+            close_old_connections()
+    return run
+
+
+async def run_section(builder):
+    """동기 섹션 로더 builder() 를 스레드에서 실행하고 결과를 기다린다."""
+    if getattr(settings, "ASYNC_PARALLEL_SECTIONS", False):
+        return await sync_to_async(_on_own_connection(builder), thread_sensitive=False)()
+    return await sync_to_async(builder)()
+
+
+async def gather_sections(**sections):
+    """{이름: 코루틴} 을 함께 기다려 {이름: 결과} 로 돌려준다."""
+    results = await asyncio.gather(*sections.values())
+    return dict(zip(sections, results))
+
+
+async def aget_member_role(group_id, user):
+    """get_member_role 의 async 판."""
+    return (await aget_roles(user)).get(group_id)
+
+
+async def aload_group_detail(group_id, user):
+    """load_group_detail 의 async 판: 모임 요약(캐시)과 내 역할을 함께 조회한다."""
+    sections = await gather_sections(
+        club=acached_group_section(
+            group_id, "summary", lambda: run_section(lambda: load_club_summary(group_id))
+        ),
+        role=aget_member_role(group_id, user),
+    )
+    return {"club": sections["club"], **role_flags(sections["role"])}
+
+
+async def aload_group_tab(group_id, tab_name, user, page_number=1):
+    """load_group_tab 의 async 판.
+
+    탭 캐시 키에 리더 여부가 들어가므로, 내 역할과 모임 버전을 함께 조회한 뒤 탭 데이터를 읽는다.
+    """
+    page_number = parse_page_number(page_number)
+    sections = await gather_sections(
+        role=aget_member_role(group_id, user),
+        version=aget_group_version(group_id),
+    )
+    flags = role_flags(sections["role"])
+    data = await acached_group_section(
+        group_id,
+        tab_section_name(tab_name, page_number, flags),
+        lambda: run_section(lambda: build_group_tab(group_id, tab_name, page_number, flags)),
+        version=sections["version"],
+    )
+    return {"tab_name": tab_name, **flags, **data}
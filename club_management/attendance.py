@@ -0,0 +1,66 @@
+"""일정 출석 체크 (운영진).
+
+멤버 한 명씩 저장하면 참석자 수만큼 요청/UPDATE 가 생기므로,
+한 번 제출된 출석부 전체를 (user, schedule) 유니크 키 기준 upsert 한 번으로 저장한다.
+"""
+from django.db import transaction
+
+from .counters import ACTIVE_ROLES
+from .group_cache import mark_group_changed
+from .models import GroupMember, RSVP
+
+# 출석부에서 고를 수 있는 상태
+CHECK_IN_STATUSES = [RSVP.AttendanceStatus.PRESENT, RSVP.AttendanceStatus.ABSENT]
+
+UPSERT_BATCH_SIZE = 500
+
+
+def attendance_sheet(schedule):
+    """출석부 화면용: 모임의 승인된 멤버 전체와 각자의 현재 응답/출석 상태."""
+    statuses = dict(
+        RSVP.objects.filter(schedule=schedule).values_list("user_id", "attendance_status")
+    )
+    members = (
+        GroupMember.objects.filter(group_id=schedule.group_id, member_role__in=ACTIVE_ROLES)
+        .select_related("user")
+        .order_by("user__nickname", "id")
+    )
+    return [
+        {
+            "user_id": member.user_id,
+            "nickname": member.user.nickname,
+            "status": statuses.get(member.user_id, RSVP.AttendanceStatus.PENDING),
+        }
+        for member in members
+    ]
+
+
+def record_attendance(schedule, statuses):
+    """{user_id: PRESENT/ABSENT} 를 한 트랜잭션에서 저장한다. 저장한 건수를 반환.
+
+    모임의 승인된 멤버가 아닌 user_id 와 출석 체크용이 아닌 상태는 무시한다.
+    """
+    with transaction.atomic():
+        member_ids = set(
+            GroupMember.objects.filter(
+                group_id=schedule.group_id,
+                member_role__in=ACTIVE_ROLES,
+                user_id__in=list(statuses),
+            ).values_list("user_id", flat=True)
+        )
+        rows = [
+            RSVP(user_id=user_id, schedule=schedule, attendance_status=status)
+            for user_id, status in statuses.items()
+            if user_id in member_ids and status in CHECK_IN_STATUSES
+        ]
+        RSVP.objects.bulk_create(
+            rows,
+            batch_size=UPSERT_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["user", "schedule"],
+            update_fields=["attendance_status"],
+        )
+        # bulk_create 는 post_save 시그널을 보내지 않으므로 직접 변경을 기록한다
+        if rows:
+            mark_group_changed(schedule.group_id)
+    return len(rows)
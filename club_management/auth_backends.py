@@ -0,0 +1,74 @@
+"""로그인 사용자 조회 캐시.
+
+AuthenticationMiddleware 는 요청마다 세션의 사용자 id 로 User 를 DB 에서 다시 읽는다.
+CachedModelBackend 는 이 조회를 "사용자 id + 버전" 키의 캐시로 대신한다 (cache_versions.py).
+
+- User 가 저장/삭제되면(프로필 수정, 비밀번호 변경, 로그인 시각 갱신) 커밋 후 버전을 올린다 (signals.py)
+- 캐시된 User 에도 비밀번호 해시가 들어 있으므로 세션의 인증 해시 검증은 그대로 동작한다
+  (비밀번호를 바꾸면 다른 기기의 세션은 로그아웃)
+- 로그인(authenticate) 은 ModelBackend 그대로
+- 공유 캐시가 없으면(cache_versions.shared_cache_enabled) 캐시하지 않고 ModelBackend 처럼 DB 에서 읽는다
+  (LocMem 이면 다른 워커가 비밀번호 변경 전의 사용자와 해시를 계속 쓰게 되므로)
+- settings.AUTHENTICATION_BACKENDS 에 ModelBackend 도 남겨, 그 경로로 저장된 기존 세션은 그대로 유지된다
+- async 뷰의 request.auser() 는 aget_user 를 쓴다
+"""
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db import transaction
+
+from .cache_versions import aget_version, bump_version, get_version, shared_cache_enabled
+from .routers import primary_reads
+
+VERSION_KEY_PREFIX = "auth_user_version"
+USER_KEY_PREFIX = "auth_user"
+
+USER_TIMEOUT = 60 * 60
+
+
+def _version_key(user_id):
+    return f"{VERSION_KEY_PREFIX}:{user_id}"
+
+
+def _user_key(user_id, version):
+    return f"{USER_KEY_PREFIX}:{user_id}:{version}"
+
+
+def forget_user(user_id):
+    """현재 트랜잭션이 커밋된 뒤 user_id 의 사용자 캐시를 무효화한다. (트랜잭션 밖이면 바로)"""
+    transaction.on_commit(lambda: bump_version(_version_key(user_id)))
+
+
+class CachedModelBackend(ModelBackend):
+    def get_user(self, user_id):
+        if not shared_cache_enabled():
+            with primary_reads():
+                return super().get_user(user_id)
+        key = _user_key(user_id, get_version(_version_key(user_id)))
+        user = cache.get(key)
+        if user is None:
+            UserModel = get_user_model()
+            # 방금 바꾼 비밀번호/프로필이 복제 지연으로 예전 값으로 캐시되지 않도록
+            with primary_reads():
+                try:
+                    user = UserModel._default_manager.get(pk=user_id)
+                except UserModel.DoesNotExist:
+                    return None
+            cache.set(key, user, USER_TIMEOUT)
+        return user if self.user_can_authenticate(user) else None
+
+    async def aget_user(self, user_id):
+        if not shared_cache_enabled():
+            with primary_reads():
+                return await super().aget_user(user_id)
+        key = _user_key(user_id, await aget_version(_version_key(user_id)))
+        user = await cache.aget(key)
+        if user is None:
+            UserModel = get_user_model()
+            with primary_reads():
+                try:
+                    user = await UserModel._default_manager.aget(pk=user_id)
+                except UserModel.DoesNotExist:
+                    return None
+            await cache.aset(key, user, USER_TIMEOUT)
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,219 @@
+"""은행 거래 내역 CSV 가져오기.
+
+파일을 한 줄씩 읽으며 검증하고, CHUNK_SIZE 줄마다 이미 들어간 거래(내용 해시)를 걸러낸 뒤
+bulk_create 로 넣는다. 전체가 한 트랜잭션이며 잔액/월별 집계는 ledger.record_transactions 로 갱신한다.
+bulk_create 는 저장 시그널을 보내지 않으므로 모임 변경 기록(mark_group_changed)은 가져오기 끝에 한 번 한다.
+
+지원하는 헤더 (첫 줄, 순서 무관):
+    날짜: 거래 날짜 / 거래일 / 날짜 / date
+    금액: 금액 / amount  또는  입금 + 출금 (deposit / withdrawal)
+    내용: 내용 / 적요 / 메모 / description
+CSV 내보내기(exports.py) 형식도 읽을 수 있다.
+"""
+import csv
+import hashlib
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from django.db import IntegrityError, transaction
+
+from .exports import FORMULA_PREFIXES
+from .group_cache import mark_group_changed
+from .ledger import record_transactions
+from .models import FinancialTransaction
+
+CHUNK_SIZE = 500
+
+# 한 번에 보고할 최대 오류 줄 수 (나머지는 개수만 센다)
+MAX_REPORTED_ERRORS = 100
+
+HEADER_ALIASES = {
+    "date": {"거래 날짜", "거래일", "거래일자", "날짜", "date"},
+    "amount": {"금액", "거래금액", "amount"},
+    "deposit": {"입금", "입금액", "deposit"},
+    "withdrawal": {"출금", "출금액", "withdrawal"},
+    "description": {"내용", "적요", "메모", "description"},
+}
+
+DATE_FORMATS = ["%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d", "%Y%m%d"]
+
+# 업로드 파일 인코딩 (국내 은행 내역은 CP949 인 경우가 많다)
+ENCODINGS = {"utf-8": "utf-8-sig", "cp949": "cp949"}
+
+DESCRIPTION_MAX_LENGTH = FinancialTransaction._meta.get_field("description").max_length
+
+
+class StatementFormatError(ValueError):
+    """헤더를 해석할 수 없는 파일."""
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    duplicates: int = 0
+    error_count: int = 0
+    errors: list = field(default_factory=list)  # [(줄 번호, 메시지)]
+
+    def add_error(self, line_number, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line_number, message))
+
+
+def _column_map(header):
+    columns = {}
+    for index, name in enumerate(header):
+        name = name.strip().lstrip("\ufeff").lower()
+        for key, aliases in HEADER_ALIASES.items():
+            if name in aliases:
+                columns.setdefault(key, index)
+    if "date" not in columns or "description" not in columns:
+        raise StatementFormatError("날짜/내용 열을 찾을 수 없습니다.")
+    if "amount" not in columns and not ({"deposit", "withdrawal"} & columns.keys()):
+        raise StatementFormatError("금액(또는 입금/출금) 열을 찾을 수 없습니다.")
+    return columns
+
+
+def _parse_date(value):
+    value = value.strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"날짜 형식이 올바르지 않습니다: {value!r}")
+
+
+def _parse_amount(value):
+    cleaned = value.strip().replace(",", "").replace("원", "").replace(" ", "")
+    if not cleaned:
+        return 0
+    try:
+        return int(cleaned)
+    except ValueError:
+        raise ValueError(f"금액이 숫자가 아닙니다: {value!r}") from None
+
+
+def _cell(row, columns, key):
+    index = columns.get(key)
+    return row[index] if index is not None and index < len(row) else ""
+
+
+def _parse_row(row, columns):
+    """(거래 날짜, 금액, 내용). 잘못된 줄이면 ValueError."""
+    transaction_date = _parse_date(_cell(row, columns, "date"))
+
+    if "amount" in columns:
+        amount = _parse_amount(_cell(row, columns, "amount"))
+    else:
+        amount = _parse_amount(_cell(row, columns, "deposit")) - _parse_amount(_cell(row, columns, "withdrawal"))
+    if amount == 0:
+        raise ValueError("금액이 0 입니다.")
+
+    description = _cell(row, columns, "description").strip()
+    # 내보내기에서 수식 방지로 붙인 따옴표 제거 (수식 시작 문자 앞에 붙은 경우만)
+    if description.startswith("'") and description[1:].startswith(FORMULA_PREFIXES):
+        description = description[1:]
+    if not description:
+        raise ValueError("내용이 비어 있습니다.")
+    if len(description) > DESCRIPTION_MAX_LENGTH:
+        raise ValueError(f"내용이 {DESCRIPTION_MAX_LENGTH}자를 넘습니다.")
+    return transaction_date, amount, description
+
+
+def content_hash(transaction_date, amount, description, occurrence):
+    """같은 날 같은 금액/내용의 거래가 여러 번 있을 수 있으므로 파일 안에서 몇 번째인지도 넣는다."""
+    raw = f"{transaction_date.isoformat()}|{amount}|{description}|{occurrence}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _existing_hashes(group, chunk):
+    return set(
+        FinancialTransaction.objects.filter(
+            group=group, import_hash__in=[tx.import_hash for tx in chunk],
+        ).values_list("import_hash", flat=True)
+    )
+
+
+def _insert(new):
+    """new 를 넣고 실제로 들어간 거래 목록을 돌려준다.
+
+    중복 확인과 INSERT 사이에 같은 내역을 동시에 가져온 요청이 먼저 넣은 거래는 unique_group_import_hash
+    제약에 걸린다. 그때는 한 건씩 다시 넣으며 걸린 거래를 건너뛴다 (중복으로 센다).
+    """
+    try:
+        with transaction.atomic():
+            FinancialTransaction.objects.bulk_create(new, batch_size=CHUNK_SIZE)
+        return new
+    except IntegrityError:
+        pass
+
+    inserted = []
+    for tx in new:
+        # 되돌려진 배치에서 받은 pk 는 버린다
+        tx.pk = None
+        try:
+            with transaction.atomic():
+                FinancialTransaction.objects.bulk_create([tx])
+        except IntegrityError:
+            continue
+        inserted.append(tx)
+    return inserted
+
+
+def _save_chunk(group, chunk, result):
+    existing = _existing_hashes(group, chunk)
+    new = [tx for tx in chunk if tx.import_hash not in existing]
+    inserted = _insert(new) if new else []
+    result.duplicates += len(chunk) - len(inserted)
+    if inserted:
+        record_transactions(inserted)
+        result.created += len(inserted)
+
+
+def import_statement(group, lines, user=None, dry_run=False):
+    """CSV 텍스트 줄(iterable)을 읽어 group 의 거래로 추가한다.
+
+    잘못된 줄은 건너뛰고 ImportResult.errors 에 기록한다. dry_run 이면 검증만 하고 저장하지 않는다.
+    """
+    reader = csv.reader(lines)
+    try:
+        columns = _column_map(next(reader))
+    except StopIteration:
+        raise StatementFormatError("빈 파일입니다.") from None
+
+    result = ImportResult()
+    occurrences = Counter()
+    chunk = []
+    with transaction.atomic():
+        for row in reader:
+            if not any(cell.strip() for cell in row):
+                continue
+            try:
+                transaction_date, amount, description = _parse_row(row, columns)
+            except ValueError as exc:
+                result.add_error(reader.line_num, str(exc))
+                continue
+
+            key = (transaction_date, amount, description)
+            occurrences[key] += 1
+            chunk.append(FinancialTransaction(
+                group=group,
+                user=user,
+                amount=amount,
+                description=description,
+                transaction_date=transaction_date,
+                import_hash=content_hash(*key, occurrences[key]),
+            ))
+            if len(chunk) >= CHUNK_SIZE:
+                _save_chunk(group, chunk, result)
+                chunk = []
+        if chunk:
+            _save_chunk(group, chunk, result)
+        if result.created:
+            mark_group_changed(group.pk)
+
+        if dry_run:
+            transaction.set_rollback(True)
+    return result
@@ -0,0 +1,183 @@
+"""주요 화면 응답 시간 벤치마크.
+
+테스트 클라이언트로 현재 DB(예: generate_synthetic_data 로 만든 데이터)에 요청을 반복해
+시나리오별 p50/p95/p99 응답 시간과 쿼리 수를 잰다.
+결과를 JSON 기준선으로 저장해두고 변경 후 다시 돌려 비교한다.
+
+쓰기(POST) 시나리오는 요청마다 트랜잭션을 롤백하므로 데이터가 늘어나지 않는다.
+"""
+import math
+import random
+import time
+from contextlib import ExitStack
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.db.models import Count
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from .counters import ACTIVE_ROLES
+from .facets import VISIBLE_STATUSES
+from .middleware import QueryRecorder
+from .models import Group, GroupMember, User
+from .pagination import DEFAULT_PAGE_SIZE, encode_cursor
+
+PERCENTILES = (50, 95, 99)
+
+# 상세 / 쓰기 시나리오에서 돌아가며 요청할 모임 수
+SAMPLE_GROUPS = 50
+
+# 기준선 대비 p95 가 이 비율 이상, 그리고 MIN_REGRESSION_MS 이상 늘면 회귀로 본다
+DEFAULT_TOLERANCE = 0.2
+MIN_REGRESSION_MS = 1.0
+
+
+def percentile(values, pct):
+    """nearest-rank 백분위수."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class BenchmarkFixtures:
+    """시나리오가 요청할 모임/사용자를 DB 에서 한 번 골라둔다."""
+
+    def __init__(self, seed=0):
+        rnd = random.Random(seed)
+        visible = Group.objects.filter(status__in=VISIBLE_STATUSES, leader__isnull=False)
+        candidates = list(visible.order_by("-member_count", "pk").values_list("pk", flat=True)[:SAMPLE_GROUPS * 4])
+        if not candidates:
+            raise ValueError("벤치마크할 모임이 없습니다. generate_synthetic_data 로 데이터를 먼저 만드세요.")
+        self.groups = list(
+            Group.objects.filter(pk__in=rnd.sample(candidates, min(SAMPLE_GROUPS, len(candidates))))
+            .select_related("leader")
+            .order_by("pk")
+        )
+
+        # 가장 많은 모임에 속한 사용자 (마이페이지의 최악의 경우)
+        busiest = (
+            GroupMember.objects.filter(member_role__in=ACTIVE_ROLES)
+            .values("user").annotate(n=Count("id")).order_by("-n")
+            .values_list("user", flat=True).first()
+        )
+        self.busy_user = User.objects.get(pk=busiest)
+
+        # discovery 세 번째 페이지 커서
+        boundary = visible.order_by("-created_at", "-pk")[DEFAULT_PAGE_SIZE * 2 - 1:DEFAULT_PAGE_SIZE * 2].first()
+        self.cursor = encode_cursor(boundary.created_at, boundary.pk) if boundary else ""
+
+        # 검색어: 표본 모임 이름의 주제 단어
+        self.search_term = max(self.groups[0].name.split(), key=len)
+
+    def group(self, n):
+        return self.groups[n % len(self.groups)]
+
+
+def _group_url(name, group, **kwargs):
+    return reverse(name, kwargs={"group_id": group.id, **kwargs})
+
+
+def _leader(fx, n):
+    return fx.group(n).leader
+
+
+# 시나리오: 이름 -> (메서드, 요청을 만드는 함수(fixtures, n) -> (url, data, 로그인 사용자))
+SCENARIOS = {
+    "discovery": ("get", lambda fx, n: (reverse("Wiki:discovery"), None, None)),
+    "discovery_filtered": ("get", lambda fx, n: (reverse("Wiki:discovery"), {"category": "SPORTS", "region": "서울"}, None)),
+    "discovery_search": ("get", lambda fx, n: (reverse("Wiki:discovery"), {"q": fx.search_term}, None)),
+    "discovery_page3": ("get", lambda fx, n: (reverse("Wiki:discovery"), {"cursor": fx.cursor}, None)),
+    "group_detail": ("get", lambda fx, n: (_group_url("Wiki:group_detail", fx.group(n)), None, _leader(fx, n))),
+    "group_tab_schedule": ("get", lambda fx, n: (_group_url("Wiki:group_tab", fx.group(n), tab_name="schedule"), None, _leader(fx, n))),
+    "group_tab_members": ("get", lambda fx, n: (_group_url("Wiki:group_tab", fx.group(n), tab_name="members"), None, _leader(fx, n))),
+    "my_page": ("get", lambda fx, n: (reverse("Wiki:my_page"), None, fx.busy_user)),
+    "create_group": ("post", lambda fx, n: (reverse("Wiki:create_group"), {
+        "name": f"벤치마크 모임 {n}", "category": "sports", "region": "seoul",
+        "description": "벤치마크", "max_members": "20",
+    }, fx.busy_user)),
+    "schedule_create": ("post", lambda fx, n: (_group_url("Wiki:schedule_create", fx.group(n)), {
+        "title": "벤치마크 일정", "location": "체육관",
+        "date_time": (timezone.localtime() + timedelta(days=7)).strftime("%Y-%m-%dT%H:%M"),
+    }, _leader(fx, n))),
+    "board_post_create": ("post", lambda fx, n: (_group_url("Wiki:board_post_create", fx.group(n)), {
+        "title": "벤치마크 글", "content": "내용",
+    }, _leader(fx, n))),
+    "finance_create": ("post", lambda fx, n: (_group_url("Wiki:finance_create", fx.group(n)), {
+        "amount": "10000", "description": "벤치마크 회비",
+    }, _leader(fx, n))),
+}
+
+
+class BenchmarkRunner:
+    def __init__(self, fixtures, iterations=30, warmup=3, cold_cache=False):
+        self.fixtures = fixtures
+        self.iterations = iterations
+        self.warmup = warmup
+        self.cold_cache = cold_cache
+        self.clients = {}
+
+    def _client(self, user):
+        key = user.pk if user else None
+        if key not in self.clients:
+            client = Client()
+            if user:
+                client.force_login(user)
+            self.clients[key] = client
+        return self.clients[key]
+
+    def _request(self, client, method, url, data):
+        if method == "get":
+            return client.get(url, data)
+        # 쓰기 요청은 측정 후 롤백
+        with transaction.atomic():
+            response = client.post(url, data)
+            transaction.set_rollback(True)
+        return response
+
+    def run_scenario(self, name):
+        method, build = SCENARIOS[name]
+        timings, queries = [], []
+        for n in range(self.warmup + self.iterations):
+            url, data, user = build(self.fixtures, n)
+            # 로그인(세션 생성)은 측정에서 뺀다
+            client = self._client(user)
+            if self.cold_cache:
+                cache.clear()
+            recorder = QueryRecorder()
+            start = time.perf_counter()
+            with ExitStack() as stack:
+                # 복제본(replica)으로 간 읽기도 센다
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(recorder))
+                response = self._request(client, method, url, data)
+            elapsed = (time.perf_counter() - start) * 1000
+            if response.status_code >= 400:
+                raise RuntimeError(f"{name}: {url} 응답 {response.status_code}")
+            if n >= self.warmup:
+                timings.append(elapsed)
+                queries.append(recorder.count)
+
+        result = {f"p{pct}": round(percentile(timings, pct), 2) for pct in PERCENTILES}
+        result["queries"] = max(queries)
+        return result
+
+    def run(self, names=None):
+        return {name: self.run_scenario(name) for name in (names or SCENARIOS)}
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """기준선과 비교해 회귀한 시나리오 목록 [(이름, 사유)]."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if result["queries"] > base["queries"]:
+            regressions.append((name, f"쿼리 수 {base['queries']} → {result['queries']}"))
+        slower = result["p95"] - base["p95"]
+        if slower > base["p95"] * tolerance and slower >= MIN_REGRESSION_MS:
+            regressions.append((name, f"p95 {base['p95']}ms → {result['p95']}ms"))
+    return regressions
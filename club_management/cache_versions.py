@@ -0,0 +1,67 @@
+"""캐시 버전 번호.
+
+데이터 묶음마다 버전 번호를 캐시에 두고 실제 데이터는 "버전이 들어간 키" 로 저장한다.
+데이터가 바뀌면 버전만 올리면 되므로 이전 키를 찾아 지울 필요가 없다.
+(모임 섹션: group_cache.py, 사용자 역할: membership.py, 로그인 사용자: auth_backends.py,
+discovery 필터 집계: facets.py)
+
+버전 번호는 모든 워커가 같은 캐시(Redis/Memcached, CACHE_URL)를 볼 때만 의미가 있다.
+LocMemCache 는 프로세스마다 따로라 한 워커에서 올린 버전이 다른 워커에 보이지 않으므로
+이때는 버전 캐시를 끄고 매번 DB 에서 읽는다 (shared_cache_enabled).
+"""
+import time
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import cache
+
+LOCMEM_BACKEND = "django.core.cache.backends.locmem.LocMemCache"
+
+
+def shared_cache_enabled():
+    """버전 캐시를 써도 되는지.
+
+    공유 캐시이거나, 한 프로세스로만 실행할 때(CACHE_SINGLE_PROCESS: runserver, 테스트) True.
+    """
+    if settings.CACHES["default"]["BACKEND"] != LOCMEM_BACKEND:
+        return True
+    return getattr(settings, "CACHE_SINGLE_PROCESS", False)
+
+
+# 기본 설정(LocMem)으로 돌리는 모든 관리 명령에서 뜨지 않도록 배포 점검(check --deploy)에서만
+@checks.register(checks.Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    if shared_cache_enabled():
+        return []
+    return [
+        checks.Warning(
+            "기본 캐시가 프로세스별 LocMemCache 라서 모임/역할/로그인 사용자 캐시를 끄고 매번 DB 에서 읽습니다.",
+            hint="여러 워커로 실행하면 CACHE_URL=redis://... 를 설정하세요. "
+                 "한 프로세스로만 실행하면 CACHE_SINGLE_PROCESS=True. (세션도 이때만 cached_db)",
+            id="club_management.W001",
+        )
+    ]
+
+
+def get_version(key):
+    version = cache.get(key)
+    if version is None:
+        # 버전 키가 캐시에서 밀려나도 예전 번호를 다시 쓰지 않도록 시각 기반으로 시작
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+async def aget_version(key):
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, time.time_ns(), None)
+        version = await cache.aget(key)
+    return version
+
+
+def bump_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), None)
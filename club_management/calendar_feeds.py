@@ -0,0 +1,177 @@
+"""iCalendar(.ics) 일정 구독 피드.
+
+    GET /calendar/<token>/my.ics                  내 모임 전체의 일정
+    GET /calendar/<token>/group/<group_id>.ics    모임 하나의 일정 (승인된 멤버만)
+
+캘린더 앱은 세션 없이 몇 분마다 같은 주소를 다시 읽는다.
+- 주소에 사용자 토큰을 넣는다. 토큰은 비밀번호 해시로 서명하므로 비밀번호를 바꾸면 예전 주소는 막힌다.
+  토큰의 사용자는 로그인 사용자 캐시(auth_backends.py)에서 읽는다.
+- ETag / Last-Modified 는 모임들의 updated_at(일정이 바뀌면 갱신됨)과 오늘 날짜로 만든다.
+  바뀐 것이 없으면 일정 테이블을 읽지 않고 304 를 돌려준다.
+- 본문은 (group, date_time) 인덱스를 타는 범위 쿼리 한 번을 .iterator() 로 나눠 읽으며 스트리밍한다.
+  (ASGI 에서도 버퍼링되지 않도록 streaming.py 로 감싼다)
+"""
+import hashlib
+from datetime import timedelta, timezone as dt_timezone
+
+from django.http import Http404
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.crypto import constant_time_compare, salted_hmac
+from django.views.decorators.http import require_GET
+
+from .api import http_validators, with_validators
+from .auth_backends import CachedModelBackend
+from .dashboard import my_group_ids
+from .membership import is_active_member
+from .models import ActivitySchedule, Group
+from .routers import replica_reads
+from .streaming import streaming_response
+
+TOKEN_SALT = "club_management.calendar_feeds"
+
+# 피드에 담는 기간 (오늘 기준)
+PAST_DAYS = 30
+FUTURE_DAYS = 365
+
+FEED_CHUNK_SIZE = 500
+
+# 캘린더 앱에 알려주는 갱신 주기
+REFRESH_INTERVAL = "PT15M"
+
+
+def _signature(user_id, password_hash):
+    return salted_hmac(TOKEN_SALT, f"{user_id}:{password_hash}", algorithm="sha256").hexdigest()[:32]
+
+
+def calendar_token(user):
+    """user 의 구독 주소 토큰."""
+    return f"{user.pk}-{_signature(user.pk, user.password)}"
+
+
+def user_from_token(token):
+    """토큰의 사용자. 잘못되었거나 비밀번호가 바뀐 토큰이면 None."""
+    user_id, _, signature = token.partition("-")
+    if not user_id.isdigit():
+        return None
+    user = CachedModelBackend().get_user(int(user_id))
+    if user is None or not constant_time_compare(signature, _signature(user.pk, user.password)):
+        return None
+    return user
+
+
+def _escape(text):
+    # RFC 5545 TEXT 값
+    return (
+        text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def _fold(line):
+    """한 줄을 75 옥텟 단위로 접는다 (UTF-8 글자 중간에서 자르지 않음)."""
+    if len(line.encode()) <= 75:
+        return line + "\r\n"
+    parts, current, size, limit = [], "", 0, 75
+    for char in line:
+        width = len(char.encode())
+        if size + width > limit:
+            parts.append(current)
+            # 이어지는 줄은 앞의 공백 한 칸을 포함해 75 옥텟
+            current, size, limit = "", 0, 74
+        current += char
+        size += width
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _utc(dt):
+    return dt.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def iter_ics(schedules, group_names, calendar_name, host):
+    """일정 queryset(values)을 VCALENDAR 줄 단위 문자열로 내보낸다."""
+    stamp = _utc(timezone.now())
+    yield from map(_fold, [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//club_management//schedules//KO",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{_escape(calendar_name)}",
+        f"REFRESH-INTERVAL;VALUE=DURATION:{REFRESH_INTERVAL}",
+        f"X-PUBLISHED-TTL:{REFRESH_INTERVAL}",
+    ])
+    for schedule in schedules.iterator(chunk_size=FEED_CHUNK_SIZE):
+        summary = f"[{group_names.get(schedule['group_id'], '')}] {schedule['title']}"
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:schedule-{schedule['id']}@{host}",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART:{_utc(schedule['date_time'])}",
+            f"SUMMARY:{_escape(summary)}",
+            f"LOCATION:{_escape(schedule['location'])}",
+        ]
+        if schedule["content"]:
+            lines.append(f"DESCRIPTION:{_escape(schedule['content'])}")
+        lines.append("END:VEVENT")
+        yield "".join(map(_fold, lines))
+    yield _fold("END:VCALENDAR")
+
+
+def _feed_window():
+    today_start = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+    return today_start, today_start - timedelta(days=PAST_DAYS), today_start + timedelta(days=FUTURE_DAYS)
+
+
+def _feed_response(request, groups, calendar_name, filename):
+    """groups: [(id, name, updated_at)]. 변경이 없으면 304, 아니면 .ics 스트리밍."""
+    today_start, since, until = _feed_window()
+    # 기간이 날마다 움직이므로 오늘 날짜도 검증값에 넣는다
+    fingerprint = "|".join(f"{group_id}:{updated_at.timestamp()}" for group_id, _, updated_at in sorted(groups))
+    etag = hashlib.sha1(f"{fingerprint}|{today_start.date().isoformat()}".encode()).hexdigest()
+    last_modified = max([updated_at for _, _, updated_at in groups] + [today_start])
+
+    etag, last_modified = http_validators(etag, last_modified)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        group_names = {group_id: name for group_id, name, _ in groups}
+        schedules = (
+            ActivitySchedule.objects.filter(group_id__in=group_names, date_time__gte=since, date_time__lt=until)
+            .order_by("date_time", "id")
+            .values("id", "group_id", "title", "date_time", "location", "content")
+        )
+        response = streaming_response(
+            request,
+            iter_ics(schedules, group_names, calendar_name, request.get_host()),
+            content_type="text/calendar; charset=utf-8",
+        )
+        response["Content-Disposition"] = f'inline; filename="{filename}"'
+    return with_validators(response, etag, last_modified)
+
+
+def _user_or_404(token):
+    user = user_from_token(token)
+    if user is None:
+        raise Http404("존재하지 않는 캘린더입니다.")
+    return user
+
+
+@require_GET
+@replica_reads
+def my_calendar(request, token):
+    user = _user_or_404(token)
+    leading_ids, joined_ids = my_group_ids(user)
+    groups = list(Group.objects.filter(pk__in=leading_ids + joined_ids).values_list("id", "name", "updated_at"))
+    return _feed_response(request, groups, f"{user.nickname} 님의 모임 일정", "my-schedules.ics")
+
+
+@require_GET
+@replica_reads
+def group_calendar(request, token, group_id):
+    user = _user_or_404(token)
+    if not is_active_member(user, group_id):
+        raise Http404("존재하지 않는 캘린더입니다.")
+    groups = list(Group.objects.filter(pk=group_id).values_list("id", "name", "updated_at"))
+    if not groups:
+        raise Http404("존재하지 않는 캘린더입니다.")
+    return _feed_response(request, groups, groups[0][1], f"group-{group_id}.ics")
@@ -0,0 +1,61 @@
+"""Group.member_count / Group.pending_count 유지 로직.
+
+멤버 수는 목록/상세 페이지마다 GroupMember 를 COUNT 하지 않도록 Group 행에 저장해둔다.
+GroupMember 가 저장/삭제될 때마다(signals.py) 그 모임의 행을 UPDATE 한 번으로 다시 세어 저장한다.
+증감하지 않고 다시 세므로 화면 밖의 변경(admin 수정, 사용자 삭제 CASCADE 등)이 있어도 어긋나지 않고
+0 아래로 내려가지 않는다. 값은 GroupMember 변경과 같은 트랜잭션에서 커밋된다.
+"""
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .group_cache import bump_group_version_on_commit
+from .models import Group, GroupMember
+
+# member_count 에 포함되는 (승인 완료된) 역할
+ACTIVE_ROLES = [
+    GroupMember.MemberRole.LEADER,
+    GroupMember.MemberRole.ADMIN,
+    GroupMember.MemberRole.MEMBER,
+]
+
+
+def _role_count(roles):
+    members = (
+        GroupMember.objects.filter(group=OuterRef("pk"), member_role__in=roles)
+        .order_by().values("group").annotate(count=Count("pk")).values("count")
+    )
+    return Coalesce(Subquery(members), 0)
+
+
+def sync_member_counts(group_id):
+    """모임의 멤버 수 / 가입 대기 수를 GroupMember 에서 다시 세어 저장한다 (UPDATE 한 번)."""
+    Group.objects.filter(pk=group_id).update(
+        member_count=_role_count(ACTIVE_ROLES),
+        pending_count=_role_count([GroupMember.MemberRole.PENDING]),
+        updated_at=timezone.now(),
+    )
+    bump_group_version_on_commit(group_id)
+
+
+def recount_member_counts(group_ids=None):
+    """GroupMember 에서 집계를 다시 계산해 틀어진 값을 고친다. 수정된 Group 수를 반환."""
+    groups = Group.objects.all()
+    if group_ids is not None:
+        groups = groups.filter(pk__in=group_ids)
+
+    actual = groups.annotate(
+        actual_members=Count("groupmember", filter=Q(groupmember__member_role__in=ACTIVE_ROLES)),
+        actual_pending=Count("groupmember", filter=Q(groupmember__member_role=GroupMember.MemberRole.PENDING)),
+    ).values_list("pk", "member_count", "pending_count", "actual_members", "actual_pending")
+
+    now = timezone.now()
+    stale = [
+        Group(pk=pk, member_count=actual_members, pending_count=actual_pending, updated_at=now)
+        for pk, member_count, pending_count, actual_members, actual_pending in actual.iterator()
+        if (member_count, pending_count) != (actual_members, actual_pending)
+    ]
+    Group.objects.bulk_update(stale, ["member_count", "pending_count", "updated_at"], batch_size=500)
+    for group in stale:
+        bump_group_version_on_commit(group.pk)
+    return len(stale)
@@ -0,0 +1,81 @@
+"""마이페이지: 내 모임 목록과 다가오는 일정 피드.
+
+- 내 모임 목록은 사용자별 역할 캐시(membership.get_roles)를 색인으로 써서 모임을 기본키로만 읽는다
+  (모임/멤버 조인 + distinct 두 번 대신 id IN 조회 한 번). 가입/승인/탈퇴 시 그 사용자 색인만 다시 만든다.
+- 다가오는 일정은 모임마다 "오늘부터 UPCOMING_DAYS 일" 의 일정을 모임 버전 캐시에 두고 합친다.
+  캐시에 없는 모임들만 모아 date_time 범위 쿼리 한 번으로 채우므로, 일정이 바뀐 모임의 몫만 다시 읽는다.
+"""
+import heapq
+from datetime import timedelta
+
+from django.utils import timezone
+
+from .counters import ACTIVE_ROLES
+from .group_cache import cached_group_sections
+from .membership import get_roles
+from .models import ActivitySchedule, Group, GroupMember
+
+UPCOMING_DAYS = 30
+FEED_LIMIT = 10
+
+
+def my_group_ids(user):
+    """(리더인 모임 id 목록, 멤버/총무로 참여 중인 모임 id 목록).
+
+    리더 여부는 역할 목록을 따른다 (Group.leader 이면 LEADER 멤버 행이 없어도 LEADER, membership.py).
+    """
+    leading, joined = [], []
+    for group_id, role in get_roles(user).items():
+        if role == GroupMember.MemberRole.LEADER:
+            leading.append(group_id)
+        elif role in ACTIVE_ROLES:
+            joined.append(group_id)
+    return leading, joined
+
+
+def _upcoming_by_group(group_ids, since, until):
+    # 모임 여러 개의 일정 범위를 한 번에 ((group, date_time) 인덱스)
+    schedules = {group_id: [] for group_id in group_ids}
+    rows = (
+        ActivitySchedule.objects.filter(group_id__in=group_ids, date_time__gte=since, date_time__lt=until)
+        .order_by("date_time", "id")
+        .values("id", "group_id", "title", "date_time", "location")
+    )
+    for row in rows:
+        schedules[row["group_id"]].append(row)
+    return schedules
+
+
+def upcoming_schedules(group_names, limit=FEED_LIMIT):
+    """group_names({group_id: 모임 이름}) 모임들의 지금 이후 일정을 날짜순으로 limit 개."""
+    if not group_names:
+        return []
+    now = timezone.localtime()
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    # 날짜가 바뀌면 새 키로 (지난 일정은 아래에서 거른다)
+    sections = cached_group_sections(
+        list(group_names),
+        f"upcoming:{today_start.date().isoformat()}",
+        lambda missing: _upcoming_by_group(missing, today_start, today_start + timedelta(days=UPCOMING_DAYS)),
+    )
+    merged = heapq.merge(*sections.values(), key=lambda row: (row["date_time"], row["id"]))
+    feed = []
+    for row in merged:
+        if row["date_time"] < now:
+            continue
+        feed.append({**row, "group_name": group_names[row["group_id"]]})
+        if len(feed) == limit:
+            break
+    return feed
+
+
+def load_my_page(user):
+    leading_ids, joined_ids = my_group_ids(user)
+    group_ids = leading_ids + joined_ids
+    groups = list(Group.objects.filter(pk__in=group_ids).order_by("-created_at")) if group_ids else []
+    leading_set = set(leading_ids)
+    return {
+        "leading_groups": [group for group in groups if group.id in leading_set],
+        "joined_groups": [group for group in groups if group.id not in leading_set],
+        "upcoming_schedules": upcoming_schedules({group.id: group.name for group in groups}),
+    }
@@ -0,0 +1,88 @@
+"""discovery 필터 사이드바의 카테고리/지역별 모임 수.
+
+(카테고리, 지역) 쌍으로 한 번만 GROUP BY 해두면, 선택된 필터 조합에 맞는
+카테고리 수 / 지역 수를 추가 쿼리 없이 파이썬에서 계산할 수 있다.
+
+- 검색어가 없을 때의 집계는 "버전이 들어간 키" 로 캐시에 두고(cache_versions.py), 모임 생성/상태 변경/삭제가
+  커밋되면 버전을 올려 다음 읽기에서 다시 집계한다. 캐시된 dict 를 읽고-고치고-쓰지 않으므로
+  동시에 바뀐 모임의 증감이 사라지지 않는다. (다른 워커에도 보여야 하므로 공유 캐시가 있을 때만. 없으면 매번 집계)
+- 검색어가 있으면 검색 결과에 대해 한 번 집계한다.
+"""
+from collections import Counter
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+
+from .cache_versions import bump_version, get_version, shared_cache_enabled
+from .models import Group
+
+# discovery 에 노출되는 모임 상태
+VISIBLE_STATUSES = [Group.GroupStatus.RECRUITING, Group.GroupStatus.OPERATING]
+
+FACETS_CACHE_KEY = "discovery_facets"
+FACETS_VERSION_KEY = "discovery_facets_version"
+
+FACETS_TIMEOUT = 60 * 10
+
+
+def facet_rows(queryset):
+    """queryset 을 (category, region) 별로 센다. {(category, region): count}"""
+    rows = queryset.order_by().values("category", "region").annotate(count=Count("id"))
+    return {(row["category"], row["region"]): row["count"] for row in rows}
+
+
+def visible_facet_rows():
+    """검색어 없는 discovery 의 집계 (캐시)."""
+    if not shared_cache_enabled():
+        return facet_rows(Group.objects.filter(status__in=VISIBLE_STATUSES))
+    key = f"{FACETS_CACHE_KEY}:{get_version(FACETS_VERSION_KEY)}"
+    rows = cache.get(key)
+    if rows is None:
+        rows = facet_rows(Group.objects.filter(status__in=VISIBLE_STATUSES))
+        cache.set(key, rows, FACETS_TIMEOUT)
+    return rows
+
+
+def _region_matches(region, selected_region):
+    # discovery 의 region__icontains 필터와 같은 기준
+    return selected_region.lower() in region.lower()
+
+
+def build_facets(rows, selected_category="", selected_region=""):
+    """필터 옵션별 모임 수.
+
+    카테고리 수는 지역 필터만, 지역 수는 카테고리 필터만 적용해서 센다.
+    (다른 옵션을 골랐을 때 몇 개가 나오는지 보여주기 위함)
+    """
+    category_counts = Counter()
+    region_counts = Counter()
+    for (category, region), count in rows.items():
+        if not selected_region or _region_matches(region, selected_region):
+            category_counts[category] += count
+        if not selected_category or category == selected_category:
+            region_counts[region] += count
+
+    categories = [
+        (code, label, category_counts.get(code, 0))
+        for code, label in Group.GroupCategory.choices
+    ]
+    regions = sorted(region_counts.items())
+    return categories, regions
+
+
+def facet_key(status, category, region):
+    """모임 하나가 집계에 기여하는 키. 노출되지 않는 상태면 None."""
+    if status not in VISIBLE_STATUSES:
+        return None
+    return (category, region)
+
+
+def apply_facet_change(before, after):
+    """모임 하나의 변경(생성/상태·카테고리·지역 변경/삭제)이 집계를 바꾸면 커밋 후 캐시된 집계를 버린다.
+
+    before/after 는 facet_key() 값.
+    """
+    if before == after:
+        return
+    transaction.on_commit(lambda: bump_version(FACETS_VERSION_KEY))
@@ -0,0 +1,117 @@
+"""모임 단위 버전 캐시.
+
+모임마다 버전 번호를 캐시에 두고, 상세 페이지의 무거운 부분(소개/탭 데이터)은
+"모임 id + 버전" 을 키로 캐시한다. 모임 관련 데이터가 바뀌면 버전만 올리면 되므로
+이전 캐시를 지울 필요가 없고, 쓰기 직후부터 바로 새 데이터가 보인다.
+
+버전은 쓰기 트랜잭션이 커밋된 뒤에 올린다 (signals.py / transaction.on_commit).
+캐시와 별개로 DB 의 Group.updated_at 에도 마지막 변경 시각을 남긴다 (JSON API 의 ETag/Last-Modified 용).
+
+공유 캐시가 없으면(cache_versions.shared_cache_enabled) 섹션을 캐시하지 않고 매번 만든다.
+
+a 로 시작하는 함수는 async 뷰용 (cache.aget 등 비동기 캐시 API 사용).
+"""
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from .cache_versions import aget_version, bump_version, get_version, shared_cache_enabled
+from .models import Group
+from .routers import primary_reads
+
+VERSION_KEY_PREFIX = "group_version"
+SECTION_KEY_PREFIX = "group_section"
+
+# 섹션 캐시 유지 시간 (버전이 바뀌면 어차피 새 키를 쓰므로 메모리 회수용)
+SECTION_TIMEOUT = 60 * 60
+
+
+def _version_key(group_id):
+    return f"{VERSION_KEY_PREFIX}:{group_id}"
+
+
+def get_group_version(group_id):
+    return get_version(_version_key(group_id))
+
+
+async def aget_group_version(group_id):
+    return await aget_version(_version_key(group_id))
+
+
+def bump_group_version(group_id):
+    bump_version(_version_key(group_id))
+
+
+def bump_group_version_on_commit(group_id):
+    """현재 트랜잭션이 커밋된 뒤에 버전을 올린다. (트랜잭션 밖이면 바로)"""
+    transaction.on_commit(lambda: bump_group_version(group_id))
+
+
+def mark_group_changed(group_id):
+    """모임의 하위 데이터(멤버/일정/게시글/거래 등)가 바뀌었음을 기록한다.
+
+    같은 트랜잭션에서 Group.updated_at 을 갱신하고, 커밋 후 캐시 버전을 올린다.
+    """
+    Group.objects.filter(pk=group_id).update(updated_at=timezone.now())
+    bump_group_version_on_commit(group_id)
+
+
+def _section_key(group_id, version, section):
+    return f"{SECTION_KEY_PREFIX}:{group_id}:{version}:{section}"
+
+
+def cached_group_section(group_id, section, builder):
+    """group_id 의 현재 버전으로 section 을 캐시에서 꺼내고, 없으면 builder() 로 만들어 저장한다."""
+    if not shared_cache_enabled():
+        return builder()
+    key = _section_key(group_id, get_group_version(group_id), section)
+    data = cache.get(key)
+    if data is None:
+        # 복제 지연으로 예전 데이터가 새 버전 키에 저장되지 않도록 primary 에서 만든다
+        with primary_reads():
+            data = builder()
+        cache.set(key, data, SECTION_TIMEOUT)
+    return data
+
+
+async def acached_group_section(group_id, section, builder, version=None):
+    """cached_group_section 의 async 판. builder 는 코루틴 함수.
+
+    버전을 이미 알고 있으면(다른 조회와 함께 가져온 경우) version 으로 넘긴다.
+    """
+    if not shared_cache_enabled():
+        return await builder()
+    if version is None:
+        version = await aget_group_version(group_id)
+    key = _section_key(group_id, version, section)
+    data = await cache.aget(key)
+    if data is None:
+        with primary_reads():
+            data = await builder()
+        await cache.aset(key, data, SECTION_TIMEOUT)
+    return data
+
+
+def cached_group_sections(group_ids, section, build_many):
+    """여러 모임의 같은 section 을 한꺼번에 꺼낸다. {group_id: data}
+
+    캐시에 없는(버전이 바뀐) 모임만 모아 build_many(missing_ids) -> {group_id: data} 로 한 번에 만든다.
+    """
+    if not shared_cache_enabled():
+        return build_many(list(group_ids))
+    version_keys = {group_id: _version_key(group_id) for group_id in group_ids}
+    found_versions = cache.get_many(version_keys.values())
+    keys = {
+        group_id: _section_key(group_id, found_versions.get(key) or get_version(key), section)
+        for group_id, key in version_keys.items()
+    }
+    found = cache.get_many(keys.values())
+    sections = {group_id: found[key] for group_id, key in keys.items() if key in found}
+
+    missing = [group_id for group_id in group_ids if group_id not in sections]
+    if missing:
+        with primary_reads():
+            built = build_many(missing)
+        cache.set_many({keys[group_id]: built[group_id] for group_id in missing}, SECTION_TIMEOUT)
+        sections.update(built)
+    return sections
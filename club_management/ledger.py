@@ -0,0 +1,160 @@
+"""재정 장부 (GroupLedger 잔액 스냅샷 + MonthlyLedger 월별 집계).
+
+잔액/월별 합계를 매번 FinancialTransaction 전체에서 SUM 하지 않도록
+거래가 기록될 때 같은 트랜잭션 안에서 F() 로 누적해둔다.
+값이 틀어졌는지는 verify_ledger 명령으로 원본 거래에서 다시 계산해 확인/복구한다.
+"""
+from collections import defaultdict
+
+from django.db.models import Case, Count, F, IntegerField, Max, Sum, Value, When
+from django.db.models.functions import Coalesce, Greatest, TruncMonth
+
+from .group_cache import mark_group_changed
+from .models import FinancialTransaction, GroupLedger, MonthlyLedger
+
+# 재정 탭에 보여줄 최근 월 수
+MONTHLY_SUMMARY_MONTHS = 12
+
+
+def _split_amount(amount):
+    """(수입, 지출) — 지출은 양수 크기로 저장한다."""
+    return (amount, 0) if amount >= 0 else (0, -amount)
+
+
+def record_transactions(transactions):
+    """새로 저장된 거래들을 잔액 스냅샷과 월별 집계에 반영한다.
+
+    반드시 거래를 저장한 것과 같은 transaction.atomic() 안에서 호출해야 한다.
+    모임 변경 기록(mark_group_changed)은 거래 저장 시그널이 한다. 시그널이 없는 bulk_create 는 호출한 쪽이.
+    """
+    totals = defaultdict(lambda: {"amount": 0, "count": 0, "last_date": None})
+    months = defaultdict(lambda: {"income": 0, "expense": 0, "count": 0})
+
+    for tx in transactions:
+        total = totals[tx.group_id]
+        total["amount"] += tx.amount
+        total["count"] += 1
+        if total["last_date"] is None or tx.transaction_date > total["last_date"]:
+            total["last_date"] = tx.transaction_date
+
+        income, expense = _split_amount(tx.amount)
+        month = months[(tx.group_id, tx.transaction_date.replace(day=1))]
+        month["income"] += income
+        month["expense"] += expense
+        month["count"] += 1
+
+    for group_id, total in totals.items():
+        GroupLedger.objects.get_or_create(group_id=group_id)
+        GroupLedger.objects.filter(group_id=group_id).update(
+            balance=F("balance") + total["amount"],
+            transaction_count=F("transaction_count") + total["count"],
+            last_transaction_date=Greatest(
+                Coalesce("last_transaction_date", Value(total["last_date"])),
+                Value(total["last_date"]),
+            ),
+        )
+
+    for (group_id, month_start), month in months.items():
+        MonthlyLedger.objects.get_or_create(group_id=group_id, month=month_start)
+        MonthlyLedger.objects.filter(group_id=group_id, month=month_start).update(
+            income=F("income") + month["income"],
+            expense=F("expense") + month["expense"],
+            transaction_count=F("transaction_count") + month["count"],
+        )
+
+
+def record_transaction(transaction):
+    record_transactions([transaction])
+
+
+def get_ledger(group):
+    """모임의 잔액 스냅샷. 거래가 한 번도 없었으면 저장되지 않은 빈 스냅샷을 돌려준다."""
+    return GroupLedger.objects.filter(group=group).first() or GroupLedger(group=group)
+
+
+def recent_monthly_ledgers(group, months=MONTHLY_SUMMARY_MONTHS):
+    return list(MonthlyLedger.objects.filter(group=group).order_by("-month")[:months])
+
+
+def _derive_from_transactions(group_ids=None):
+    """원본 거래에서 스냅샷/월별 집계를 다시 계산한다."""
+    transactions = FinancialTransaction.objects.order_by()
+    if group_ids is not None:
+        transactions = transactions.filter(group_id__in=group_ids)
+
+    snapshots = {
+        row["group_id"]: (row["balance"], row["count"], row["last_date"])
+        for row in transactions.values("group_id").annotate(
+            balance=Sum("amount"), count=Count("id"), last_date=Max("transaction_date"),
+        )
+    }
+
+    income = Case(When(amount__gte=0, then=F("amount")), default=Value(0), output_field=IntegerField())
+    expense = Case(When(amount__lt=0, then=-F("amount")), default=Value(0), output_field=IntegerField())
+    monthly = {
+        (row["group_id"], row["month"]): (row["income"], row["expense"], row["count"])
+        for row in transactions.annotate(month=TruncMonth("transaction_date"))
+        .values("group_id", "month")
+        .annotate(income=Sum(income), expense=Sum(expense), count=Count("id"))
+    }
+    return snapshots, monthly
+
+
+def verify_ledger(group_ids=None, fix=False):
+    """저장된 장부를 원본 거래와 비교한다. 불일치 목록을 돌려주고, fix=True 면 원본 기준으로 고친다."""
+    snapshots, monthly = _derive_from_transactions(group_ids)
+
+    stored_ledgers = GroupLedger.objects.all()
+    stored_months = MonthlyLedger.objects.all()
+    if group_ids is not None:
+        stored_ledgers = stored_ledgers.filter(group_id__in=group_ids)
+        stored_months = stored_months.filter(group_id__in=group_ids)
+
+    stored_snapshots = {
+        ledger.group_id: (ledger.balance, ledger.transaction_count, ledger.last_transaction_date)
+        for ledger in stored_ledgers
+    }
+    stored_monthly = {
+        (row.group_id, row.month): (row.income, row.expense, row.transaction_count)
+        for row in stored_months
+    }
+
+    empty_snapshot = (0, 0, None)
+    mismatches = []
+    for group_id in snapshots.keys() | stored_snapshots.keys():
+        expected = snapshots.get(group_id, empty_snapshot)
+        actual = stored_snapshots.get(group_id, empty_snapshot)
+        if expected != actual:
+            mismatches.append(("balance", group_id, None, expected, actual))
+
+    empty_month = (0, 0, 0)
+    for key in monthly.keys() | stored_monthly.keys():
+        expected = monthly.get(key, empty_month)
+        actual = stored_monthly.get(key, empty_month)
+        if expected != actual:
+            mismatches.append(("monthly", key[0], key[1], expected, actual))
+
+    if fix and mismatches:
+        _rewrite(snapshots, monthly, stored_ledgers, stored_months)
+        for group_id in {mismatch[1] for mismatch in mismatches}:
+            mark_group_changed(group_id)
+    return mismatches
+
+
+def _rewrite(snapshots, monthly, stored_ledgers, stored_months):
+    stored_ledgers.delete()
+    stored_months.delete()
+    GroupLedger.objects.bulk_create(
+        [
+            GroupLedger(group_id=group_id, balance=balance, transaction_count=count, last_transaction_date=last_date)
+            for group_id, (balance, count, last_date) in snapshots.items()
+        ],
+        batch_size=500,
+    )
+    MonthlyLedger.objects.bulk_create(
+        [
+            MonthlyLedger(group_id=group_id, month=month, income=income, expense=expense, transaction_count=count)
+            for (group_id, month), (income, expense, count) in monthly.items()
+        ],
+        batch_size=500,
+    )
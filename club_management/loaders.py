@@ -0,0 +1,272 @@
+"""모임 상세 페이지 데이터 로더.
+
+상세 페이지 첫 응답은 소개 탭(모임 정보 + 리더)만 담고, 나머지 탭은
+/group/<id>/tab/<name>/ 프래그먼트로 필요할 때 따로 불러온다.
+각 로더는 데이터 양과 상관없이 고정된 개수의 쿼리만 사용한다.
+
+    상세 페이지: Group(+leader) 1회 (+ 로그인 시 내 역할 목록 1회, 캐시되면 0회)
+    각 탭     : 위 쿼리 + 탭 페이지 조회(개수 1회 + 목록 1회, 재정 탭은 장부/월별 집계 2회 추가)
+
+사용자와 무관한 부분은 모임 버전 캐시(group_cache.py)에 저장되므로,
+캐시가 살아 있는 동안에는 로그인 사용자의 역할 조회만 남는다.
+상세/탭 뷰는 async 뷰이고, 독립적인 조회를 함께 기다리는 async 판은 async_loaders.py 에 있다.
+"""
+from django.core.paginator import Paginator
+from django.db.models import Count, Q
+from django.shortcuts import get_object_or_404
+
+from .counters import ACTIVE_ROLES
+from .group_cache import cached_group_section
+from .ledger import get_ledger, recent_monthly_ledgers
+from .membership import role_in
+from .models import (
+    ActivitySchedule,
+    BoardPost,
+    FinancialTransaction,
+    Group,
+    GroupMember,
+    RSVP,
+)
+
+DETAIL_QUERY_COUNT = 1
+
+TAB_PAGE_SIZE = 20
+
+# 멤버 탭에서 리더에게 한 번에 보여줄 가입 대기 신청 수
+PENDING_LIST_LIMIT = 50
+
+MEMBER_ROLE_LABELS = {
+    GroupMember.MemberRole.LEADER: "리더",
+    GroupMember.MemberRole.ADMIN: "총무",
+    GroupMember.MemberRole.MEMBER: "일반 멤버",
+    GroupMember.MemberRole.PENDING: "가입 대기 중",
+}
+
+
+def get_member_role(group_id, user):
+    """user 의 모임 내 역할 (비회원/비로그인이면 None). 사용자별 역할 캐시에서 읽는다 (membership.py)."""
+    return role_in(user, group_id)
+
+
+def role_flags(role):
+    return {
+        "is_member": role in ACTIVE_ROLES,
+        "is_leader": role == GroupMember.MemberRole.LEADER,
+        "is_treasurer": role == GroupMember.MemberRole.ADMIN,
+    }
+
+
+def _club_summary(group):
+    if group.leader:
+        leader_nickname = group.leader.nickname
+        leader_id = group.leader.email
+    else:
+        leader_nickname = "리더 미지정"
+        leader_id = "-"
+
+    return {
+        "id": group.id,
+        "name": group.name,
+        "category": group.get_category_display(),
+        "region": group.region,
+        "members": group.member_count,
+        "pending_count": group.pending_count,
+        "description": group.description,
+        "leader_nickname": leader_nickname,
+        "leader_id": leader_id,
+    }
+
+
+def _page_info(page):
+    """Paginator Page 중 템플릿이 쓰는 값만 캐시 가능한 dict 로 옮긴다."""
+    return {
+        "number": page.number,
+        "has_previous": page.has_previous(),
+        "has_next": page.has_next(),
+        "has_other_pages": page.has_other_pages(),
+        "previous_page_number": page.number - 1,
+        "next_page_number": page.number + 1,
+        "paginator": {"num_pages": page.paginator.num_pages},
+    }
+
+
+def parse_page_number(raw):
+    try:
+        return max(1, int(raw))
+    except (TypeError, ValueError):
+        return 1
+
+
+def load_group(group_id):
+    return get_object_or_404(Group.objects.select_related("leader"), pk=group_id)
+
+
+def load_club_summary(group_id):
+    return _club_summary(load_group(group_id))
+
+
+def load_group_detail(group_id, user):
+    """상세 페이지(소개 탭) 컨텍스트. (모임이 없으면 404)
+
+    모임 정보는 모임 버전 캐시에서 꺼내고, 사용자별 권한만 매번 조회한다.
+    """
+    club = cached_group_section(group_id, "summary", lambda: load_club_summary(group_id))
+    return {
+        "club": club,
+        **role_flags(get_member_role(group_id, user)),
+    }
+
+
+def _load_schedule_tab(group, page_number, flags):
+    # 일정별 참석 인원을 일정 목록과 함께 한 번에 집계
+    schedules = (
+        ActivitySchedule.objects.filter(group=group)
+        .annotate(
+            attendees=Count(
+                "rsvp",
+                filter=Q(rsvp__attendance_status=RSVP.AttendanceStatus.ATTENDING),
+            )
+        )
+        .order_by("date_time", "id")
+    )
+    page = Paginator(schedules, TAB_PAGE_SIZE).get_page(page_number)
+    activities = [
+        {
+            "id": s.id,
+            "title": s.title,
+            "date": s.date_time.strftime("%m월 %d일 %H:%M"),
+            "fee": f"{s.participation_fee:,}원",
+            "status": "예정",
+            "attendees": s.attendees,
+        }
+        for s in page
+    ]
+    return {"page": page, "activities": activities}
+
+
+def _load_board_tab(group, page_number, flags):
+    posts_qs = (
+        BoardPost.objects.filter(group=group)
+        .select_related("author")
+        .order_by("-is_notice", "-created_at", "-id")
+    )
+    page = Paginator(posts_qs, TAB_PAGE_SIZE).get_page(page_number)
+    board_posts = [
+        {
+            "id": post.id,
+            "title": post.title,
+            "author": post.author.nickname if post.author else "(탈퇴 회원)",
+            "date": post.created_at.strftime("%Y-%m-%d %H:%M"),
+            "views": post.views,
+            "type": "공지" if post.is_notice else "일반",
+        }
+        for post in page
+    ]
+    return {"page": page, "board_posts": board_posts}
+
+
+def _load_members_tab(group, page_number, flags):
+    members_qs = (
+        GroupMember.objects.filter(group=group, member_role__in=ACTIVE_ROLES)
+        .select_related("user")
+        .order_by("joined_date", "id")
+    )
+    page = Paginator(members_qs, TAB_PAGE_SIZE).get_page(page_number)
+    members_detail = [
+        {
+            "nickname": gm.user.nickname if gm.user else "(탈퇴 회원)",
+            "role": MEMBER_ROLE_LABELS.get(gm.member_role, gm.get_member_role_display()),
+        }
+        for gm in page
+    ]
+
+    # 가입 대기 목록은 리더에게만, 오래된 신청부터 일부만 보여준다
+    pending_members = []
+    if flags["is_leader"] and group.pending_count:
+        pending_qs = (
+            GroupMember.objects.filter(group=group, member_role=GroupMember.MemberRole.PENDING)
+            .select_related("user")
+            .order_by("joined_date", "id")[:PENDING_LIST_LIMIT]
+        )
+        pending_members = [
+            {
+                "id": gm.id,
+                "nickname": gm.user.nickname if gm.user else "(탈퇴 회원)",
+                "joined_date": gm.joined_date,
+            }
+            for gm in pending_qs
+        ]
+    return {"page": page, "members_detail": members_detail, "pending_members": pending_members}
+
+
+def _load_finance_tab(group, page_number, flags):
+    # 잔액/월별 합계는 장부 스냅샷에서 바로 읽고, 거래 내역은 페이지 단위로만 조회
+    ledger = get_ledger(group)
+    monthly = [
+        {
+            "month": row.month.strftime("%Y-%m"),
+            "income": row.income,
+            "expense": row.expense,
+            "net": row.net,
+        }
+        for row in recent_monthly_ledgers(group)
+    ]
+
+    page = Paginator(
+        FinancialTransaction.objects.filter(group=group)
+        .select_related("user")
+        .order_by("-transaction_date", "-id"),
+        TAB_PAGE_SIZE,
+    ).get_page(page_number)
+    transactions = [
+        {
+            "date": tx.transaction_date.strftime("%Y-%m-%d"),
+            "amount": tx.amount,
+            "description": tx.description,
+            "user_nickname": tx.user.nickname if tx.user else "(시스템)",
+        }
+        for tx in page
+    ]
+    finance = {
+        "current_balance": ledger.balance,
+        "last_updated": (
+            ledger.last_transaction_date.strftime("%Y-%m-%d") if ledger.last_transaction_date else "-"
+        ),
+        "dues_status": [],
+        "monthly": monthly,
+        "transactions": transactions,
+    }
+    return {"page": page, "finance": finance}
+
+
+TAB_LOADERS = {
+    "schedule": _load_schedule_tab,
+    "board": _load_board_tab,
+    "members": _load_members_tab,
+    "finance": _load_finance_tab,
+}
+
+
+def tab_section_name(tab_name, page_number, flags):
+    """탭 데이터는 (탭, 페이지, 리더 여부) 별로 모임 버전 캐시에 저장된다."""
+    return f"tab:{tab_name}:{page_number}:{int(flags['is_leader'])}"
+
+
+def build_group_tab(group_id, tab_name, page_number, flags):
+    """캐시에 저장할 탭 데이터 (사용자와 무관한 부분)."""
+    group = load_group(group_id)
+    data = TAB_LOADERS[tab_name](group, page_number, flags)
+    data["page"] = _page_info(data["page"])
+    return {"club": _club_summary(group), **data}
+
+
+def load_group_tab(group_id, tab_name, user, page_number=1):
+    """탭 프래그먼트 컨텍스트. tab_name 은 TAB_LOADERS 의 키여야 한다."""
+    flags = role_flags(get_member_role(group_id, user))
+    page_number = parse_page_number(page_number)
+    section = tab_section_name(tab_name, page_number, flags)
+    return {
+        "tab_name": tab_name,
+        **flags,
+        **cached_group_section(group_id, section, lambda: build_group_tab(group_id, tab_name, page_number, flags)),
+    }
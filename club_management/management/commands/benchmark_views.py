@@ -0,0 +1,74 @@
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from club_management.benchmarks import (
+    DEFAULT_TOLERANCE,
+    PERCENTILES,
+    SCENARIOS,
+    BenchmarkFixtures,
+    BenchmarkRunner,
+    compare,
+)
+
+
+class Command(BaseCommand):
+    help = "주요 화면의 응답 시간(p50/p95/p99)과 쿼리 수를 측정하고 기준선과 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("scenarios", nargs="*", help=f"생략 시 전체 ({', '.join(SCENARIOS)})")
+        parser.add_argument("--iterations", type=int, default=30)
+        parser.add_argument("--warmup", type=int, default=3)
+        parser.add_argument("--cold-cache", action="store_true", help="요청마다 캐시를 비웁니다.")
+        parser.add_argument("--save-baseline", metavar="PATH", help="결과를 기준선 JSON 으로 저장")
+        parser.add_argument("--baseline", metavar="PATH", help="이 기준선과 비교")
+        parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="p95 허용 증가율 (기본 0.2)")
+        parser.add_argument("--fail-on-regression", action="store_true")
+
+    def handle(self, *args, **options):
+        unknown = set(options["scenarios"]) - SCENARIOS.keys()
+        if unknown:
+            raise CommandError(f"알 수 없는 시나리오: {', '.join(sorted(unknown))}")
+        try:
+            fixtures = BenchmarkFixtures()
+        except ValueError as exc:
+            raise CommandError(str(exc))
+        runner = BenchmarkRunner(
+            fixtures,
+            iterations=options["iterations"],
+            warmup=options["warmup"],
+            cold_cache=options["cold_cache"],
+        )
+        # 테스트 클라이언트의 호스트(testserver) 허용
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            results = runner.run(options["scenarios"] or None)
+
+        baseline = None
+        if options["baseline"]:
+            baseline = json.loads(Path(options["baseline"]).read_text(encoding="utf-8"))["scenarios"]
+
+        header = f"{'scenario':<22}" + "".join(f"{f'p{pct}(ms)':>11}" for pct in PERCENTILES) + f"{'queries':>9}"
+        self.stdout.write(header)
+        for name, result in results.items():
+            line = f"{name:<22}" + "".join(f"{result[f'p{pct}']:>11.1f}" for pct in PERCENTILES) + f"{result['queries']:>9}"
+            if baseline and name in baseline:
+                base = baseline[name]
+                line += f"   (기준 p95 {base['p95']:.1f}ms / {base['queries']} queries)"
+            self.stdout.write(line)
+
+        if options["save_baseline"]:
+            payload = {"iterations": options["iterations"], "scenarios": results}
+            Path(options["save_baseline"]).write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+            self.stdout.write(self.style.SUCCESS(f"기준선 저장: {options['save_baseline']}"))
+
+        if baseline:
+            regressions = compare(results, baseline, options["tolerance"])
+            for name, reason in regressions:
+                self.stdout.write(self.style.WARNING(f"회귀: {name} — {reason}"))
+            if not regressions:
+                self.stdout.write(self.style.SUCCESS("기준선 대비 회귀 없음"))
+            elif options["fail_on_regression"]:
+                raise CommandError(f"회귀 {len(regressions)}건")
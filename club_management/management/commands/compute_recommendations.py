@@ -0,0 +1,23 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from club_management.recommendations import RECOMMENDATION_COUNT, WRITE_BATCH_SIZE, compute_recommendations
+
+
+class Command(BaseCommand):
+    help = "사용자별 추천 모임(discovery '회원님을 위한 모임')을 다시 계산해 저장합니다. (cron 등으로 주기 실행)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=RECOMMENDATION_COUNT, help="사용자별 저장할 추천 수")
+        parser.add_argument("--batch-size", type=int, default=WRITE_BATCH_SIZE, help="한 트랜잭션에서 다시 쓸 사용자 수")
+
+    def handle(self, *args, **options):
+        if options["count"] < 1 or options["batch_size"] < 1:
+            raise CommandError("--count 와 --batch-size 는 1 이상이어야 합니다.")
+
+        start = time.monotonic()
+        users, saved = compute_recommendations(count=options["count"], batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(
+            f"사용자 {users:,}명의 추천 {saved:,}건 저장 ({time.monotonic() - start:.1f}초)"
+        ))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from club_management.view_counter import flush_view_counts
+
+
+class Command(BaseCommand):
+    help = "캐시에 쌓인 게시글 조회수를 DB 에 반영합니다. (공유 캐시 사용 시 cron 등으로 주기 실행)"
+
+    def handle(self, *args, **options):
+        flushed = flush_view_counts()
+        self.stdout.write(self.style.SUCCESS(f"조회수 {flushed}회를 반영했습니다."))
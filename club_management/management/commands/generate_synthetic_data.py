@@ -0,0 +1,35 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from club_management.synthetic import SyntheticDataGenerator, SyntheticScale
+
+
+class Command(BaseCommand):
+    help = "성능 측정용 합성 데이터를 대량으로 생성합니다. (기존 데이터는 그대로 두고 추가)"
+
+    def add_arguments(self, parser):
+        defaults = SyntheticScale()
+        for name in ["users", "groups", "members_per_group", "schedules", "rsvps", "posts", "transactions"]:
+            parser.add_argument(
+                f"--{name.replace('_', '-')}", dest=name, type=int, default=getattr(defaults, name),
+                help=f"기본값 {getattr(defaults, name):,}",
+            )
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument("--seed", type=int, help="같은 seed 면 같은 데이터 (다시 넣으면 이메일이 겹침)")
+
+    def handle(self, *args, **options):
+        scale = SyntheticScale(**{
+            name: options[name]
+            for name in ["users", "groups", "members_per_group", "schedules", "rsvps", "posts", "transactions"]
+        })
+        if scale.users < 1 or scale.groups < 1:
+            raise CommandError("--users 와 --groups 는 1 이상이어야 합니다.")
+
+        start = time.monotonic()
+        generator = SyntheticDataGenerator(
+            scale, batch_size=options["batch_size"], seed=options["seed"], log=self.stdout.write,
+        )
+        counts = generator.run()
+        total = sum(counts.values())
+        self.stdout.write(self.style.SUCCESS(f"{total:,}행 생성 ({time.monotonic() - start:.1f}초)"))
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from club_management.bank_import import ENCODINGS, StatementFormatError, import_statement
+from club_management.models import Group, User
+
+
+class Command(BaseCommand):
+    help = "은행 거래 내역 CSV 를 모임 재정 기록으로 가져옵니다. (이미 가져온 거래는 건너뜀)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("group_id", type=int)
+        parser.add_argument("csv_path")
+        parser.add_argument("--encoding", choices=list(ENCODINGS), default="utf-8")
+        parser.add_argument("--user", help="기록할 사용자 이메일 (생략 시 비움)")
+        parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 검증만 합니다.")
+
+    def handle(self, *args, **options):
+        try:
+            group = Group.objects.get(pk=options["group_id"])
+        except Group.DoesNotExist:
+            raise CommandError(f"모임 {options['group_id']} 이(가) 없습니다.")
+
+        user = None
+        if options["user"]:
+            user = User.objects.filter(email=options["user"]).first()
+            if user is None:
+                raise CommandError(f"사용자 {options['user']} 이(가) 없습니다.")
+
+        try:
+            with open(options["csv_path"], encoding=ENCODINGS[options["encoding"]], newline="") as lines:
+                result = import_statement(group, lines, user=user, dry_run=options["dry_run"])
+        except (OSError, StatementFormatError, UnicodeDecodeError) as exc:
+            raise CommandError(str(exc))
+
+        for line_number, message in result.errors:
+            self.stdout.write(f"{line_number}번째 줄: {message}")
+        summary = f"추가 {result.created}건 / 중복 {result.duplicates}건 / 오류 {result.error_count}건"
+        if options["dry_run"]:
+            summary = "[검증만 실행] " + summary
+        style = self.style.WARNING if result.error_count else self.style.SUCCESS
+        self.stdout.write(style(summary))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from club_management.counters import recount_member_counts
+
+
+class Command(BaseCommand):
+    help = "GroupMember 를 다시 집계해 Group.member_count / pending_count 를 복구합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("group_ids", nargs="*", type=int, help="특정 모임만 다시 집계 (생략 시 전체)")
+
+    def handle(self, *args, **options):
+        group_ids = options["group_ids"] or None
+        with transaction.atomic():
+            fixed = recount_member_counts(group_ids)
+        self.stdout.write(self.style.SUCCESS(f"멤버 수가 틀어진 모임 {fixed}개를 수정했습니다."))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from club_management.ledger import verify_ledger
+
+
+class Command(BaseCommand):
+    help = "재정 장부(잔액 스냅샷/월별 집계)를 원본 거래 내역에서 다시 계산해 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("group_ids", nargs="*", type=int, help="특정 모임만 검사 (생략 시 전체)")
+        parser.add_argument("--fix", action="store_true", help="불일치가 있으면 원본 거래 기준으로 장부를 다시 만듭니다.")
+
+    def handle(self, *args, **options):
+        group_ids = options["group_ids"] or None
+        with transaction.atomic():
+            mismatches = verify_ledger(group_ids, fix=options["fix"])
+
+        for kind, group_id, month, expected, actual in mismatches:
+            label = f"모임 {group_id}" + (f" {month:%Y-%m}" if month else "")
+            self.stdout.write(f"[{kind}] {label}: 기대값 {expected} / 저장값 {actual}")
+
+        if not mismatches:
+            self.stdout.write(self.style.SUCCESS("장부가 원본 거래 내역과 일치합니다."))
+        elif options["fix"]:
+            self.stdout.write(self.style.SUCCESS(f"불일치 {len(mismatches)}건을 원본 기준으로 수정했습니다."))
+        else:
+            self.stdout.write(self.style.WARNING(f"불일치 {len(mismatches)}건 (--fix 로 수정)"))
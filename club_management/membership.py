@@ -0,0 +1,171 @@
+"""사용자의 모임 역할 조회 (모든 모임 화면이 함께 쓴다).
+
+로그인 사용자가 속한 모든 모임의 {group_id: member_role} 를 쿼리 한 번으로 읽어
+- 요청 안에서는 user 객체에 (요청마다 새로 읽히는 객체이므로 요청 범위)
+- 요청 사이에는 "사용자 id + 버전" 키로 캐시에 둔다 (cache_versions.py, 공유 캐시가 있을 때만)
+
+리더는 예전처럼 Group.leader 가 기준이다. LEADER GroupMember 행이 없는 모임(행이 생기기 전 데이터, admin 에서
+리더를 바꾼 모임)도 Group.leader 이면 LEADER 로 본다. (GroupMember 와 UNION ALL 한 쿼리 한 번)
+
+멤버십이 바뀌면(가입 신청/승인/거절/모임 생성·삭제/리더 변경) 커밋 후 사용자 버전을 올린다.
+GroupMember 저장/삭제는 signals.py 가 membership_changed 로, 시그널이 없는 bulk_update 는
+호출한 쪽이 sync_member_counts / forget_roles 를 부른다.
+"""
+import contextvars
+from contextlib import contextmanager
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import CharField, Value
+
+from .cache_versions import aget_version, bump_version, get_version, shared_cache_enabled
+from .counters import ACTIVE_ROLES, sync_member_counts
+from .models import Group, GroupMember
+from .routers import primary_reads
+
+VERSION_KEY_PREFIX = "member_roles_version"
+ROLES_KEY_PREFIX = "member_roles"
+
+ROLES_TIMEOUT = 60 * 60
+
+# 리더/총무: 일정/출석/재정 관리
+MANAGER_ROLES = [GroupMember.MemberRole.LEADER, GroupMember.MemberRole.ADMIN]
+
+_REQUEST_ATTR = "_group_roles"
+
+# batch_membership_changes() 안에서 모아둔 (모임 id 집합, 사용자 id 집합)
+_pending_changes = contextvars.ContextVar("pending_membership_changes", default=None)
+
+
+def _version_key(user_id):
+    return f"{VERSION_KEY_PREFIX}:{user_id}"
+
+
+def _roles_key(user_id, version):
+    return f"{ROLES_KEY_PREFIX}:{user_id}:{version}"
+
+
+def _roles_query(user_id):
+    memberships = GroupMember.objects.filter(user_id=user_id).order_by().values_list("group_id", "member_role")
+    leading = (
+        Group.objects.filter(leader_id=user_id).order_by()
+        .values_list("pk", Value(GroupMember.MemberRole.LEADER, output_field=CharField()))
+    )
+    return memberships.union(leading, all=True)
+
+
+def _add_role(roles, group_id, role):
+    # 같은 모임이 두 번 나오면 (Group.leader 이면서 멤버 행도 있는 경우) LEADER 가 우선
+    if roles.get(group_id) != GroupMember.MemberRole.LEADER:
+        roles[group_id] = role
+
+
+def _load_roles(user_id):
+    # 승인/거절 직후 복제 지연된 역할이 캐시되지 않도록 primary 에서 읽는다
+    roles = {}
+    with primary_reads():
+        for group_id, role in _roles_query(user_id):
+            _add_role(roles, group_id, role)
+    return roles
+
+
+async def _aload_roles(user_id):
+    roles = {}
+    with primary_reads():
+        async for group_id, role in _roles_query(user_id):
+            _add_role(roles, group_id, role)
+    return roles
+
+
+def get_roles(user):
+    """{group_id: member_role}. 비로그인이면 빈 dict."""
+    if not user.is_authenticated:
+        return {}
+    roles = getattr(user, _REQUEST_ATTR, None)
+    if roles is None:
+        if not shared_cache_enabled():
+            roles = _load_roles(user.pk)
+        else:
+            key = _roles_key(user.pk, get_version(_version_key(user.pk)))
+            roles = cache.get(key)
+            if roles is None:
+                roles = _load_roles(user.pk)
+                cache.set(key, roles, ROLES_TIMEOUT)
+        setattr(user, _REQUEST_ATTR, roles)
+    return roles
+
+
+async def aget_roles(user):
+    """get_roles 의 async 판."""
+    if not user.is_authenticated:
+        return {}
+    roles = getattr(user, _REQUEST_ATTR, None)
+    if roles is None:
+        if not shared_cache_enabled():
+            roles = await _aload_roles(user.pk)
+        else:
+            key = _roles_key(user.pk, await aget_version(_version_key(user.pk)))
+            roles = await cache.aget(key)
+            if roles is None:
+                roles = await _aload_roles(user.pk)
+                await cache.aset(key, roles, ROLES_TIMEOUT)
+        setattr(user, _REQUEST_ATTR, roles)
+    return roles
+
+
+def forget_roles(*user_ids):
+    """현재 트랜잭션이 커밋된 뒤 user_ids 의 역할 캐시를 무효화한다. (트랜잭션 밖이면 바로)"""
+    def bump():
+        for user_id in user_ids:
+            bump_version(_version_key(user_id))
+
+    transaction.on_commit(bump)
+
+
+def membership_changed(group_id, user_id):
+    """GroupMember 하나가 저장/삭제된 뒤: 모임의 멤버 수를 다시 세고 사용자의 역할 캐시를 무효화한다."""
+    changes = _pending_changes.get()
+    if changes is not None:
+        changes[0].add(group_id)
+        changes[1].add(user_id)
+        return
+    sync_member_counts(group_id)
+    forget_roles(user_id)
+
+
+@contextmanager
+def batch_membership_changes():
+    """블록 안의 membership_changed 를 모아두었다가 블록이 끝날 때 모임/사용자마다 한 번씩 처리한다.
+
+    여러 행을 한꺼번에 지울 때 행마다 모임 UPDATE 가 나가지 않도록.
+    """
+    changes = (set(), set())
+    token = _pending_changes.set(changes)
+    try:
+        yield
+    finally:
+        _pending_changes.reset(token)
+    for group_id in changes[0]:
+        sync_member_counts(group_id)
+    if changes[1]:
+        forget_roles(*changes[1])
+
+
+def role_in(user, group_id):
+    """user 의 모임 내 역할 (비회원/비로그인이면 None)."""
+    return get_roles(user).get(group_id)
+
+
+def is_leader(user, group_id):
+    """Group.leader 이거나 LEADER 멤버."""
+    return role_in(user, group_id) == GroupMember.MemberRole.LEADER
+
+
+def is_manager(user, group_id):
+    """리더 또는 총무."""
+    return role_in(user, group_id) in MANAGER_ROLES
+
+
+def is_active_member(user, group_id):
+    """승인된 멤버 (가입 대기 제외)."""
+    return role_in(user, group_id) in ACTIVE_ROLES
@@ -0,0 +1,192 @@
+"""요청별 SQL 계측 / DB 라우팅 미들웨어.
+
+DEBUG 가 꺼진 운영 환경에서도 connection.execute_wrapper 로 요청마다
+쿼리 수 / DB 시간을 재고, 같은 모양의 쿼리가 반복되면(N+1) 경고 로그를 남긴다.
+
+- 응답 헤더: Server-Timing: db;dur=..;desc="N queries", app;dur=..
+- 로그 (club_management.sql): 뷰 이름, 상태 코드, 쿼리 수, DB/전체 시간, 반복 쿼리 목록을 JSON 한 줄로
+
+요청의 recorder 는 contextvar 에 두고, 모든 DB 연결에는 연결이 열릴 때 한 번
+"현재 contextvar 의 recorder 로 넘기는" wrapper 를 달아둔다 (install_query_recorder, connection_created).
+연결은 스레드마다 따로지만 contextvar 는 sync_to_async 스레드로 이어지므로, sync 뷰(ASGI)나
+병렬 섹션(async_loaders.run_section)이 다른 스레드의 연결로 실행한 쿼리도 같은 요청에 집계된다.
+
+StreamingHttpResponse 처럼 응답을 돌려준 뒤 실행되는 쿼리는 집계되지 않는다.
+
+PrimaryPinningMiddleware 는 쓰기 직후의 읽기를 primary DB 로 보낸다 (routers.py).
+"""
+import contextvars
+import json
+import logging
+import re
+import threading
+import time
+from collections import Counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from .routers import PIN_COOKIE, replica_available, routing_state
+
+logger = logging.getLogger("club_management.sql")
+
+# 로그/헤더에 남길 반복 쿼리 SQL 길이
+SHAPE_PREVIEW_LENGTH = 200
+
+# IN (%s, %s, ...) 의 자리표시자 개수가 달라도 같은 모양으로 본다
+_PLACEHOLDER_LIST = re.compile(r"%s(?:\s*,\s*%s)+")
+
+
+def query_shape(sql):
+    return _PLACEHOLDER_LIST.sub("%s", sql)
+
+
+class QueryRecorder:
+    """execute_wrapper 로 등록되어 실행된 쿼리의 수/시간/모양을 모은다."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+        # 병렬 섹션 스레드가 함께 기록한다
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.duration += elapsed
+                self.count += 1
+                self.shapes[query_shape(sql)] += 1
+
+    def repeated(self, threshold):
+        """threshold 번 이상 실행된 같은 모양의 쿼리 [(sql, 횟수)], 많은 순."""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+
+_current_recorder = contextvars.ContextVar("query_recorder", default=None)
+
+
+def _record_query(execute, sql, params, many, context):
+    recorder = _current_recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """connection_created 수신기: 연결마다 한 번 요청별 recorder 로 넘기는 wrapper 를 단다."""
+    if _record_query not in connection.execute_wrappers:
+        # 맨 앞에 둔다 (execute_wrapper() 블록은 끝날 때 마지막 wrapper 를 pop 하므로)
+        connection.execute_wrappers.insert(0, _record_query)
+
+
+class QueryInstrumentationMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "SQL_INSTRUMENTATION", True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.threshold = getattr(settings, "SQL_REPEATED_QUERY_THRESHOLD", 5)
+        # ASGI 에서는 async 로 동작해 async 뷰를 스레드로 감싸지 않는다
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        recorder = QueryRecorder()
+        token = _current_recorder.set(recorder)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_recorder.reset(token)
+        return self._finish(request, response, recorder, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        recorder = QueryRecorder()
+        token = _current_recorder.set(recorder)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_recorder.reset(token)
+        return self._finish(request, response, recorder, time.perf_counter() - start)
+
+    def _finish(self, request, response, recorder, total):
+        db_ms = recorder.duration * 1000
+        total_ms = total * 1000
+        response["Server-Timing"] = (
+            f'db;dur={db_ms:.1f};desc="{recorder.count} queries", app;dur={total_ms:.1f}'
+        )
+        self._log(request, response, recorder, db_ms, total_ms)
+        return response
+
+    def _log(self, request, response, recorder, db_ms, total_ms):
+        repeated = recorder.repeated(self.threshold)
+        level = logging.WARNING if repeated else logging.INFO
+        # 로그가 꺼져 있으면 요약을 만들거나 JSON 으로 직렬화하지 않는다
+        if not logger.isEnabledFor(level):
+            return
+        match = request.resolver_match
+        summary = {
+            "view": match.view_name if match else None,
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "queries": recorder.count,
+            "db_ms": round(db_ms, 1),
+            "total_ms": round(total_ms, 1),
+            "repeated": [
+                {"sql": shape[:SHAPE_PREVIEW_LENGTH], "count": n} for shape, n in repeated
+            ],
+        }
+        logger.log(level, json.dumps(summary, ensure_ascii=False), extra={"sql_summary": summary})
+
+
+class PrimaryPinningMiddleware:
+    """쓰기 요청(또는 쓰기가 일어난 요청) 뒤 REPLICA_PIN_SECONDS 동안 그 브라우저의 읽기를 primary 로 고정한다.
+
+    세션 저장도 쓰기이므로 SessionMiddleware 보다 바깥에 둔다.
+    """
+
+    SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not replica_available():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.pin_seconds = getattr(settings, "REPLICA_PIN_SECONDS", 15)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        unsafe = request.method not in self.SAFE_METHODS
+        with routing_state(pinned=unsafe or PIN_COOKIE in request.COOKIES) as state:
+            response = self.get_response(request)
+        return self._pin(response, unsafe or state.wrote)
+
+    async def __acall__(self, request):
+        # 라우팅 상태는 contextvar 이므로 await 하는 뷰와 sync_to_async 스레드로 이어진다
+        unsafe = request.method not in self.SAFE_METHODS
+        with routing_state(pinned=unsafe or PIN_COOKIE in request.COOKIES) as state:
+            response = await self.get_response(request)
+        return self._pin(response, unsafe or state.wrote)
+
+    def _pin(self, response, wrote):
+        if wrote:
+            response.set_cookie(PIN_COOKIE, "1", max_age=self.pin_seconds, httponly=True, samesite="Lax")
+        return response
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+from club_management.search import drop_search_index, install_search_index
+
+
+def create_index(apps, schema_editor):
+    install_search_index(schema_editor.connection)
+
+
+def remove_index(apps, schema_editor):
+    drop_search_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('club_management', '0003_user_introduction_user_region'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, remove_index),
+    ]
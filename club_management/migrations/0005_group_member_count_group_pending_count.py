@@ -0,0 +1,39 @@
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+ACTIVE_ROLES = ['LEADER', 'ADMIN', 'MEMBER']
+
+
+def backfill_counts(apps, schema_editor):
+    Group = apps.get_model('club_management', 'Group')
+    groups = Group.objects.annotate(
+        actual_members=Count('groupmember', filter=Q(groupmember__member_role__in=ACTIVE_ROLES)),
+        actual_pending=Count('groupmember', filter=Q(groupmember__member_role='PENDING')),
+    )
+    updated = []
+    for group in groups.iterator():
+        group.member_count = group.actual_members
+        group.pending_count = group.actual_pending
+        updated.append(group)
+    Group.objects.bulk_update(updated, ['member_count', 'pending_count'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('club_management', '0004_group_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='group',
+            name='member_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='멤버 수'),
+        ),
+        migrations.AddField(
+            model_name='group',
+            name='pending_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='가입 대기 수'),
+        ),
+        migrations.RunPython(backfill_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 5.2.8 on 2026-10-18 03:13
+
+import django.db.models.deletion
+from collections import defaultdict
+
+from django.db import migrations, models
+
+
+def backfill_ledgers(apps, schema_editor):
+    FinancialTransaction = apps.get_model('club_management', 'FinancialTransaction')
+    GroupLedger = apps.get_model('club_management', 'GroupLedger')
+    MonthlyLedger = apps.get_model('club_management', 'MonthlyLedger')
+
+    ledgers = {}
+    months = defaultdict(lambda: [0, 0, 0])
+    for group_id, amount, tx_date in FinancialTransaction.objects.values_list(
+        'group_id', 'amount', 'transaction_date'
+    ).iterator():
+        ledger = ledgers.setdefault(group_id, GroupLedger(group_id=group_id))
+        ledger.balance += amount
+        ledger.transaction_count += 1
+        if ledger.last_transaction_date is None or tx_date > ledger.last_transaction_date:
+            ledger.last_transaction_date = tx_date
+
+        month = months[(group_id, tx_date.replace(day=1))]
+        if amount >= 0:
+            month[0] += amount
+        else:
+            month[1] -= amount
+        month[2] += 1
+
+    GroupLedger.objects.bulk_create(ledgers.values(), batch_size=500)
+    MonthlyLedger.objects.bulk_create(
+        [
+            MonthlyLedger(group_id=group_id, month=month, income=income, expense=expense, transaction_count=count)
+            for (group_id, month), (income, expense, count) in months.items()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('club_management', '0005_group_member_count_group_pending_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GroupLedger',
+            fields=[
+                ('group', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='ledger', serialize=False, to='club_management.group')),
+                ('balance', models.BigIntegerField(default=0, verbose_name='현재 잔액')),
+                ('transaction_count', models.PositiveIntegerField(default=0, verbose_name='거래 건수')),
+                ('last_transaction_date', models.DateField(blank=True, null=True, verbose_name='최근 거래 날짜')),
+            ],
+            options={
+                'verbose_name': '모임 재정 잔액',
+                'verbose_name_plural': '모임 재정 잔액 목록',
+            },
+        ),
+        migrations.AlterField(
+            model_name='financialtransaction',
+            name='amount',
+            field=models.IntegerField(verbose_name='금액'),
+        ),
+        migrations.CreateModel(
+            name='MonthlyLedger',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(verbose_name='월 (1일)')),
+                ('income', models.BigIntegerField(default=0, verbose_name='수입 합계')),
+                ('expense', models.BigIntegerField(default=0, verbose_name='지출 합계')),
+                ('transaction_count', models.PositiveIntegerField(default=0, verbose_name='거래 건수')),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_ledgers', to='club_management.group')),
+            ],
+            options={
+                'verbose_name': '월별 재정 집계',
+                'verbose_name_plural': '월별 재정 집계 목록',
+                'ordering': ['-month'],
+                'unique_together': {('group', 'month')},
+            },
+        ),
+        migrations.RunPython(backfill_ledgers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-18 03:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('club_management', '0006_ledger'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='financialtransaction',
+            name='import_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, verbose_name='가져오기 해시'),
+        ),
+        migrations.AlterField(
+            model_name='financialtransaction',
+            name='transaction_date',
+            field=models.DateField(default=django.utils.timezone.localdate, verbose_name='거래 날짜'),
+        ),
+        migrations.AddConstraint(
+            model_name='financialtransaction',
+            constraint=models.UniqueConstraint(fields=('group', 'import_hash'), name='unique_group_import_hash'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-18 03:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('club_management', '0007_financialtransaction_import_hash'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activityschedule',
+            index=models.Index(fields=['group', 'date_time'], name='schedule_group_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boardpost',
+            index=models.Index(fields=['group', '-is_notice', '-created_at'], name='post_group_notice_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='financialtransaction',
+            index=models.Index(fields=['group', 'transaction_date'], name='finance_group_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='group',
+            index=models.Index(fields=['status', '-created_at'], name='group_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='groupmember',
+            index=models.Index(fields=['group', 'member_role'], name='member_group_role_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rsvp',
+            index=models.Index(fields=['schedule', 'attendance_status'], name='rsvp_schedule_status_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.8 on 2026-10-18 03:31
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('club_management', '0008_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='group',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='최근 변경 시각'),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-18 03:44
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('club_management', '0009_group_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GroupRecommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField(verbose_name='순위')),
+                ('score', models.FloatField(verbose_name='추천 점수')),
+                ('computed_at', models.DateTimeField(verbose_name='계산 시각')),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='club_management.group')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '추천 모임',
+                'verbose_name_plural': '추천 모임 목록',
+                'constraints': [models.UniqueConstraint(fields=('user', 'rank'), name='recommendation_user_rank_uniq')],
+            },
+        ),
+    ]
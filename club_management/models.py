@@ -2,6 +2,7 @@ from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
+from django.utils import timezone
 
 from django.contrib.auth.models import BaseUserManager
 
@@ -89,10 +90,29 @@ class Group(models.Model):
     max_members = models.PositiveIntegerField(verbose_name='최대 인원')
     leader = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, related_name='created_groups', verbose_name='개설자')
     created_at = models.DateTimeField(auto_now_add=True)
+    # 모임 또는 하위 데이터(멤버/일정/게시글/거래)의 마지막 변경 시각 (group_cache.mark_group_changed)
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='최근 변경 시각')
+
+    # GroupMember 집계값 (GroupMember 저장/삭제 시 counters.sync_member_counts 가 같은 트랜잭션에서 다시 셈)
+    member_count = models.PositiveIntegerField(default=0, verbose_name='멤버 수')
+    pending_count = models.PositiveIntegerField(default=0, verbose_name='가입 대기 수')
+
+    class Meta:
+        indexes = [
+            # discovery 목록: 노출 상태 + 최신순 (keyset 페이지네이션)
+            models.Index(fields=['status', '-created_at'], name='group_status_created_idx'),
+        ]
 
     def __str__(self):
         return self.name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # DB 에서 읽은 값. 저장할 때 무엇이 바뀌었는지 다시 SELECT 하지 않고 비교한다 (signals.py)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
 #모임 멤버
 class GroupMember(models.Model):
     class MemberRole(models.TextChoices):
@@ -108,6 +128,10 @@ class GroupMember(models.Model):
 
     class Meta:
         unique_together = ('user', 'group')
+        indexes = [
+            # 멤버 탭 / 가입 대기 목록 / 멤버 수 재계산
+            models.Index(fields=['group', 'member_role'], name='member_group_role_idx'),
+        ]
         verbose_name = '모임 멤버'
         verbose_name_plural = '모임 멤버 목록'
 
@@ -130,6 +154,10 @@ class ActivitySchedule(models.Model):
 
     class Meta:
         ordering = ['date_time']
+        indexes = [
+            # 일정 탭 (모임별 날짜순)
+            models.Index(fields=['group', 'date_time'], name='schedule_group_date_idx'),
+        ]
 
 
 # RSVP
@@ -148,6 +176,10 @@ class RSVP(models.Model):
 
     class Meta:
         unique_together = ('user', 'schedule')
+        indexes = [
+            # 일정별 참석 인원 집계 / 출석부
+            models.Index(fields=['schedule', 'attendance_status'], name='rsvp_schedule_status_idx'),
+        ]
         verbose_name = '일정 참석 응답/출석'
         verbose_name_plural = '일정 참석 응답/출석 목록'
 
@@ -160,15 +192,63 @@ class RSVP(models.Model):
 class FinancialTransaction(models.Model):
     group = models.ForeignKey(Group, on_delete=models.CASCADE, related_name='transactions')
     user = models.ForeignKey( User, on_delete=models.SET_NULL,  null=True,  blank=True,related_name='financial_records',  verbose_name='관련 사용자 (납부자/지출 처리자)')
-    amount = models.PositiveIntegerField(verbose_name='금액')
+    # 수입은 양수, 지출은 음수
+    amount = models.IntegerField(verbose_name='금액')
     description = models.CharField(max_length=255, verbose_name='내용')
-    transaction_date = models.DateField(auto_now_add=True, verbose_name='거래 날짜')
+    # 은행 내역 가져오기(bank_import.py)는 실제 거래일을 넣으므로 auto_now_add 대신 기본값만 둔다
+    transaction_date = models.DateField(default=timezone.localdate, verbose_name='거래 날짜')
+    # 은행 내역에서 가져온 거래의 내용 해시 (같은 내역을 다시 올렸을 때 중복 방지용, 직접 입력한 거래는 NULL)
+    import_hash = models.CharField(max_length=64, null=True, blank=True, editable=False, verbose_name='가져오기 해시')
     
     def __str__(self):
         return f'[{self.group.name}] {self.get_type_display()} {self.amount}원: {self.description}'
 
     class Meta:
         ordering = ['-transaction_date']
+        constraints = [
+            models.UniqueConstraint(fields=['group', 'import_hash'], name='unique_group_import_hash'),
+        ]
+        indexes = [
+            # 재정 탭 / CSV 내보내기 기간 조회
+            models.Index(fields=['group', 'transaction_date'], name='finance_group_date_idx'),
+        ]
+
+
+# 재정 장부 스냅샷 (모임별 현재 잔액) — ledger.py 에서 거래 기록과 같은 트랜잭션으로 갱신
+class GroupLedger(models.Model):
+    group = models.OneToOneField(Group, on_delete=models.CASCADE, primary_key=True, related_name='ledger')
+    balance = models.BigIntegerField(default=0, verbose_name='현재 잔액')
+    transaction_count = models.PositiveIntegerField(default=0, verbose_name='거래 건수')
+    last_transaction_date = models.DateField(null=True, blank=True, verbose_name='최근 거래 날짜')
+
+    class Meta:
+        verbose_name = '모임 재정 잔액'
+        verbose_name_plural = '모임 재정 잔액 목록'
+
+    def __str__(self):
+        return f'[{self.group.name}] 잔액 {self.balance}원'
+
+
+# 월별 재정 집계
+class MonthlyLedger(models.Model):
+    group = models.ForeignKey(Group, on_delete=models.CASCADE, related_name='monthly_ledgers')
+    month = models.DateField(verbose_name='월 (1일)')
+    income = models.BigIntegerField(default=0, verbose_name='수입 합계')
+    expense = models.BigIntegerField(default=0, verbose_name='지출 합계')
+    transaction_count = models.PositiveIntegerField(default=0, verbose_name='거래 건수')
+
+    class Meta:
+        unique_together = ('group', 'month')
+        ordering = ['-month']
+        verbose_name = '월별 재정 집계'
+        verbose_name_plural = '월별 재정 집계 목록'
+
+    @property
+    def net(self):
+        return self.income - self.expense
+
+    def __str__(self):
+        return f'[{self.group.name}] {self.month:%Y-%m} 수입 {self.income}원 / 지출 {self.expense}원'
 
 
 # 게시판
@@ -183,9 +263,33 @@ class BoardPost(models.Model):
 
     class Meta:
         ordering = ['-is_notice', '-created_at']
+        indexes = [
+            # 게시판 탭 (공지 먼저, 최신순)
+            models.Index(fields=['group', '-is_notice', '-created_at'], name='post_group_notice_created_idx'),
+        ]
         verbose_name = '모임 게시글'
         verbose_name_plural = '모임 게시글 목록'
 
     def __str__(self):
         return f'[{self.group.name}] {self.title}'
 
+
+
+# 추천 모임 (compute_recommendations 명령으로 미리 계산)
+class GroupRecommendation(models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='recommendations')
+    group = models.ForeignKey(Group, on_delete=models.CASCADE, related_name='+')
+    rank = models.PositiveSmallIntegerField(verbose_name='순위')
+    score = models.FloatField(verbose_name='추천 점수')
+    computed_at = models.DateTimeField(verbose_name='계산 시각')
+
+    class Meta:
+        constraints = [
+            # discovery "회원님을 위한 모임": 사용자별 순위순 (이 인덱스 한 번으로 읽음)
+            models.UniqueConstraint(fields=['user', 'rank'], name='recommendation_user_rank_uniq'),
+        ]
+        verbose_name = '추천 모임'
+        verbose_name_plural = '추천 모임 목록'
+
+    def __str__(self):
+        return f'{self.user.nickname} → {self.group.name} (#{self.rank})'
@@ -0,0 +1,96 @@
+"""가입 신청 승인/거절 (한 건 / 일괄).
+
+동시에 들어온 승인/거절이 같은 신청을 두 번 처리하지 않도록, member_role=PENDING 조건을
+UPDATE/DELETE 문 자체에 넣고, 실제로 바뀐 행이 있을 때만 멤버 수/대기 수를 다시 센다.
+"""
+from django.db import transaction
+
+from .counters import sync_member_counts
+from .membership import batch_membership_changes, forget_roles
+from .models import Group, GroupMember
+
+APPROVE = "approve"
+REJECT = "reject"
+
+
+def delete_pending(queryset):
+    """queryset 중 아직 가입 대기인 신청을 지운다 (transaction.atomic() 안에서). 지운 행 수.
+
+    delete() 는 지울 행을 먼저 읽고 id 로 지우므로, 그 사이 승인된 행을 지우지 않도록 읽을 때 잠근다.
+    post_delete 시그널의 멤버 수 다시 세기 / 역할 캐시 무효화는 batch_membership_changes 로 모아
+    모임/사용자마다 한 번씩만 한다.
+    """
+    pending = queryset.select_for_update().filter(member_role=GroupMember.MemberRole.PENDING)
+    with batch_membership_changes():
+        deleted, _ = pending.delete()
+    return deleted
+
+
+def approve_pending_member(member):
+    """가입 대기 신청 하나를 승인한다. 이미 처리된 신청이면 False."""
+    with transaction.atomic():
+        approved = GroupMember.objects.filter(
+            pk=member.pk, group_id=member.group_id, member_role=GroupMember.MemberRole.PENDING,
+        ).update(member_role=GroupMember.MemberRole.MEMBER)
+        if approved != 1:
+            return False
+        # update() 는 시그널을 보내지 않는다 (모임 변경 기록은 sync_member_counts 가 함께)
+        sync_member_counts(member.group_id)
+        forget_roles(member.user_id)
+    return True
+
+
+def reject_pending_member(member):
+    """가입 대기 신청 하나를 거절(삭제)한다. 이미 처리된 신청이면 False."""
+    with transaction.atomic():
+        # 멤버 수 / 역할 캐시는 delete_pending 이 함께 갱신한다
+        if delete_pending(GroupMember.objects.filter(pk=member.pk, group_id=member.group_id)) != 1:
+            return False
+    return True
+
+
+def moderate_pending_members(group, action, member_ids=None):
+    """가입 대기(PENDING) 신청을 한 트랜잭션에서 일괄 승인/거절한다.
+
+    member_ids 가 None 이면 모든 대기 신청이 대상이다.
+    승인은 신청이 오래된 순서로 max_members 까지만 하고, 나머지는 대기 상태로 남긴다.
+
+    반환값 (각각 GroupMember 리스트, not_found 는 id 리스트):
+        approved / rejected / over_capacity(정원 초과로 대기 유지) / not_found(이미 처리됐거나 없는 신청)
+    """
+    result = {"approved": [], "rejected": [], "over_capacity": [], "not_found": []}
+    with transaction.atomic():
+        # 정원 계산이 겹치지 않도록 모임 행을 잠근다 (DB 가 지원하는 경우)
+        group = Group.objects.select_for_update().get(pk=group.pk)
+
+        pending = (
+            GroupMember.objects.select_for_update()
+            .filter(group=group, member_role=GroupMember.MemberRole.PENDING)
+            .select_related("user")
+            .order_by("joined_date", "id")
+        )
+        if member_ids is not None:
+            pending = pending.filter(pk__in=member_ids)
+        pending = list(pending)
+
+        if member_ids is not None:
+            found = {member.pk for member in pending}
+            result["not_found"] = [pk for pk in member_ids if pk not in found]
+
+        if action == APPROVE:
+            available = max(group.max_members - group.member_count, 0)
+            to_approve, result["over_capacity"] = pending[:available], pending[available:]
+            for member in to_approve:
+                member.member_role = GroupMember.MemberRole.MEMBER
+            GroupMember.objects.bulk_update(to_approve, ["member_role"], batch_size=500)
+            # bulk_update 는 시그널을 보내지 않으므로 역할 캐시를 직접 무효화
+            forget_roles(*[member.user_id for member in to_approve])
+            sync_member_counts(group.pk)
+            result["approved"] = to_approve
+        elif action == REJECT:
+            # DELETE 한 번, 멤버 수 다시 세기(모임 변경 기록 포함)와 역할 캐시 무효화도 한 번씩
+            delete_pending(GroupMember.objects.filter(pk__in=[member.pk for member in pending]))
+            result["rejected"] = pending
+        else:
+            raise ValueError(f"알 수 없는 처리 방식: {action}")
+    return result
@@ -0,0 +1,113 @@
+"""키셋(커서) 페이지네이션.
+
+OFFSET 대신 마지막으로 본 행의 (created_at, id) 를 커서로 넘겨서
+"그보다 오래된 행" 만 조회한다. 몇 번째 페이지든 인덱스 범위 조회 한 번으로 끝난다.
+
+검색 랭킹 순 결과(search.search_groups, 최대 SEARCH_RESULT_LIMIT 개)는 정렬 기준이 행의 값이 아니므로
+순위 위치(offset)를 커서로 쓴다 (rank_page). 대상이 상위 N 개로 한정되어 OFFSET 비용이 작다.
+"""
+import base64
+from datetime import datetime
+
+from django.db.models import Q
+
+from .search import SEARCH_RESULT_LIMIT
+
+DEFAULT_PAGE_SIZE = 24
+MAX_PAGE_SIZE = 60
+
+# 조작된 커서의 id 가 DB 정수 범위를 넘으면 쿼리에서 OverflowError 가 나므로 미리 거른다
+MAX_ID = 2 ** 63 - 1
+
+
+def parse_page_size(raw, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """요청 파라미터의 페이지 크기를 1 ~ maximum 범위로 제한한다."""
+    try:
+        size = int(raw)
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(size, maximum))
+
+
+def _b64encode(raw):
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _b64decode(cursor):
+    return base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+
+
+def encode_cursor(created_at, pk):
+    return _b64encode(f"{created_at.isoformat()}|{pk}")
+
+
+def decode_cursor(cursor):
+    """커서 문자열을 (created_at, id) 로 복원한다. 형식이 잘못되면 None."""
+    if not cursor:
+        return None
+    try:
+        created_raw, pk_raw = _b64decode(cursor).split("|")
+        created_at, pk = datetime.fromisoformat(created_raw), int(pk_raw)
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if not 0 < pk <= MAX_ID:
+        return None
+    return created_at, pk
+
+
+def keyset_page(queryset, cursor=None, page_size=DEFAULT_PAGE_SIZE):
+    """(-created_at, -id) 순서로 page_size 개를 가져온다.
+
+    반환값: (items, next_cursor) — 다음 페이지가 없으면 next_cursor 는 None.
+    """
+    position = decode_cursor(cursor)
+    if position:
+        created_at, pk = position
+        queryset = queryset.filter(
+            Q(created_at__lt=created_at) |
+            Q(created_at=created_at, pk__lt=pk)
+        )
+
+    # 한 개 더 가져와서 다음 페이지 존재 여부를 판단
+    items = list(queryset.order_by("-created_at", "-pk")[:page_size + 1])
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        last = items[-1]
+        next_cursor = encode_cursor(last.created_at, last.pk)
+    return items, next_cursor
+
+
+RANK_CURSOR_PREFIX = "rank"
+
+
+def encode_rank_cursor(offset):
+    return _b64encode(f"{RANK_CURSOR_PREFIX}|{offset}")
+
+
+def decode_rank_cursor(cursor):
+    """랭킹 커서를 순위 위치로 복원한다. 형식이 잘못되었거나 랭킹 결과 범위 밖이면 None."""
+    if not cursor:
+        return None
+    try:
+        prefix, offset_raw = _b64decode(cursor).split("|")
+        offset = int(offset_raw)
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if prefix != RANK_CURSOR_PREFIX or not 0 < offset < SEARCH_RESULT_LIMIT:
+        return None
+    return offset
+
+
+def rank_page(queryset, cursor=None, page_size=DEFAULT_PAGE_SIZE):
+    """랭킹 순으로 정렬된 queryset 에서 커서 위치부터 page_size 개를 가져온다.
+
+    반환값: (items, next_cursor) — 다음 페이지가 없으면 next_cursor 는 None.
+    """
+    offset = decode_rank_cursor(cursor) or 0
+    items = list(queryset[offset:offset + page_size + 1])
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        next_cursor = encode_rank_cursor(offset + page_size)
+    return items, next_cursor
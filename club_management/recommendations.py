@@ -0,0 +1,168 @@
+"""discovery "회원님을 위한 모임" 추천.
+
+추천은 요청마다 계산하지 않는다. compute_recommendations 명령(배치)이 사용자별 상위 N 개를
+GroupRecommendation 에 저장하고, discovery 는 쿼리 한 번으로 읽기만 한다.
+
+점수 = 지역 일치 + 카테고리 선호 + 모집 활기 + 최신성
+- 지역 일치: User.region 의 지역명이 모임 활동 지역에 들어 있으면 1
+- 카테고리 선호: 내가 활동 중인 모임 중 그 카테고리의 비율 (0~1)
+- 모집 활기: member_count / max_members (정원이 찬 모임은 후보에서 뺀다)
+- 최신성: 개설 후 RECENCY_HALF_LIFE_DAYS 일마다 절반
+
+사용자×모임 쌍을 하나씩 계산하지 않는다. 사용자에 따라 달라지는 항목(지역 일치, 카테고리 선호)은
+(지역 일치 여부, 카테고리) 묶음 안에서 상수이므로, 모임을 묶음별로 기본 점수(활기 + 최신성) 순으로
+한 번 정렬해두고 사용자마다 묶음 상수만 더해 heapq.merge 로 앞에서부터 N 개를 고른다.
+사용자 한 명에 드는 계산이 모임 수가 아니라 (묶음 수 + N + 가입한 모임 수) 에 비례한다.
+"""
+import heapq
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.utils import timezone
+
+from .counters import ACTIVE_ROLES
+from .facets import VISIBLE_STATUSES
+from .models import Group, GroupMember, GroupRecommendation, User
+
+RECOMMENDATION_COUNT = 6
+
+REGION_WEIGHT = 2.0
+CATEGORY_WEIGHT = 3.0
+FILL_WEIGHT = 1.0
+RECENCY_WEIGHT = 1.0
+RECENCY_HALF_LIFE_DAYS = 30
+
+WRITE_BATCH_SIZE = 500
+
+
+def _region_label(code):
+    # User.region 은 코드(SEOUL), Group.region 은 지역명(서울 ...)
+    return User.RegionChoices(code).label if code in User.RegionChoices.values else ""
+
+
+def _region_matches(region_label, group_region):
+    # discovery 의 지역 필터(icontains)와 같은 기준
+    return bool(region_label) and region_label.lower() in group_region.lower()
+
+
+class CandidateIndex:
+    """추천 후보 모임과 기본 점수. 사용자 지역별 묶음은 처음 필요할 때 한 번만 만든다."""
+
+    def __init__(self, now=None):
+        now = now or timezone.now()
+        rows = (
+            Group.objects.filter(status__in=VISIBLE_STATUSES, max_members__gt=0)
+            .values_list("id", "category", "region", "member_count", "max_members", "created_at")
+        )
+        self.candidates = []
+        for group_id, category, region, member_count, max_members, created_at in rows.iterator():
+            if member_count >= max_members:
+                continue
+            age_days = max((now - created_at).total_seconds() / 86400, 0)
+            base = (
+                FILL_WEIGHT * member_count / max_members
+                + RECENCY_WEIGHT * 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+            )
+            self.candidates.append((group_id, category, region, base))
+        self._buckets = {}
+
+    def buckets(self, region_label):
+        """{(지역 일치 여부, 카테고리): [(기본 점수, group_id)] 점수 내림차순}."""
+        if region_label not in self._buckets:
+            buckets = defaultdict(list)
+            for group_id, category, region, base in self.candidates:
+                buckets[(_region_matches(region_label, region), category)].append((base, group_id))
+            for items in buckets.values():
+                items.sort(key=lambda item: (-item[0], item[1]))
+            self._buckets[region_label] = buckets
+        return self._buckets[region_label]
+
+
+def _shifted(items, bonus):
+    for base, group_id in items:
+        yield base + bonus, group_id
+
+
+def top_groups(index, region_label, affinity, exclude, count=RECOMMENDATION_COUNT):
+    """한 사용자의 상위 count 개 [(group_id, score)].
+
+    affinity: {카테고리: 비율}, exclude: 이미 가입(신청)한 모임 id
+    """
+    streams = [
+        _shifted(items, REGION_WEIGHT * matched + CATEGORY_WEIGHT * affinity.get(category, 0))
+        for (matched, category), items in index.buckets(region_label).items()
+    ]
+    picked = []
+    for score, group_id in heapq.merge(*streams, key=lambda item: item[0], reverse=True):
+        if group_id in exclude:
+            continue
+        picked.append((group_id, score))
+        if len(picked) == count:
+            break
+    return picked
+
+
+def _memberships():
+    """{user_id: 가입(신청)한 모임 id 집합}, {user_id: 활동 중인 모임의 카테고리 Counter}."""
+    joined, categories = defaultdict(set), defaultdict(Counter)
+    rows = GroupMember.objects.values_list("user_id", "group_id", "member_role", "group__category")
+    for user_id, group_id, role, category in rows.iterator():
+        joined[user_id].add(group_id)
+        if role in ACTIVE_ROLES:
+            categories[user_id][category] += 1
+    return joined, categories
+
+
+def _affinity(counter):
+    total = sum(counter.values())
+    return {category: n / total for category, n in counter.items()} if total else {}
+
+
+def compute_recommendations(count=RECOMMENDATION_COUNT, batch_size=WRITE_BATCH_SIZE, now=None):
+    """모든 활성 사용자의 추천 목록을 다시 계산해 저장한다. (사용자 수, 저장한 추천 수)"""
+    now = now or timezone.now()
+    index = CandidateIndex(now)
+    joined, categories = _memberships()
+
+    users = User.objects.filter(is_active=True).order_by("pk").values_list("pk", "region")
+    user_count = saved = 0
+    batch_ids, batch_rows = [], []
+
+    def flush():
+        # 사용자 묶음 단위로 이전 추천을 지우고 새로 쓴다
+        with transaction.atomic():
+            GroupRecommendation.objects.filter(user_id__in=batch_ids).delete()
+            GroupRecommendation.objects.bulk_create(batch_rows)
+        batch_ids.clear()
+        batch_rows.clear()
+
+    for user_id, region in users.iterator():
+        picked = top_groups(index, _region_label(region), _affinity(categories[user_id]), joined[user_id], count)
+        batch_ids.append(user_id)
+        batch_rows.extend(
+            GroupRecommendation(user_id=user_id, group_id=group_id, rank=rank, score=score, computed_at=now)
+            for rank, (group_id, score) in enumerate(picked, start=1)
+        )
+        user_count += 1
+        saved += len(picked)
+        if len(batch_ids) >= batch_size:
+            flush()
+    if batch_ids:
+        flush()
+    return user_count, saved
+
+
+def recommended_groups(user, limit=RECOMMENDATION_COUNT):
+    """discovery 에 보여줄 추천 모임 (쿼리 1회).
+
+    계산 뒤에 가입(신청)했거나 더 이상 노출되지 않는 모임은 뺀다.
+    """
+    if not user.is_authenticated:
+        return []
+    rows = (
+        GroupRecommendation.objects.filter(user=user, group__status__in=VISIBLE_STATUSES)
+        .exclude(group__in=GroupMember.objects.filter(user=user).values("group"))
+        .select_related("group")
+        .order_by("rank")[:limit]
+    )
+    return [row.group for row in rows]
@@ -0,0 +1,109 @@
+"""읽기/쓰기 DB 라우터 (읽기 전용 복제본).
+
+DATABASES 에 "replica" 가 있으면(REPLICA_DATABASE_URL) 다음 규칙으로 연결을 고른다.
+
+- 쓰기는 항상 default(primary)
+- 읽기는 @replica_reads 로 표시한 화면(탐색/상세/탭/게시글/마이페이지/JSON API)에서만 replica
+- 같은 요청에서 쓰기가 한 번이라도 있었으면 그 뒤의 읽기는 primary (방금 쓴 내용을 읽도록)
+- 쓰기 요청 뒤에는 REPLICA_PIN_SECONDS 동안 쿠키로 primary 고정 (middleware.PrimaryPinningMiddleware)
+  글 작성 → redirect → 상세 화면처럼 다음 요청이 복제 지연보다 먼저 오는 경우를 위해서
+- 모임 버전 캐시에 저장할 섹션은 primary 에서 만든다 (primary_reads)
+  지연된 복제본에서 읽은 예전 데이터가 새 버전 키로 캐시되지 않도록
+
+상태는 contextvars 에 두므로 async 뷰와 sync_to_async 스레드로 그대로 이어진다.
+"쓴 뒤에는 primary" 는 routing_state() 안(PrimaryPinningMiddleware 가 요청마다 연다)에서만 기억한다.
+요청 밖(관리 명령, 스레드, 태스크)의 쓰기가 그 컨텍스트를 계속 primary 로 고정하지 않도록.
+"""
+import contextvars
+import functools
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+
+PRIMARY = "default"
+REPLICA = "replica"
+
+PIN_COOKIE = "primary_pin"
+
+
+@dataclass
+class RoutingState:
+    """요청 하나의 라우팅 상태. gather 로 나뉜 태스크도 같은 객체를 보도록 contextvar 에 객체로 둔다."""
+
+    pinned: bool = False
+    wrote: bool = False
+
+
+_replica_allowed = contextvars.ContextVar("replica_allowed", default=False)
+_state = contextvars.ContextVar("db_routing_state", default=None)
+
+
+def replica_available():
+    return REPLICA in settings.DATABASES
+
+
+def _current_state():
+    state = _state.get()
+    if state is None:
+        # 요청 밖: 저장하지 않는 기본 상태 (쓰기 표시가 남지 않는다)
+        return RoutingState()
+    return state
+
+
+@contextmanager
+def routing_state(pinned=False):
+    """요청 하나 동안의 라우팅 상태를 만든다. 끝나면 이전 상태로 되돌린다."""
+    state = RoutingState(pinned=pinned)
+    token = _state.set(state)
+    try:
+        yield state
+    finally:
+        _state.reset(token)
+
+
+@contextmanager
+def _allow_replica(allowed):
+    token = _replica_allowed.set(allowed)
+    try:
+        yield
+    finally:
+        _replica_allowed.reset(token)
+
+
+def primary_reads():
+    """블록 안의 읽기를 primary 로 보낸다."""
+    return _allow_replica(False)
+
+
+def replica_reads(view):
+    """뷰 안의 읽기를 replica 로 보낸다 (sync / async 뷰 모두)."""
+    if iscoroutinefunction(view):
+        @functools.wraps(view)
+        async def wrapper(*args, **kwargs):
+            with _allow_replica(True):
+                return await view(*args, **kwargs)
+    else:
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            with _allow_replica(True):
+                return view(*args, **kwargs)
+    return wrapper
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if _replica_allowed.get() and not _current_state().pinned and replica_available():
+            return REPLICA
+        return PRIMARY
+
+    def db_for_write(self, model, **hints):
+        # 쓴 뒤의 읽기는 같은 요청 안에서 primary 로
+        state = _current_state()
+        state.pinned = state.wrote = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 두 연결은 같은 데이터의 사본
+        return True
@@ -0,0 +1,197 @@
+"""모임 검색 인덱스 (SQLite FTS5).
+
+Group.name / Group.description 을 FTS5 가상 테이블에 색인해두고,
+discovery 검색을 icontains 풀스캔 대신 인덱스 조회 + bm25 랭킹으로 처리한다.
+
+- 한국어는 형태소 분리 없이도 부분 일치가 되도록 trigram 토크나이저를 사용한다.
+- 인덱스는 Group 테이블 트리거로 저장/삭제 시점에 자동 동기화된다.
+- SQLite 가 아니거나 FTS5 를 지원하지 않으면 기존 icontains 검색으로 동작한다.
+"""
+from django.db import connection, connections
+from django.db.models import Case, IntegerField, Q, When
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = "club_management_group_fts"
+GROUP_TABLE = "club_management_group"
+
+# trigram 토크나이저는 3글자 미만 검색어를 매칭하지 못한다.
+MIN_TERM_LENGTH = 3
+
+# 검색 결과는 랭킹 상위 N 개까지만 보여준다.
+SEARCH_RESULT_LIMIT = 100
+
+# DB alias 별 FTS 테이블 존재 여부 캐시
+_availability = {}
+
+_TRIGGERS = {
+    f"{FTS_TABLE}_ai": f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {GROUP_TABLE} BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, name, description)
+            VALUES (new.id, new.name, new.description);
+        END
+    """,
+    f"{FTS_TABLE}_ad": f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {GROUP_TABLE} BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description)
+            VALUES ('delete', old.id, old.name, old.description);
+        END
+    """,
+    f"{FTS_TABLE}_au": f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF name, description ON {GROUP_TABLE} BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description)
+            VALUES ('delete', old.id, old.name, old.description);
+            INSERT INTO {FTS_TABLE}(rowid, name, description)
+            VALUES (new.id, new.name, new.description);
+        END
+    """,
+}
+
+
+def _existing_objects(cursor, names):
+    placeholders = ", ".join(["%s"] * len(names))
+    cursor.execute(
+        f"SELECT name FROM sqlite_master WHERE name IN ({placeholders})",
+        list(names),
+    )
+    return {row[0] for row in cursor.fetchall()}
+
+
+def install_search_index(conn=None):
+    """FTS 테이블과 동기화 트리거를 (없으면) 만들고, 새로 만든 경우 인덱스를 재구성한다.
+
+    SQLite 는 ALTER 시 테이블을 새로 만들어 복사하면서 트리거를 지워버리므로
+    마이그레이션 이후(post_migrate)에도 다시 호출해 트리거를 복구한다.
+    """
+    conn = conn or connection
+    if conn.vendor != "sqlite":
+        return False
+
+    with conn.cursor() as cursor:
+        existing = _existing_objects(cursor, [FTS_TABLE, *_TRIGGERS])
+        if existing == {FTS_TABLE, *_TRIGGERS}:
+            return True
+
+        try:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+                f"name, description, "
+                f"content='{GROUP_TABLE}', content_rowid='id', "
+                f"tokenize='trigram')"
+            )
+        except Exception:
+            # FTS5 / trigram 미지원 SQLite 빌드
+            return False
+
+        for sql in _TRIGGERS.values():
+            cursor.execute(sql)
+        # 트리거가 없던 동안 변경된 내용까지 반영되도록 전체 재색인
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    _availability.clear()
+    return True
+
+
+def drop_search_index(conn=None):
+    conn = conn or connection
+    if conn.vendor != "sqlite":
+        return
+    with conn.cursor() as cursor:
+        for name in _TRIGGERS:
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    _availability.clear()
+
+
+def search_index_available(conn=None):
+    conn = conn or connection
+    if conn.alias not in _availability:
+        available = False
+        if conn.vendor == "sqlite":
+            with conn.cursor() as cursor:
+                available = bool(_existing_objects(cursor, [FTS_TABLE]))
+        _availability[conn.alias] = available
+    return _availability[conn.alias]
+
+
+def _split_terms(query):
+    return [term for term in query.split() if term]
+
+
+def _match_expression(terms):
+    # 각 검색어를 phrase 로 감싸서 FTS 문법 문자(*, -, ")가 연산자로 해석되지 않게 한다.
+    return " ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+
+
+def _match_sql(terms):
+    return f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [_match_expression(terms)]
+
+
+def ranked_group_ids(terms, limit=SEARCH_RESULT_LIMIT, conn=None, within=None):
+    """검색어(3글자 이상)에 매칭되는 Group id 를 bm25 랭킹 순으로 반환한다.
+
+    within(Group queryset)을 주면 그 안의 모임만 놓고 순위를 매긴 뒤 limit 개를 자른다.
+    """
+    conn = conn or connection
+    sql, params = _match_sql(terms)
+    if within is not None:
+        within_sql, within_params = within.order_by().values("pk").query.get_compiler(connection=conn).as_sql()
+        sql += f" AND rowid IN ({within_sql})"
+        params.extend(within_params)
+    with conn.cursor() as cursor:
+        cursor.execute(f"{sql} ORDER BY bm25({FTS_TABLE}, 10.0, 1.0) LIMIT %s", [*params, limit])
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _contains(term):
+    return Q(name__icontains=term) | Q(description__icontains=term)
+
+
+def _prepare(queryset, query):
+    """(검색어 목록, 3글자 이상 검색어 목록, 인덱스를 쓸 연결). 인덱스를 못 쓰면 연결은 None."""
+    terms = _split_terms(query)
+    long_terms = [term for term in terms if len(term) >= MIN_TERM_LENGTH]
+    # 라우터가 고른 연결(replica 등)의 인덱스를 쓴다
+    conn = connections[queryset.db]
+    if not long_terms or not search_index_available(conn):
+        conn = None
+    return terms, long_terms, conn
+
+
+def _filter_short_terms(queryset, terms):
+    for term in terms:
+        if len(term) < MIN_TERM_LENGTH:
+            queryset = queryset.filter(_contains(term))
+    return queryset
+
+
+def matching_groups(queryset, query):
+    """queryset 중 검색어에 매칭되는 모임 전체 (랭킹/개수 제한 없음). 필터 옵션 집계용."""
+    terms, long_terms, conn = _prepare(queryset, query)
+    if conn is None:
+        return queryset.filter(_contains(query.strip()))
+    sql, params = _match_sql(long_terms)
+    return _filter_short_terms(queryset.filter(pk__in=RawSQL(sql, params)), terms)
+
+
+def search_groups(queryset, query, limit=SEARCH_RESULT_LIMIT):
+    """queryset 을 검색어로 필터링한다.
+
+    3글자 이상 검색어는 FTS 인덱스로 찾아 랭킹 순으로 정렬하고, 그보다 짧은 검색어는
+    icontains 로 거른다. 랭킹 상위 limit 개는 queryset 안에서 고르므로, 노출 상태/카테고리/지역
+    필터는 모두 적용한 뒤에 넘긴다. 인덱스를 쓸 수 없거나 긴 검색어가 하나도 없으면
+    기존 icontains 검색으로 동작한다.
+    두 번째 반환값은 랭킹 정렬이 적용되었는지 여부.
+    """
+    terms, long_terms, conn = _prepare(queryset, query)
+    if conn is None:
+        return queryset.filter(_contains(query.strip())), False
+
+    queryset = _filter_short_terms(queryset, terms)
+    ids = ranked_group_ids(long_terms, limit=limit, conn=conn, within=queryset)
+    if not ids:
+        return queryset.none(), True
+
+    rank = Case(
+        *[When(pk=pk, then=position) for position, pk in enumerate(ids)],
+        output_field=IntegerField(),
+    )
+    return queryset.filter(pk__in=ids).annotate(search_rank=rank).order_by("search_rank"), True
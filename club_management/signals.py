@@ -0,0 +1,96 @@
+"""모델 변경 시 캐시 갱신.
+
+- 해당 모임의 캐시 버전 올리기 / Group.updated_at 갱신 (group_cache.py)
+- discovery 필터 집계 캐시 무효화 (facets.py)
+- 멤버십 변경 시 멤버 수 다시 세기 / 사용자별 역할 캐시 무효화 (counters.py, membership.py)
+- 사용자 정보 변경 시 로그인 사용자 캐시 무효화 (auth_backends.py)
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .auth_backends import forget_user
+from .facets import apply_facet_change, facet_key
+from .group_cache import bump_group_version_on_commit, mark_group_changed
+from .membership import forget_roles, membership_changed
+from .models import (
+    Group,
+    GroupMember,
+    ActivitySchedule,
+    RSVP,
+    FinancialTransaction,
+    BoardPost,
+    User,
+)
+
+
+FACET_FIELDS = ("status", "category", "region")
+
+# 저장 전 값을 알 수 없음 (DB 에서 읽지 않고 pk 만 채워 만든 객체, 일부 필드만 읽은 객체)
+_UNKNOWN = object()
+
+
+def _facet_key_of(group):
+    return facet_key(group.status, group.category, group.region)
+
+
+def _loaded(group, attname):
+    """DB 에서 읽었을 때(또는 마지막으로 저장했을 때)의 값."""
+    return (getattr(group, "_loaded_values", None) or {}).get(attname, _UNKNOWN)
+
+
+def _facet_before(group):
+    """저장 전 집계 키."""
+    before = [_loaded(group, name) for name in FACET_FIELDS]
+    if _UNKNOWN in before:
+        return _UNKNOWN
+    return facet_key(*before)
+
+
+@receiver(post_save, sender=Group)
+def _group_saved(sender, instance, created, **kwargs):
+    bump_group_version_on_commit(instance.pk)
+    # 저장 전 값을 모르면 apply_facet_change 가 집계 캐시를 버린다
+    apply_facet_change(None if created else _facet_before(instance), _facet_key_of(instance))
+    # Group.leader 도 리더 역할의 기준이므로 (membership.py) 리더가 바뀌면 전후 리더의 역할 캐시를 버린다
+    leader_before = None if created else _loaded(instance, "leader_id")
+    if leader_before != instance.leader_id:
+        forget_roles(*[user_id for user_id in (leader_before, instance.leader_id) if user_id not in (None, _UNKNOWN)])
+    # 같은 객체를 다시 저장할 때의 비교 기준
+    instance._loaded_values = {field.attname: getattr(instance, field.attname) for field in sender._meta.concrete_fields}
+
+
+@receiver(post_delete, sender=Group)
+def _group_deleted(sender, instance, **kwargs):
+    bump_group_version_on_commit(instance.pk)
+    apply_facet_change(_facet_key_of(instance), None)
+    if instance.leader_id:
+        forget_roles(instance.leader_id)
+
+
+@receiver([post_save, post_delete], sender=ActivitySchedule)
+@receiver([post_save, post_delete], sender=FinancialTransaction)
+@receiver([post_save, post_delete], sender=BoardPost)
+def _group_child_changed(sender, instance, **kwargs):
+    mark_group_changed(instance.group_id)
+
+
+@receiver([post_save, post_delete], sender=GroupMember)
+def _membership_changed(sender, instance, **kwargs):
+    # 멤버 수 UPDATE 가 Group.updated_at 갱신 / 캐시 버전 올리기를 겸한다
+    membership_changed(instance.group_id, instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=RSVP)
+def _rsvp_changed(sender, instance, **kwargs):
+    group_id = (
+        ActivitySchedule.objects.filter(pk=instance.schedule_id)
+        .values_list("group_id", flat=True)
+        .first()
+    )
+    if group_id:
+        mark_group_changed(group_id)
+
+
+@receiver([post_save, post_delete], sender=User)
+def _user_changed(sender, instance, **kwargs):
+    forget_user(instance.pk)
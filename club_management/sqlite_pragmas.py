@@ -0,0 +1,19 @@
+"""SQLite 운영 모드 PRAGMA.
+
+기본 저널(rollback journal)에서는 쓰기 트랜잭션이 커밋하는 동안 DB 파일 전체가 잠겨
+그 사이의 모든 읽기가 기다린다 (재정 기록 한 건을 쓰는 동안 상세 화면이 멈춤).
+WAL 에서는 읽기가 쓰기를 기다리지 않고 마지막으로 커밋된 스냅샷을 읽는다.
+
+settings.SQLITE_PRAGMAS (SQLITE_PRODUCTION=True 일 때 채워짐)를 새 연결마다 적용한다.
+journal_mode=WAL 은 DB 파일에 남지만 나머지 PRAGMA 는 연결마다 다시 설정해야 하므로
+connection_created 시그널을 쓴다. 앱 쿼리가 아니므로 계측/쿼리 로그에 남지 않도록
+DB-API 연결에 직접 실행한다.
+"""
+from django.conf import settings
+
+
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    if connection.vendor != "sqlite":
+        return
+    for name, value in getattr(settings, "SQLITE_PRAGMAS", {}).items():
+        connection.connection.execute(f"PRAGMA {name} = {value}")
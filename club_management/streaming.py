@@ -0,0 +1,34 @@
+"""StreamingHttpResponse 를 WSGI / ASGI 양쪽에서 스트리밍으로.
+
+ASGI 에서 동기 이터레이터를 StreamingHttpResponse 에 넘기면 Django 가 경고를 내고 전부 메모리에 모은 뒤
+한 번에 보낸다. ASGI 요청이면 이터레이터를 CHUNK_ITEMS 개씩 sync_to_async 로 꺼내는 async 이터레이터로
+감싸서 넘긴다. (DB 커서를 쓰는 이터레이터이므로 thread_sensitive: 요청의 동기 스레드에서 꺼낸다)
+"""
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+
+# sync_to_async 한 번에 꺼내는 줄 수 (스레드 전환 비용을 나누기 위해)
+CHUNK_ITEMS = 500
+
+
+async def _aiter_chunks(iterator, chunk_items):
+    next_chunk = sync_to_async(lambda: list(islice(iterator, chunk_items)), thread_sensitive=True)
+    try:
+        while chunk := await next_chunk():
+            for item in chunk:
+                yield item
+    finally:
+        # 중간에 연결이 끊겨도 제너레이터(와 DB 커서)를 정리한다
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            await sync_to_async(close, thread_sensitive=True)()
+
+
+def streaming_response(request, iterator, chunk_items=CHUNK_ITEMS, **kwargs):
+    """iterator 를 내보내는 StreamingHttpResponse. ASGI 요청이면 async 이터레이터로 감싼다."""
+    if isinstance(request, ASGIRequest):
+        iterator = _aiter_chunks(iter(iterator), chunk_items)
+    return StreamingHttpResponse(iterator, **kwargs)
@@ -0,0 +1,228 @@
+"""대량 합성 데이터 생성 (성능 측정용).
+
+mock_data.py 의 손으로 쓴 예시 몇 개로는 데이터가 많을 때의 동작을 알 수 없으므로,
+사용자/모임/멤버/일정/RSVP/게시글/거래를 bulk_create 로 batch_size 씩 나눠 넣는다.
+집계값(member_count, 장부)은 넣은 원본에서 다시 계산해 일관성을 맞춘다.
+
+    python manage.py generate_synthetic_data --users 50000 --groups 10000 --rsvps 1000000
+"""
+import random
+import secrets
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from .cache_versions import bump_version
+from .counters import recount_member_counts
+from .facets import FACETS_VERSION_KEY
+from .ledger import verify_ledger
+from .models import (
+    ActivitySchedule,
+    BoardPost,
+    FinancialTransaction,
+    Group,
+    GroupMember,
+    RSVP,
+    User,
+)
+
+RECOUNT_CHUNK_SIZE = 500
+
+REGIONS = ["서울", "경기", "인천", "부산", "대구", "대전", "광주", "기타/온라인"]
+
+NAME_WORDS = ["주말", "퇴근 후", "새벽", "초보", "직장인", "동네", "월간", "힐링"]
+TOPICS = {
+    Group.GroupCategory.SPORTS: ["농구", "풋살", "러닝", "배드민턴", "등산"],
+    Group.GroupCategory.ART: ["드로잉", "수채화", "도자기", "캘리그라피"],
+    Group.GroupCategory.MUSIC: ["밴드", "합창", "우쿨렐레", "재즈 감상"],
+    Group.GroupCategory.COOKING: ["홈 베이킹", "비건 요리", "브런치"],
+    Group.GroupCategory.READING: ["독서", "인문학 토론", "영어 원서"],
+    Group.GroupCategory.OTHER: ["보드게임", "사진", "여행"],
+}
+
+
+@dataclass
+class SyntheticScale:
+    users: int = 50_000
+    groups: int = 10_000
+    members_per_group: int = 20
+    schedules: int = 50_000
+    rsvps: int = 1_000_000
+    posts: int = 500_000
+    transactions: int = 500_000
+
+
+def _batched(rows, batch_size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class SyntheticDataGenerator:
+    def __init__(self, scale, batch_size=2000, seed=None, log=None):
+        self.scale = scale
+        self.batch_size = batch_size
+        self.random = random.Random(seed)
+        # 여러 번 실행해도 이메일/닉네임이 겹치지 않도록 실행마다 구분값을 붙인다
+        self.tag = secrets.token_hex(3) if seed is None else f"s{seed}"
+        self.log = log or (lambda message: None)
+        self.counts = {}
+
+    def _insert(self, model, rows):
+        """rows(iterable)를 batch_size 씩 bulk_create 하고, 생성된 pk 목록을 반환."""
+        pks = []
+        for batch in _batched(rows, self.batch_size):
+            created = model.objects.bulk_create(batch, batch_size=self.batch_size)
+            pks.extend(obj.pk for obj in created)
+        self.counts[model.__name__] = self.counts.get(model.__name__, 0) + len(pks)
+        self.log(f"{model.__name__}: {len(pks):,}")
+        return pks
+
+    def run(self):
+        with transaction.atomic():
+            user_ids = self._users()
+            group_ids, members_by_group = self._groups(user_ids)
+            schedule_groups = self._schedules(group_ids)
+            self._rsvps(schedule_groups, members_by_group)
+            self._posts(group_ids, members_by_group)
+            self._transactions(group_ids, members_by_group)
+
+            # bulk_create 는 신호/카운터를 거치지 않으므로 원본 기준으로 다시 계산
+            # (IN 절 파라미터 수 제한 때문에 모임을 나눠서)
+            for chunk in _batched(group_ids, RECOUNT_CHUNK_SIZE):
+                recount_member_counts(chunk)
+                verify_ledger(chunk, fix=True)
+        bump_version(FACETS_VERSION_KEY)
+        return self.counts
+
+    def _users(self):
+        # 로그인 가능한 비밀번호 해시는 한 번만 계산해 모두에게 쓴다 (비밀번호: synthetic)
+        password = make_password("synthetic")
+        regions = User.RegionChoices.values
+        return self._insert(User, (
+            User(
+                email=f"user{n}.{self.tag}@synthetic.test",
+                nickname=f"user{n}-{self.tag}",
+                password=password,
+                region=self.random.choice(regions),
+            )
+            for n in range(self.scale.users)
+        ))
+
+    def _groups(self, user_ids):
+        rnd = self.random
+        statuses = [Group.GroupStatus.RECRUITING] * 6 + [Group.GroupStatus.OPERATING] * 3 + [Group.GroupStatus.CLOSED]
+        leaders = [rnd.choice(user_ids) for _ in range(self.scale.groups)]
+
+        def build():
+            for n, leader_id in enumerate(leaders):
+                category = rnd.choice(Group.GroupCategory.values)
+                topic = rnd.choice(TOPICS[category])
+                yield Group(
+                    name=f"{rnd.choice(NAME_WORDS)} {topic} 모임 {n}",
+                    category=category,
+                    region=rnd.choice(REGIONS),
+                    status=rnd.choice(statuses),
+                    description=f"{topic}을(를) 좋아하는 사람들의 모임입니다. 매주 함께 활동해요.",
+                    max_members=rnd.choice([10, 20, 30, 50, 100]),
+                    leader_id=leader_id,
+                )
+
+        group_ids = self._insert(Group, build())
+
+        # 모임마다 리더 + 무작위 멤버 (일부는 가입 대기)
+        members_by_group = {}
+        member_rows = []
+        for group_id, leader_id in zip(group_ids, leaders):
+            size = min(len(user_ids), max(1, int(rnd.expovariate(1 / self.scale.members_per_group))))
+            members = set(rnd.sample(user_ids, size)) - {leader_id}
+            members_by_group[group_id] = [leader_id, *members]
+            member_rows.append((group_id, leader_id, GroupMember.MemberRole.LEADER))
+            for user_id in members:
+                role = GroupMember.MemberRole.PENDING if rnd.random() < 0.1 else GroupMember.MemberRole.MEMBER
+                member_rows.append((group_id, user_id, role))
+
+        self._insert(GroupMember, (
+            GroupMember(group_id=group_id, user_id=user_id, member_role=role)
+            for group_id, user_id, role in member_rows
+        ))
+        return group_ids, members_by_group
+
+    def _schedules(self, group_ids):
+        rnd = self.random
+        now = timezone.now()
+        group_of = [rnd.choice(group_ids) for _ in range(self.scale.schedules)]
+        schedule_ids = self._insert(ActivitySchedule, (
+            ActivitySchedule(
+                group_id=group_id,
+                title=f"정기 모임 {n}",
+                date_time=now + timedelta(days=rnd.randint(-180, 90), hours=rnd.randint(8, 21)),
+                location=rnd.choice(REGIONS),
+                content="",
+                participation_fee=rnd.choice([0, 0, 5000, 10000]),
+            )
+            for n, group_id in enumerate(group_of)
+        ))
+        return list(zip(schedule_ids, group_of))
+
+    def _rsvps(self, schedule_groups, members_by_group):
+        if not schedule_groups:
+            return
+        rnd = self.random
+        per_schedule = -(-self.scale.rsvps // len(schedule_groups))
+        statuses = RSVP.AttendanceStatus.values
+
+        def build():
+            remaining = self.scale.rsvps
+            for schedule_id, group_id in schedule_groups:
+                members = members_by_group[group_id]
+                for user_id in rnd.sample(members, min(len(members), per_schedule, remaining)):
+                    remaining -= 1
+                    yield RSVP(schedule_id=schedule_id, user_id=user_id, attendance_status=rnd.choice(statuses))
+                if remaining <= 0:
+                    return
+
+        self._insert(RSVP, build())
+
+    def _posts(self, group_ids, members_by_group):
+        rnd = self.random
+
+        def build():
+            for n in range(self.scale.posts):
+                group_id = rnd.choice(group_ids)
+                yield BoardPost(
+                    group_id=group_id,
+                    author_id=rnd.choice(members_by_group[group_id]),
+                    title=f"게시글 {n}",
+                    content="합성 데이터 게시글입니다.",
+                    is_notice=rnd.random() < 0.02,
+                    views=rnd.randint(0, 500),
+                )
+
+        self._insert(BoardPost, build())
+
+    def _transactions(self, group_ids, members_by_group):
+        rnd = self.random
+        today = timezone.localdate()
+
+        def build():
+            for n in range(self.scale.transactions):
+                group_id = rnd.choice(group_ids)
+                amount = rnd.choice([10000, 20000, 30000]) if rnd.random() < 0.6 else -rnd.randint(1, 50) * 1000
+                yield FinancialTransaction(
+                    group_id=group_id,
+                    user_id=rnd.choice(members_by_group[group_id]),
+                    amount=amount,
+                    description="회비" if amount > 0 else "활동비",
+                    transaction_date=today - timedelta(days=rnd.randint(0, 730)),
+                )
+
+        self._insert(FinancialTransaction, build())
@@ -1,3 +1,1545 @@
-from django.test import TestCase
+import base64
+import logging
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from functools import partial
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+
+from django.db import connection, connections, transaction
+from django.core import checks
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.http import HttpResponse, QueryDict
+from django.test import Client, RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from . import api
+from .async_loaders import gather_sections, run_section
+from .bank_import import import_statement
+from .calendar_feeds import calendar_token
+from .benchmarks import BenchmarkFixtures, BenchmarkRunner, compare, percentile
+from .cache_versions import check_shared_cache, shared_cache_enabled
+from .counters import recount_member_counts
+from .dashboard import FEED_LIMIT
+from .facets import VISIBLE_STATUSES
+from .group_cache import cached_group_section
+from .ledger import record_transaction, verify_ledger
+from .loaders import DETAIL_QUERY_COUNT, TAB_LOADERS, TAB_PAGE_SIZE
+from .membership import is_active_member, is_leader, is_manager, role_in
+from .middleware import PrimaryPinningMiddleware, QueryInstrumentationMiddleware, QueryRecorder
+from .moderation import APPROVE, REJECT, approve_pending_member, moderate_pending_members, reject_pending_member
+from .pagination import encode_cursor, encode_rank_cursor
+from .recommendations import CandidateIndex, compute_recommendations, recommended_groups, top_groups
+from .search import search_groups
+from .routers import PIN_COOKIE, PrimaryReplicaRouter, primary_reads, replica_reads, routing_state
+from .synthetic import SyntheticDataGenerator, SyntheticScale
+from .models import (
+    User,
+    Group,
+    GroupMember,
+    ActivitySchedule,
+    RSVP,
+    FinancialTransaction,
+    BoardPost,
+    GroupRecommendation,
+)
+from .view_counter import DIRTY_SEQ_KEY, HOLE_GRACE, KEY_PREFIX, flush_on_shutdown, flush_view_counts, record_view
+
+# 테스트는 한 프로세스에서 돌므로 LocMem 이어도 버전 캐시와 cached_db 세션을 켠다 (settings.SHARED_CACHE)
+_single_process_cache = override_settings(
+    CACHE_SINGLE_PROCESS=True, SESSION_ENGINE="django.contrib.sessions.backends.cached_db",
+)
+
+
+def setUpModule():
+    _single_process_cache.enable()
+
+
+def tearDownModule():
+    # 테스트 DB 가 없어진 뒤 종료 시 조회수 반영(atexit)이 개발 DB 에 쓰지 않도록 버퍼를 비운다
+    cache.clear()
+    _single_process_cache.disable()
+
+
+def _b64(raw):
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def make_user(nickname, **fields):
+    return User.objects.create_user(email=f"{nickname}@test.com", nickname=nickname, **fields)
+
+
+def make_group(leader, name="모임", **fields):
+    """leader 가 만든 모임 (리더 GroupMember 포함). fields 로 Group 필드를 덮어쓴다.
+
+    멤버 수는 GroupMember 에서 세므로 member_count / pending_count 는 넘기지 않는다.
+    """
+    group = Group.objects.create(**{
+        "name": name, "category": Group.GroupCategory.OTHER, "region": "서울",
+        "description": "소개", "max_members": 10, "leader": leader,
+        **fields,
+    })
+    GroupMember.objects.create(user=leader, group=group, member_role=GroupMember.MemberRole.LEADER)
+    group.refresh_from_db()
+    return group
+
+
+def add_member(group, user, role=GroupMember.MemberRole.MEMBER):
+    return GroupMember.objects.create(user=user, group=group, member_role=role)
+
+
+class ClubTestCase(TestCase):
+    """리더 한 명이 만든 모임 하나(cls.leader / cls.group)로 시작한다. 테스트마다 캐시를 비운다."""
+
+    # Group 필드 덮어쓰기
+    group_fields = {}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.leader = make_user("leader")
+        cls.group = make_group(cls.leader, **cls.group_fields)
+
+    def setUp(self):
+        cache.clear()
+
+
+class GroupDetailQueryCountTests(ClubTestCase):
+    """모임 상세 페이지와 탭 프래그먼트는 데이터 양과 상관없이 같은 수의 쿼리로 렌더링되어야 한다."""
+
+    group_fields = {"name": "주말 농구", "category": Group.GroupCategory.SPORTS, "max_members": 100}
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse("Wiki:group_detail", kwargs={"group_id": cls.group.id})
+
+    def setUp(self):
+        super().setUp()
+        self.seq = 0
+
+    def add_activity(self, count):
+        with self.captureOnCommitCallbacks(execute=True):
+            self._add_activity(count)
+
+    def _add_activity(self, count):
+        for _ in range(count):
+            self.seq += 1
+            seq = self.seq
+            user = make_user(f"user{seq}")
+            add_member(self.group, user)
+            schedule = ActivitySchedule.objects.create(
+                group=self.group, title=f"일정 {seq}", date_time=timezone.now() + timedelta(days=seq),
+                location="체육관", content="", creator=self.leader,
+            )
+            RSVP.objects.create(user=user, schedule=schedule, attendance_status=RSVP.AttendanceStatus.ATTENDING)
+            BoardPost.objects.create(group=self.group, author=user, title=f"글 {seq}", content="내용")
+            tx = FinancialTransaction.objects.create(group=self.group, user=user, amount=1000, description="회비")
+            record_transaction(tx)
+
+    def tab_url(self, tab_name):
+        return reverse("Wiki:group_tab", kwargs={"group_id": self.group.id, "tab_name": tab_name})
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_detail_page_only_loads_intro(self):
+        self.add_activity(3)
+        with self.assertNumQueries(DETAIL_QUERY_COUNT):
+            response = self.client.get(self.url)
+        self.assertNotIn("activities", response.context["club"])
+
+    def test_tab_query_count_does_not_grow_with_group_size(self):
+        self.add_activity(1)
+        small = {tab: self.count_queries(self.tab_url(tab)) for tab in TAB_LOADERS}
+
+        self.add_activity(TAB_PAGE_SIZE + 5)
+        large = {tab: self.count_queries(self.tab_url(tab)) for tab in TAB_LOADERS}
+        self.assertEqual(small, large)
+
+    def test_tab_pagination_and_attendee_counts(self):
+        self.add_activity(TAB_PAGE_SIZE + 5)
+        response = self.client.get(self.tab_url("schedule"))
+        self.assertEqual(len(response.context["activities"]), TAB_PAGE_SIZE)
+        self.assertEqual(response.context["activities"][0]["attendees"], 1)
+
+        response = self.client.get(self.tab_url("finance"), {"page": 2})
+        self.assertEqual(len(response.context["finance"]["transactions"]), 5)
+        self.assertEqual(response.context["finance"]["current_balance"], (TAB_PAGE_SIZE + 5) * 1000)
+
+    def test_membership_flags(self):
+        self.client.force_login(self.leader)
+        # 사용자 조회 1회, 내 역할 조회 1회 (세션은 캐시에서)
+        with self.assertNumQueries(DETAIL_QUERY_COUNT + 2):
+            response = self.client.get(self.url)
+        self.assertTrue(response.context["is_leader"])
+        self.assertTrue(response.context["is_member"])
+        # 두 번째 방문부터는 세션 / 사용자 / 역할 / 요약 모두 캐시에서
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+    def test_unknown_tab_is_404(self):
+        self.assertEqual(self.client.get(self.tab_url("chat")).status_code, 404)
+
+    def test_sections_are_cached_until_group_changes(self):
+        self.add_activity(2)
+        self.client.get(self.url)
+        self.client.get(self.tab_url("board"))
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+            self.client.get(self.tab_url("board"))
+
+        self.client.force_login(self.leader)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse("Wiki:board_post_create", kwargs={"group_id": self.group.id}),
+                {"title": "새 공지", "content": "내용", "is_notice": "on"},
+            )
+        response = self.client.get(self.tab_url("board"))
+        self.assertEqual(response.context["board_posts"][0]["title"], "새 공지")
+
+
+class LedgerTests(ClubTestCase):
+
+    def test_finance_create_updates_snapshot_and_monthly_rollup(self):
+        self.client.force_login(self.leader)
+        url = reverse("Wiki:finance_create", kwargs={"group_id": self.group.id})
+        self.client.post(url, {"amount": "30000", "description": "회비"})
+        self.client.post(url, {"amount": "-12000", "description": "대관료"})
+
+        ledger = self.group.ledger
+        self.assertEqual((ledger.balance, ledger.transaction_count), (18000, 2))
+        month = self.group.monthly_ledgers.get()
+        self.assertEqual((month.income, month.expense, month.net), (30000, 12000, 18000))
+        self.assertEqual(verify_ledger(), [])
+
+    def test_transaction_marks_group_changed_once(self):
+        with CaptureQueriesContext(connection) as queries, transaction.atomic():
+            record_transaction(FinancialTransaction.objects.create(group=self.group, amount=1000, description="회비"))
+        # 모임 변경 기록은 거래 저장 시그널에서 한 번만
+        updates = [query for query in queries if query["sql"].startswith('UPDATE "club_management_group"')]
+        self.assertEqual(len(updates), 1)
+
+    def test_verify_ledger_repairs_drift(self):
+        FinancialTransaction.objects.create(group=self.group, amount=5000, description="장부 누락")
+        self.assertEqual(len(verify_ledger()), 2)
+
+        verify_ledger(fix=True)
+        self.assertEqual(verify_ledger(), [])
+        self.assertEqual(self.group.ledger.balance, 5000)
+
+    def test_csv_export_streams_filtered_range(self):
+        for amount, description, day in [(10000, "1월 회비", "2024-01-10"), (-3000, "=SUM(A1)", "2024-02-05"), (7000, "3월 회비", "2024-03-01")]:
+            tx = FinancialTransaction.objects.create(group=self.group, user=self.leader, amount=amount, description=description)
+            FinancialTransaction.objects.filter(pk=tx.pk).update(transaction_date=day)
+
+        self.client.force_login(self.leader)
+        url = reverse("Wiki:finance_export", kwargs={"group_id": self.group.id})
+        response = self.client.get(url, {"start": "2024-02-01", "end": "2024-03-31"})
+
+        self.assertTrue(response.streaming)
+        lines = b"".join(response.streaming_content).decode("utf-8-sig").splitlines()
+        self.assertEqual(lines[1:], [
+            "2024-02-05,지출,-3000,'=SUM(A1),leader",
+            "2024-03-01,수입,7000,3월 회비,leader",
+        ])
+
+    async def test_csv_export_streams_asynchronously_under_asgi(self):
+        for i in range(3):
+            await FinancialTransaction.objects.acreate(group=self.group, user=self.leader, amount=1000, description=f"회비 {i}")
+        await self.async_client.aforce_login(self.leader)
+        url = reverse("Wiki:finance_export", kwargs={"group_id": self.group.id})
+        with mock.patch("club_management.streaming.CHUNK_ITEMS", 2):
+            response = await self.async_client.get(url)
+
+        # 동기 제너레이터를 넘기면 Django 가 응답 전체를 모은 뒤 보낸다
+        self.assertTrue(response.is_async)
+        lines = b"".join([chunk async for chunk in response.streaming_content]).decode("utf-8-sig").splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[3].endswith("회비 2,leader"))
+
+    def test_bank_statement_import_skips_bad_rows_and_reimports(self):
+        statement = (
+            "거래일,적요,입금,출금\n"
+            "2024.05.01,회비 김철수,\"30,000\",\n"
+            "2024.05.01,회비 김철수,\"30,000\",\n"
+            "2024.05.03,대관료,,15000\n"
+            "2024.13.01,잘못된 날짜,1000,\n"
+        ).encode("cp949")
+        self.client.force_login(self.leader)
+        url = reverse("Wiki:finance_import", kwargs={"group_id": self.group.id})
+
+        def upload():
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(url, {
+                    "statement": SimpleUploadedFile("bank.csv", statement, content_type="text/csv"),
+                    "encoding": "cp949",
+                })
+            return response.context["result"]
+
+        result = upload()
+        self.assertEqual((result.created, result.duplicates, result.error_count), (3, 0, 1))
+        self.assertEqual(result.errors[0][0], 5)
+        self.assertEqual(self.group.ledger.balance, 45000)
+
+        # 같은 내역을 다시 올리면 모두 중복으로 건너뛴다
+        result = upload()
+        self.assertEqual((result.created, result.duplicates), (0, 3))
+        self.assertEqual(FinancialTransaction.objects.filter(group=self.group).count(), 3)
+        self.assertEqual(verify_ledger(), [])
+
+        # 동시에 같은 내역을 가져온 요청이 중복 확인 뒤에 먼저 넣은 경우: 오류 없이 중복으로 센다
+        with mock.patch("club_management.bank_import._existing_hashes", return_value=set()):
+            result = upload()
+        self.assertEqual((result.created, result.duplicates), (0, 3))
+        self.assertEqual(verify_ledger(), [])
+
+    def test_import_keeps_leading_quote_unless_it_escapes_a_formula(self):
+        lines = ["날짜,내용,금액", "2024-05-01,'=SUM(A1),1000", "2024-05-02,'90s 파티,2000"]
+        import_statement(self.group, lines)
+        self.assertEqual(
+            sorted(FinancialTransaction.objects.filter(group=self.group).values_list("description", flat=True)),
+            ["'90s 파티", "=SUM(A1)"],
+        )
+
+
+@override_settings(VIEW_COUNT_FLUSH_INTERVAL=3600)
+class BoardPostViewCounterTests(ClubTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.post = BoardPost.objects.create(group=cls.group, author=cls.leader, title="공지", content="합주 일정", is_notice=True)
+        cls.url = reverse("Wiki:board_post_detail", kwargs={"group_id": cls.group.id, "post_id": cls.post.id})
+
+    def test_views_are_buffered_until_flush(self):
+        for _ in range(3):
+            response = self.client.get(self.url)
+        self.assertEqual(response.context["views"], 3)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views, 0)
+
+        self.assertEqual(flush_view_counts(), 3)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views, 3)
+        self.assertEqual(flush_view_counts(), 0)
+
+    def views(self):
+        return BoardPost.objects.get(pk=self.post.pk).views
+
+    def test_views_between_read_and_reset_are_kept(self):
+        for _ in range(3):
+            record_view(self.post.id)
+        decr = cache.decr
+
+        def view_then_decr(key, delta):
+            # 반영이 카운터를 읽은 뒤, decr 하기 전에 조회가 들어온 경우
+            record_view(self.post.id)
+            return decr(key, delta)
+
+        with mock.patch.object(cache, "decr", side_effect=view_then_decr):
+            self.assertEqual(flush_view_counts(), 3)
+        self.assertEqual(flush_view_counts(), 1)
+        self.assertEqual(self.views(), 4)
+
+    def test_unfilled_log_slot_waits_then_is_skipped(self):
+        # 순번만 받고 아직 칸을 채우지 못한 요청
+        cache.add(DIRTY_SEQ_KEY, 0, None)
+        cache.incr(DIRTY_SEQ_KEY)
+        record_view(self.post.id)
+        self.assertEqual(flush_view_counts(), 0)
+
+        with mock.patch("club_management.view_counter.time.time", return_value=time.time() + HOLE_GRACE):
+            self.assertEqual(flush_view_counts(), 1)
+        self.assertEqual(self.views(), 1)
+
+    def test_skipped_slot_falls_back_to_counter_sweep(self):
+        # 카운터를 0 → 1 로 올리고 순번까지 받은 뒤 칸을 채우지 못하고 끝난 요청
+        cache.set(f"{KEY_PREFIX}:{self.post.id}", 1)
+        cache.add(DIRTY_SEQ_KEY, 0, None)
+        cache.incr(DIRTY_SEQ_KEY)
+        # 카운터가 0 이 아니므로 뒤의 조회는 로그에 오르지 않는다
+        record_view(self.post.id)
+        self.assertEqual(flush_view_counts(), 0)
+
+        with mock.patch("club_management.view_counter.time.time", return_value=time.time() + HOLE_GRACE):
+            self.assertEqual(flush_view_counts(), 2)
+        self.assertEqual(self.views(), 2)
+
+    def test_flush_inside_request_does_not_pin_primary(self):
+        record_view(self.post.id)
+        with routing_state() as state:
+            self.assertEqual(flush_view_counts(), 1)
+        self.assertFalse(state.wrote)
+        self.assertEqual(self.views(), 1)
+
+    def test_shutdown_flush_skips_db_when_nothing_is_buffered(self):
+        with self.assertNumQueries(0):
+            flush_on_shutdown()
+        record_view(self.post.id)
+        flush_on_shutdown()
+        self.assertEqual(self.views(), 1)
+
+
+class DiscoveryFacetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        leader = make_user("leader")
+        for category, region in [("SPORTS", "서울"), ("SPORTS", "경기"), ("ART", "서울")]:
+            make_group(leader, f"{category} 모임", category=category, region=region)
+
+    def setUp(self):
+        cache.clear()
+
+    def facets(self, **params):
+        response = self.client.get(reverse("Wiki:discovery"), params)
+        categories = {code: count for code, label, count in response.context["categories"]}
+        return categories, dict(response.context["regions"])
+
+    def test_counts_follow_other_filters(self):
+        categories, regions = self.facets(region="서울")
+        self.assertEqual((categories["SPORTS"], categories["ART"]), (1, 1))
+        self.assertEqual(regions, {"서울": 2, "경기": 1})
+
+        categories, regions = self.facets(category="SPORTS")
+        self.assertEqual(categories["SPORTS"], 2)
+        self.assertEqual(regions, {"서울": 1, "경기": 1})
+
+    def test_cached_facets_follow_status_changes(self):
+        self.facets()
+        group = Group.objects.get(category="ART")
+        with self.captureOnCommitCallbacks(execute=True):
+            group.status = Group.GroupStatus.CLOSED
+            group.save()
+
+        # 상태 변경 후 첫 요청에서 다시 집계하고, 그다음부터는 캐시에서
+        categories, regions = self.facets()
+        self.assertEqual(categories["ART"], 0)
+        self.assertEqual(regions, {"서울": 1, "경기": 1})
+        with self.assertNumQueries(1):
+            self.assertEqual(self.facets(), (categories, regions))
+
+        # 집계에 영향 없는 변경은 캐시를 버리지 않는다. 저장 전 값은 다시 읽지 않고 읽어둔 값과 비교한다
+        with self.captureOnCommitCallbacks(execute=True), self.assertNumQueries(1):
+            group.description = "바뀐 소개"
+            group.save()
+        with self.assertNumQueries(1):
+            self.facets()
+
+        # 같은 객체를 다시 저장할 때는 마지막으로 저장한 값과 비교한다
+        with self.captureOnCommitCallbacks(execute=True):
+            group.status = Group.GroupStatus.RECRUITING
+            group.save()
+        self.assertEqual(self.facets()[0]["ART"], 1)
+
+
+class SearchTests(ClubTestCase):
+    group_fields = {"name": "주말 농구 동호회", "category": Group.GroupCategory.SPORTS, "description": "매주 토요일"}
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # 검색어가 이름에 있는 모임이 소개에만 있는 모임보다 앞선다
+        cls.by_description = make_group(cls.leader, "토요 모임", description="가끔 농구 동호회 친선 경기")
+        cls.art = make_group(cls.leader, "농구 동호회 그림반", category=Group.GroupCategory.ART)
+
+    def names(self, groups):
+        return [group.name for group in groups]
+
+    def search(self, query, queryset=None, **kwargs):
+        return search_groups(queryset if queryset is not None else Group.objects.all(), query, **kwargs)
+
+    def test_ranks_name_matches_first(self):
+        groups, ranked = self.search("동호회")
+        self.assertTrue(ranked)
+        self.assertEqual(self.names(groups)[-1], "토요 모임")
+        self.assertEqual(set(self.names(groups)), {"주말 농구 동호회", "토요 모임", "농구 동호회 그림반"})
+
+    def test_filters_apply_before_limit(self):
+        # 전체 상위 1개가 아니라 ART 모임 중 상위 1개
+        groups, _ = self.search("동호회", Group.objects.filter(category=Group.GroupCategory.ART), limit=1)
+        self.assertEqual(self.names(groups), ["농구 동호회 그림반"])
+        groups, _ = self.search("동호회", Group.objects.exclude(pk__in=[self.group.pk, self.art.pk]), limit=1)
+        self.assertEqual(self.names(groups), ["토요 모임"])
+
+    def test_short_terms_fall_back_to_contains(self):
+        groups, ranked = self.search("농구")
+        self.assertFalse(ranked)
+        self.assertEqual(len(groups), 3)
+        # 긴 검색어는 인덱스로, 짧은 검색어는 icontains 로 함께 거른다
+        groups, ranked = self.search("그림 동호회")
+        self.assertTrue(ranked)
+        self.assertEqual(self.names(groups), ["농구 동호회 그림반"])
+
+    def test_index_follows_insert_update_delete(self):
+        created = make_group(self.leader, "배드민턴 클럽")
+        self.assertEqual(self.names(self.search("배드민턴")[0]), ["배드민턴 클럽"])
+
+        Group.objects.filter(pk=created.pk).update(name="탁구 클럽")
+        self.assertEqual(self.names(self.search("배드민턴")[0]), [])
+        self.assertEqual(self.names(self.search("탁구 클럽")[0]), ["탁구 클럽"])
+
+        created.delete()
+        self.assertEqual(self.names(self.search("탁구 클럽")[0]), [])
+
+    def test_discovery_counts_all_matches_and_ranks_within_filter(self):
+        response = self.client.get(reverse("Wiki:discovery"), {"q": "동호회", "category": "ART"})
+        self.assertEqual([club.name for club in response.context["clubs"]], ["농구 동호회 그림반"])
+        counts = {code: count for code, _, count in response.context["categories"]}
+        self.assertEqual((counts["SPORTS"], counts["ART"], counts["OTHER"]), (1, 1, 1))
+
+
+class DiscoveryPaginationTests(ClubTestCase):
+    group_fields = {"name": "동호회 0"}
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.groups = [cls.group] + [make_group(cls.leader, f"동호회 {i}") for i in range(1, 7)]
+        # 개설 시각이 같은 모임들 (id 로 순서를 정한다)
+        same_time = timezone.now() - timedelta(days=1)
+        Group.objects.filter(pk__in=[group.pk for group in cls.groups[2:5]]).update(created_at=same_time)
+
+    def page(self, **params):
+        response = self.client.get(reverse("Wiki:discovery"), {"size": 3, **params})
+        clubs = [club.id for club in response.context["clubs"]]
+        query = response.context["next_page_query"]
+        return clubs, QueryDict(query).get("cursor") if query else None
+
+    def walk(self, **params):
+        pages, cursor = [], None
+        while True:
+            clubs, cursor = self.page(**params, **({"cursor": cursor} if cursor else {}))
+            pages.append(clubs)
+            if cursor is None:
+                return pages
+
+    def test_keyset_pages_cover_ties_once(self):
+        pages = self.walk()
+        expected = list(
+            Group.objects.order_by("-created_at", "-pk").values_list("pk", flat=True)
+        )
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual(sum(pages, []), expected)
+
+    def test_last_full_page_has_no_cursor(self):
+        self.assertEqual([len(page) for page in self.walk(size=7)], [7])
+
+    def test_ranked_search_pages_follow_rank(self):
+        ranked, _ = search_groups(Group.objects.filter(status__in=VISIBLE_STATUSES), "동호회")
+        pages = self.walk(q="동호회")
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual(sum(pages, []), [group.pk for group in ranked])
+
+    def test_malformed_or_tampered_cursors_start_over(self):
+        first_page, _ = self.page()
+        ranked_first, _ = self.page(q="동호회")
+        for cursor in ["!!!", "abc", "YQ", encode_rank_cursor(3), _b64("2024-01-01T00:00:00|99999999999999999999999")]:
+            self.assertEqual(self.page(cursor=cursor)[0], first_page, cursor)
+        for cursor in ["!!!", encode_cursor(timezone.now(), 1), _b64("rank|-3"), _b64("rank|100000000000000000000")]:
+            self.assertEqual(self.page(q="동호회", cursor=cursor)[0], ranked_first, cursor)
+
+
+class BulkModerationTests(ClubTestCase):
+    group_fields = {"max_members": 3}
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.pending = [add_member(cls.group, make_user(f"p{i}"), GroupMember.MemberRole.PENDING) for i in range(4)]
+        cls.url = reverse("Wiki:member_bulk_moderate", kwargs={"group_id": cls.group.id})
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.leader)
+
+    def roles(self):
+        return list(
+            GroupMember.objects.filter(pk__in=[m.pk for m in self.pending])
+            .order_by("pk").values_list("member_role", flat=True)
+        )
+
+    def test_approve_all_stops_at_capacity(self):
+        self.client.post(self.url, {"action": "approve", "all_pending": "1"})
+
+        self.assertEqual(self.roles(), ["MEMBER", "MEMBER", "PENDING", "PENDING"])
+        self.group.refresh_from_db()
+        self.assertEqual((self.group.member_count, self.group.pending_count), (3, 2))
+
+    def test_reject_selected(self):
+        ids = [self.pending[0].pk, self.pending[2].pk]
+        self.client.post(self.url, {"action": "reject", "member_ids": ids})
+
+        self.assertEqual(self.roles(), ["PENDING", "PENDING"])
+        self.group.refresh_from_db()
+        self.assertEqual((self.group.member_count, self.group.pending_count), (1, 2))
+
+    def test_reject_batch_writes_once(self):
+        applicants = [make_user(f"extra{i}") for i in range(50)]
+        GroupMember.objects.bulk_create(
+            GroupMember(user=user, group=self.group, member_role=GroupMember.MemberRole.PENDING) for user in applicants
+        )
+        for user in applicants:
+            role_in(user, self.group.id)
+
+        # SAVEPOINT + 모임 잠금 + 대기 신청 조회 + 지울 행 조회(delete 시그널용) + DELETE 1회
+        # + 멤버 수 UPDATE 1회 + RELEASE (신청 수와 무관)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks, self.assertNumQueries(7):
+            result = moderate_pending_members(self.group, REJECT)
+        # 커밋 후 작업도 모임 버전 / 역할 캐시 무효화 한 번씩
+        self.assertEqual(len(callbacks), 2)
+
+        self.assertEqual(len(result["rejected"]), 54)
+        self.assertEqual(Group.objects.get(pk=self.group.pk).pending_count, 0)
+        self.assertIsNone(role_in(User.objects.get(pk=applicants[0].pk), self.group.id))
+
+    def test_only_leader_can_moderate(self):
+        self.client.force_login(self.pending[0].user)
+        self.client.post(self.url, {"action": "approve", "all_pending": "1"})
+        self.assertEqual(self.roles(), ["PENDING"] * 4)
+
+
+class MemberCountTests(ClubTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.applicant = add_member(cls.group, make_user("applicant"), GroupMember.MemberRole.PENDING)
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.leader)
+
+    def post(self, name):
+        return self.client.post(reverse(f"Wiki:{name}", kwargs={"group_id": self.group.id, "member_id": self.applicant.id}))
+
+    def counts(self):
+        return tuple(Group.objects.filter(pk=self.group.pk).values_list("member_count", "pending_count").get())
+
+    def test_approve_counts_once(self):
+        self.post("member_approve")
+        # 먼저 처리된 요청 뒤에 도착한 승인/거절은 아무것도 바꾸지 않는다
+        self.post("member_approve")
+        self.post("member_reject")
+        self.assertEqual(self.counts(), (2, 0))
+        self.assertEqual(GroupMember.objects.get(pk=self.applicant.pk).member_role, GroupMember.MemberRole.MEMBER)
+
+    def test_reject_counts_once(self):
+        self.post("member_reject")
+        # 대기 수가 0 아래로 내려가지 않는다 (pending_count >= 0 제약)
+        self.post("member_reject")
+        self.post("member_approve")
+        self.assertEqual(self.counts(), (1, 0))
+        self.assertFalse(GroupMember.objects.filter(pk=self.applicant.pk).exists())
+
+    def test_counts_follow_changes_outside_views(self):
+        # 시그널 없이 만든 신청(대기 수 0)도 거절할 수 있고, 거절 후 다시 센 값이 저장된다
+        stray = GroupMember.objects.bulk_create([
+            GroupMember(user=make_user("stray"), group=self.group, member_role=GroupMember.MemberRole.PENDING),
+        ])[0]
+        Group.objects.filter(pk=self.group.pk).update(pending_count=0)
+        response = self.client.post(reverse("Wiki:member_reject", kwargs={"group_id": self.group.id, "member_id": stray.id}))
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(GroupMember.objects.filter(pk=stray.pk).exists())
+        self.assertEqual(self.counts(), (1, 1))
+
+        # admin 에서 역할 변경, 사용자 삭제(CASCADE)
+        self.applicant.member_role = GroupMember.MemberRole.MEMBER
+        self.applicant.save()
+        self.assertEqual(self.counts(), (2, 0))
+        self.applicant.user.delete()
+        self.assertEqual(self.counts(), (1, 0))
+
+    def test_stale_pending_check_does_not_double_count(self):
+        # 화면을 읽은 뒤 다른 요청이 먼저 승인한 경우
+        GroupMember.objects.filter(pk=self.applicant.pk).update(member_role=GroupMember.MemberRole.MEMBER)
+        Group.objects.filter(pk=self.group.pk).update(member_count=2, pending_count=0)
+        self.assertFalse(approve_pending_member(self.applicant))
+        self.assertFalse(reject_pending_member(self.applicant))
+        self.assertEqual(self.counts(), (2, 0))
+
+    def test_recount_fixes_drifted_counts(self):
+        other = make_group(self.leader, "다른 모임")
+        Group.objects.filter(pk__in=[self.group.pk, other.pk]).update(member_count=7, pending_count=3)
+
+        self.assertEqual(recount_member_counts([other.pk]), 1)
+        self.assertEqual(recount_member_counts(), 1)
+        self.assertEqual(self.counts(), (1, 1))
+        self.assertEqual(Group.objects.get(pk=other.pk).member_count, 1)
+        self.assertEqual(recount_member_counts(), 0)
+
+
+class AttendanceCheckInTests(ClubTestCase):
+    group_fields = {"max_members": 100}
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.members = [make_user(f"m{i}") for i in range(30)]
+        GroupMember.objects.bulk_create(
+            GroupMember(user=user, group=cls.group, member_role=GroupMember.MemberRole.MEMBER)
+            for user in cls.members
+        )
+        cls.outsider = make_user("out")
+        cls.schedule = ActivitySchedule.objects.create(
+            group=cls.group, title="북한산", date_time=timezone.now(), location="북한산", content="",
+        )
+        # 미리 참석 응답한 멤버는 출석 체크로 상태가 덮어써져야 한다
+        RSVP.objects.create(user=cls.members[0], schedule=cls.schedule, attendance_status=RSVP.AttendanceStatus.ATTENDING)
+        cls.url = reverse("Wiki:schedule_attendance", kwargs={"group_id": cls.group.id, "schedule_id": cls.schedule.id})
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.leader)
+
+    def test_whole_sheet_is_saved_with_constant_queries(self):
+        response = self.client.get(self.url)
+        self.assertEqual(len(response.context["sheet"]), 31)
+
+        data = {f"status_{user.id}": "PRESENT" for user in self.members}
+        data[f"status_{self.members[1].id}"] = "ABSENT"
+        data[f"status_{self.outsider.id}"] = "PRESENT"
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.post(self.url, data)
+        writes = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT INTO \"club_management_rsvp\"")]
+        self.assertEqual(len(writes), 1)
+
+        statuses = dict(RSVP.objects.filter(schedule=self.schedule).values_list("user_id", "attendance_status"))
+        self.assertEqual(len(statuses), 30)
+        self.assertEqual(statuses[self.members[0].id], "PRESENT")
+        self.assertEqual(statuses[self.members[1].id], "ABSENT")
+        self.assertNotIn(self.outsider.id, statuses)
+
+    def test_members_cannot_check_in(self):
+        self.client.force_login(self.members[0])
+        self.client.post(self.url, {f"status_{self.members[0].id}": "PRESENT"})
+        self.assertEqual(
+            RSVP.objects.get(user=self.members[0], schedule=self.schedule).attendance_status,
+            RSVP.AttendanceStatus.ATTENDING,
+        )
+
+
+class QueryPlanTests(TestCase):
+    """주요 화면의 쿼리가 인덱스를 타는지 EXPLAIN QUERY PLAN 으로 확인한다. (SQLite)"""
+
+    # 인덱스 없이 테이블 전체를 읽는 계획 (FTS 가상 테이블은 제외)
+    FULL_SCAN = re.compile(r"^SCAN club_management_\w+\b(?! VIRTUAL TABLE)")
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.leader = make_user("leader")
+        groups = Group.objects.bulk_create(
+            Group(
+                name=f"농구 모임 {i}", category=Group.GroupCategory.SPORTS, region="서울",
+                description="주말 농구 동호회", max_members=50, leader=cls.leader,
+                status=Group.GroupStatus.CLOSED if i % 3 == 0 else Group.GroupStatus.RECRUITING,
+            )
+            for i in range(30)
+        )
+        cls.group = groups[1]
+        members = [make_user(f"m{i}") for i in range(10)]
+        GroupMember.objects.create(user=cls.leader, group=cls.group, member_role=GroupMember.MemberRole.LEADER)
+        GroupMember.objects.bulk_create(
+            GroupMember(user=user, group=cls.group, member_role=GroupMember.MemberRole.MEMBER if i % 2 else GroupMember.MemberRole.PENDING)
+            for i, user in enumerate(members)
+        )
+        cls.schedule = ActivitySchedule.objects.create(
+            group=cls.group, title="정기 모임", date_time=timezone.now(), location="체육관", content="",
+        )
+        RSVP.objects.bulk_create(RSVP(user=user, schedule=cls.schedule) for user in members)
+        BoardPost.objects.bulk_create(
+            BoardPost(group=cls.group, author=cls.leader, title=f"글 {i}", content="내용", is_notice=i == 0)
+            for i in range(5)
+        )
+        for i in range(5):
+            record_transaction(FinancialTransaction.objects.create(group=cls.group, amount=1000, description="회비"))
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.leader)
+
+    def query_plans(self, url, params=None):
+        """url 을 요청하며 실행된 SELECT 마다 (sql, 실행 계획 줄 목록)."""
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, params)
+            if response.streaming:
+                b"".join(response.streaming_content)
+        plans = []
+        with connection.cursor() as cursor:
+            for query in ctx.captured_queries:
+                if not query["sql"].startswith("SELECT"):
+                    continue
+                cursor.execute("EXPLAIN QUERY PLAN " + query["sql"])
+                plans.append((query["sql"], [row[-1] for row in cursor.fetchall()]))
+        return plans
+
+    def assertNoFullScans(self, url, params=None):
+        for sql, plan in self.query_plans(url, params):
+            scans = [line for line in plan if self.FULL_SCAN.match(line)]
+            self.assertEqual(scans, [], f"{url} 에서 전체 스캔: {sql}")
+
+    def assertUsesIndex(self, index_name, url, params=None):
+        lines = [line for sql, plan in self.query_plans(url, params) for line in plan]
+        self.assertTrue(any(index_name in line for line in lines), f"{url} 에서 {index_name} 미사용: {lines}")
+
+    def test_pages_do_not_scan_whole_tables(self):
+        group_kwargs = {"group_id": self.group.id}
+        pages = [
+            (reverse("Wiki:discovery"), None),
+            (reverse("Wiki:discovery"), {"category": "SPORTS", "region": "서울"}),
+            (reverse("Wiki:discovery"), {"q": "동호회"}),
+            (reverse("Wiki:group_detail", kwargs=group_kwargs), None),
+            (reverse("Wiki:schedule_attendance", kwargs={**group_kwargs, "schedule_id": self.schedule.id}), None),
+            (reverse("Wiki:finance_export", kwargs=group_kwargs), {"start": "2024-01-01"}),
+            (reverse("Wiki:api_group_list"), None),
+            (reverse("Wiki:api_group_detail", kwargs=group_kwargs), None),
+        ] + [
+            (reverse("Wiki:group_tab", kwargs={**group_kwargs, "tab_name": tab_name}), None)
+            for tab_name in TAB_LOADERS
+        ]
+        for url, params in pages:
+            with self.subTest(url=url, params=params):
+                self.assertNoFullScans(url, params)
+
+    def test_hot_filters_use_composite_indexes(self):
+        group_kwargs = {"group_id": self.group.id}
+        tab = lambda name: reverse("Wiki:group_tab", kwargs={**group_kwargs, "tab_name": name})
+        self.assertUsesIndex("group_status_created_idx", reverse("Wiki:discovery"))
+        self.assertUsesIndex("member_group_role_idx", tab("members"))
+        self.assertUsesIndex("post_group_notice_created_idx", tab("board"))
+        self.assertUsesIndex("rsvp_schedule_status_idx", tab("schedule"))
+        self.assertUsesIndex(
+            "finance_group_date_idx",
+            reverse("Wiki:finance_export", kwargs=group_kwargs), {"start": "2024-01-01", "end": "2030-12-31"},
+        )
+
+
+class QueryInstrumentationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        leader = make_user("leader")
+        for i in range(6):
+            make_group(leader, f"모임 {i}")
+
+    def test_server_timing_header_and_summary_log(self):
+        cache.clear()
+        with self.assertLogs("club_management.sql", "INFO") as logs:
+            response = self.client.get(reverse("Wiki:discovery"))
+
+        self.assertRegex(response["Server-Timing"], r'^db;dur=[\d.]+;desc="2 queries", app;dur=[\d.]+$')
+        summary = logs.records[0].sql_summary
+        self.assertEqual((summary["view"], summary["queries"], summary["repeated"]), ("Wiki:discovery", 2, []))
+
+    def test_summary_is_not_serialized_when_logging_is_off(self):
+        logger = logging.getLogger("club_management.sql")
+        self.addCleanup(logger.setLevel, logger.level)
+        logger.setLevel(logging.ERROR)
+        with mock.patch("club_management.middleware.json.dumps") as dumps:
+            response = self.client.get(reverse("Wiki:discovery"))
+        self.assertIn("Server-Timing", response)
+        dumps.assert_not_called()
+
+    def test_repeated_query_shapes_are_reported(self):
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            # 모임마다 멤버를 따로 세는 N+1
+            for group in Group.objects.all():
+                GroupMember.objects.filter(group=group).count()
+            list(Group.objects.filter(pk__in=[1, 2, 3]))
+            list(Group.objects.filter(pk__in=[4, 5]))
+
+        self.assertEqual(recorder.count, 9)
+        repeated = recorder.repeated(threshold=2)
+        self.assertEqual([n for shape, n in repeated], [6, 2])
+        self.assertIn("club_management_groupmember", repeated[0][0])
+
+    def test_async_mode_records_queries(self):
+        async def get_response(request):
+            await Group.objects.acount()
+            return HttpResponse()
+
+        middleware = QueryInstrumentationMiddleware(get_response)
+        # ASGI 에서 async 뷰를 스레드로 감싸지 않도록 코루틴 함수로 보인다
+        self.assertTrue(iscoroutinefunction(middleware))
+        response = async_to_sync(middleware)(RequestFactory().get("/"))
+        self.assertRegex(response["Server-Timing"], r'desc="1 queries"')
+
+
+class SyntheticBenchmarkTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        scale = SyntheticScale(
+            users=60, groups=12, members_per_group=8, schedules=20, rsvps=100, posts=40, transactions=50,
+        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.counts = SyntheticDataGenerator(scale, batch_size=25, seed=1).run()
+
+    def test_generated_data_is_consistent(self):
+        self.assertEqual(self.counts["User"], 60)
+        self.assertEqual(self.counts["Group"], 12)
+        self.assertEqual(self.counts["FinancialTransaction"], 50)
+        self.assertEqual(recount_member_counts(), 0)
+        self.assertEqual(verify_ledger(), [])
+
+    def test_runner_reports_percentiles_and_queries(self):
+        runner = BenchmarkRunner(BenchmarkFixtures(), iterations=3, warmup=1)
+        results = runner.run(["discovery", "group_detail", "finance_create"])
+
+        self.assertEqual(set(results), {"discovery", "group_detail", "finance_create"})
+        # 처음 방문하는 리더: 사용자 + 역할 조회 (세션은 캐시에서)
+        self.assertEqual(results["group_detail"]["queries"], DETAIL_QUERY_COUNT + 2)
+        self.assertLessEqual(results["discovery"]["p50"], results["discovery"]["p99"])
+        # 쓰기 시나리오는 롤백된다
+        self.assertEqual(FinancialTransaction.objects.count(), 50)
+
+    def test_percentile_and_compare(self):
+        self.assertEqual([percentile(range(1, 101), pct) for pct in (50, 95, 99)], [50, 95, 99])
+        baseline = {"discovery": {"p95": 10.0, "queries": 1}}
+        self.assertEqual(compare({"discovery": {"p95": 11.0, "queries": 1}}, baseline), [])
+        self.assertEqual(
+            [name for name, reason in compare({"discovery": {"p95": 20.0, "queries": 2}}, baseline)],
+            ["discovery", "discovery"],
+        )
+
+
+class GroupApiTests(ClubTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        ActivitySchedule.objects.create(
+            group=cls.group, title="정기전", date_time=timezone.now() + timedelta(days=3), location="구장", content="",
+        )
+        cls.detail_url = reverse("Wiki:api_group_detail", kwargs={"group_id": cls.group.id})
+        cls.list_url = reverse("Wiki:api_group_list")
+
+    def test_detail_revalidates_without_touching_child_tables(self):
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["upcoming_schedules"][0]["title"], "정기전")
+        etag = response["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+        # 하위 데이터가 바뀌면 updated_at 이 갱신되어 새 응답을 받는다
+        BoardPost.objects.create(group=self.group, author=self.leader, title="공지", content="내용", is_notice=True)
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json()["recent_posts"][0]["title"], "공지")
+
+    def test_list_etag_follows_page_contents(self):
+        response = self.client.get(self.list_url)
+        self.assertEqual([item["id"] for item in response.json()["results"]], [self.group.id])
+        etag = response["ETag"]
+        self.assertEqual(self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        add_member(self.group, make_user("new"))
+        self.assertEqual(self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_missing_group_is_json_404(self):
+        response = self.client.get(reverse("Wiki:api_group_detail", kwargs={"group_id": 999}))
+        self.assertEqual(response.status_code, 404)
+        self.assertIn("detail", response.json())
+
+
+class AsyncSectionTests(TransactionTestCase):
+    """병렬 모드에서는 섹션이 각자의 스레드/DB 연결에서 동시에 실행된다.
+
+    다른 연결이 데이터를 볼 수 있도록 TestCase(트랜잭션 롤백) 대신 TransactionTestCase 를 쓴다.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.leader = make_user("leader")
+        self.group = make_group(self.leader, "러닝 모임")
+        ActivitySchedule.objects.create(
+            group=self.group, title="한강 러닝", date_time=timezone.now() + timedelta(days=1), location="한강", content="",
+        )
+        BoardPost.objects.create(group=self.group, author=self.leader, title="첫 글", content="내용")
+
+    @override_settings(ASYNC_PARALLEL_SECTIONS=True)
+    def test_parallel_sections_overlap(self):
+        # 세 섹션이 모두 실행 중이어야 barrier 를 통과한다 (차례로 실행되면 timeout 으로 BrokenBarrierError)
+        barrier = threading.Barrier(3, timeout=5)
+
+        def section(value):
+            barrier.wait()
+            return value
+
+        sections = async_to_sync(gather_sections)(
+            **{name: run_section(partial(section, name)) for name in ("a", "b", "c")}
+        )
+        self.assertEqual(sections, {"a": "a", "b": "b", "c": "c"})
+
+    @override_settings(ASYNC_PARALLEL_SECTIONS=True)
+    def test_detail_api_sections_overlap(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def waiting(builder):
+            def run(*args):
+                barrier.wait()
+                return builder(*args)
+            return run
+
+        with (
+            mock.patch("club_management.api._detail_group", waiting(api._detail_group)),
+            mock.patch("club_management.api._detail_schedules", waiting(api._detail_schedules)),
+            mock.patch("club_management.api._detail_posts", waiting(api._detail_posts)),
+        ):
+            response = self.client.get(reverse("Wiki:api_group_detail", kwargs={"group_id": self.group.id}))
+        self.assertEqual(response.json()["upcoming_schedules"][0]["title"], "한강 러닝")
+
+    def test_section_thread_queries_are_counted(self):
+        url = reverse("Wiki:api_group_detail", kwargs={"group_id": self.group.id})
+
+        def queries(response):
+            return int(re.search(r'desc="(\d+) queries"', response["Server-Timing"]).group(1))
+
+        sequential = queries(self.client.get(url))
+        cache.clear()
+        with override_settings(ASYNC_PARALLEL_SECTIONS=True):
+            parallel = queries(self.client.get(url))
+        # 섹션 스레드의 연결에서 실행된 쿼리도 요청의 Server-Timing 에 들어간다
+        self.assertGreaterEqual(sequential, 3)
+        self.assertEqual(parallel, sequential)
+
+    def test_parallel_mode_returns_same_pages(self):
+        self.client.force_login(self.leader)
+        urls = [
+            reverse("Wiki:api_group_detail", kwargs={"group_id": self.group.id}),
+            reverse("Wiki:group_detail", kwargs={"group_id": self.group.id}),
+            reverse("Wiki:group_tab", kwargs={"group_id": self.group.id, "tab_name": "board"}),
+        ]
+        sequential = [self.client.get(url).content for url in urls]
+        cache.clear()
+        with override_settings(ASYNC_PARALLEL_SECTIONS=True):
+            parallel = [self.client.get(url).content for url in urls]
+        self.assertEqual(sequential, parallel)
+        self.assertIn("한강 러닝", parallel[0].decode())
+
+    async def test_detail_page_under_asgi(self):
+        response = await self.async_client.get(reverse("Wiki:group_detail", kwargs={"group_id": self.group.id}))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["club"]["name"], "러닝 모임")
+        self.assertIn("Server-Timing", response)
+
+
+WAL_PRAGMAS = {"journal_mode": "WAL", "synchronous": "NORMAL", "busy_timeout": 100, "temp_store": "MEMORY"}
+
+
+class SqliteProductionModeTests(SimpleTestCase):
+    """파일 DB 에 연결 두 개(쓰기/읽기)를 열어 쓰기 트랜잭션 중 읽기가 기다리는지 본다."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "bench.sqlite3")
+
+    def open(self, alias):
+        settings_dict = {**connection.settings_dict, "NAME": self.path, "CONN_MAX_AGE": 0}
+        wrapper = DatabaseWrapper(settings_dict, alias=alias)
+        wrapper.ensure_connection()
+        self.addCleanup(wrapper.close)
+        return wrapper
+
+    def read_while_writing(self):
+        """쓰기 연결이 커밋 직전(배타 잠금)인 동안 읽기 연결이 본 행 수. 잠겨 있으면 OperationalError."""
+        writer, reader = self.open("writer"), self.open("reader")
+        writer.connection.execute("CREATE TABLE ledger (amount INTEGER)")
+        writer.connection.execute("INSERT INTO ledger VALUES (1000)")
+        writer.connection.commit()
+
+        writer.connection.execute("BEGIN EXCLUSIVE")
+        writer.connection.execute("INSERT INTO ledger VALUES (2000)")
+        try:
+            return reader.connection.execute("SELECT COUNT(*) FROM ledger").fetchone()[0]
+        finally:
+            writer.connection.rollback()
+
+    @override_settings(SQLITE_PRAGMAS={"busy_timeout": 100})
+    def test_default_journal_blocks_readers(self):
+        with self.assertRaises(sqlite3.OperationalError):
+            self.read_while_writing()
+
+    @override_settings(SQLITE_PRAGMAS=WAL_PRAGMAS)
+    def test_wal_readers_do_not_wait_for_writer(self):
+        start = time.perf_counter()
+        # 커밋 전 행은 보이지 않고, busy_timeout 만큼 기다리지도 않는다
+        self.assertEqual(self.read_while_writing(), 1)
+        self.assertLess(time.perf_counter() - start, 0.1)
+
+    @override_settings(SQLITE_PRAGMAS=WAL_PRAGMAS)
+    def test_pragmas_applied_on_new_connections(self):
+        conn = self.open("pragmas").connection
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)
+        self.assertEqual(conn.execute("PRAGMA busy_timeout").fetchone()[0], 100)
+
+
+def with_replica(test_class):
+    """replica 가 설정된 것처럼 동작하게 한다 (라우터와 미들웨어 모두)."""
+    for target in ("club_management.routers.replica_available", "club_management.middleware.replica_available"):
+        test_class = mock.patch(target, return_value=True)(test_class)
+    return test_class
+
+
+@with_replica
+class ReplicaRoutingTests(SimpleTestCase):
+    router = PrimaryReplicaRouter()
+
+    def read_alias(self):
+        return self.router.db_for_read(Group)
+
+    def test_reads_go_to_replica_only_inside_marked_views(self, *_):
+        @replica_reads
+        def view():
+            before = self.read_alias()
+            self.router.db_for_write(Group)
+            return before, self.read_alias()
+
+        with routing_state():
+            self.assertEqual(self.read_alias(), "default")
+            # 쓰기 뒤의 읽기는 같은 요청 안에서 primary
+            self.assertEqual(view(), ("replica", "default"))
+
+        with routing_state(), primary_reads():
+            self.assertEqual(self.read_alias(), "default")
+
+    def test_writes_outside_requests_do_not_pin(self, *_):
+        # 관리 명령 / 스레드 / 태스크: 요청 상태가 없으면 쓰기를 기억하지 않는다
+        self.router.db_for_write(Group)
+        self.assertEqual(replica_reads(self.read_alias)(), "replica")
+
+    def test_writes_pin_the_next_requests_to_primary(self, *_):
+        seen = []
+
+        def get_response(request):
+            seen.append(replica_reads(self.read_alias)())
+            if request.method == "POST":
+                self.router.db_for_write(BoardPost)
+            return HttpResponse()
+
+        middleware = PrimaryPinningMiddleware(get_response)
+        factory = RequestFactory()
+
+        self.assertNotIn(PIN_COOKIE, middleware(factory.get("/")).cookies)
+        response = middleware(factory.post("/"))
+        self.assertIn(PIN_COOKIE, response.cookies)
+
+        # redirect 뒤의 GET 은 쿠키가 남아 있는 동안 primary 에서 읽는다
+        factory.cookies[PIN_COOKIE] = "1"
+        middleware(factory.get("/"))
+        self.assertEqual(seen, ["replica", "default", "default"])
+
+    def test_async_mode_pins_after_writes(self, *_):
+        seen = []
+
+        async def get_response(request):
+            seen.append(replica_reads(self.read_alias)())
+            # sync 코드(sync_to_async 스레드)에서 한 쓰기도 같은 요청 상태에 남는다
+            await sync_to_async(self.router.db_for_write)(BoardPost)
+            return HttpResponse()
+
+        middleware = PrimaryPinningMiddleware(get_response)
+        self.assertTrue(iscoroutinefunction(middleware))
+        response = async_to_sync(middleware)(RequestFactory().get("/"))
+        self.assertIn(PIN_COOKIE, response.cookies)
+        self.assertEqual(seen, ["replica"])
+
+
+@with_replica
+class ReplicaIntegrationTests(TestCase):
+    """두 번째 SQLite 파일을 replica 로 붙인다.
+
+    replica 는 시작 시점의 스키마만 복사한 별개 파일이므로, 복제되지 않은 데이터는 replica 읽기에서 보이지 않는다.
+    """
+
+    def setUp(self):
+        cache.clear()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        replica = DatabaseWrapper(
+            {**connection.settings_dict, "NAME": os.path.join(tmpdir.name, "replica.sqlite3")}, alias="replica"
+        )
+        replica.ensure_connection()
+        connection.ensure_connection()
+        connection.connection.backup(replica.connection)
+        connections["replica"] = replica
+        self.addCleanup(replica.close)
+        self.addCleanup(connections.__delitem__, "replica")
+
+        self.leader = make_user("leader")
+        self.group = make_group(self.leader, "복제 모임")
+
+    def list_ids(self):
+        return [item["id"] for item in self.client.get(reverse("Wiki:api_group_list")).json()["results"]]
+
+    def test_reads_hit_replica_until_a_write_pins_primary(self, *_):
+        self.assertEqual(self.list_ids(), [])
+
+        self.client.force_login(self.leader)
+        response = self.client.post(
+            reverse("Wiki:board_post_create", kwargs={"group_id": self.group.id}),
+            {"title": "방금 쓴 글", "content": "내용"}, follow=True,
+        )
+        # redirect 된 상세 화면과 그 뒤의 읽기는 primary 에서
+        self.assertEqual(response.context["club"]["name"], "복제 모임")
+        self.assertIn(PIN_COOKIE, self.client.cookies)
+        self.assertEqual(self.list_ids(), [self.group.id])
+
+
+class MembershipResolverTests(ClubTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.applicants = [make_user(f"a{i}") for i in range(2)]
+        cls.pending = [add_member(cls.group, user, GroupMember.MemberRole.PENDING) for user in cls.applicants]
+
+    def fresh(self, user):
+        # 요청마다 사용자 객체가 새로 만들어지는 것과 같게
+        return User.objects.get(pk=user.pk)
+
+    def test_roles_are_cached_across_requests(self):
+        leader = self.fresh(self.leader)
+        # 역할 목록 1회로 이 요청의 모든 권한 확인
+        with self.assertNumQueries(1):
+            self.assertTrue(is_leader(leader, self.group.id))
+            self.assertTrue(is_manager(leader, self.group.id))
+        leader = self.fresh(self.leader)
+        with self.assertNumQueries(0):
+            self.assertTrue(is_active_member(leader, self.group.id))
+
+        # 가입 대기 중에는 게시글을 쓸 수 없다
+        self.client.force_login(self.applicants[0])
+        self.client.post(
+            reverse("Wiki:board_post_create", kwargs={"group_id": self.group.id}),
+            {"title": "글", "content": "내용"},
+        )
+        self.assertFalse(BoardPost.objects.exists())
+
+    def test_approval_invalidates_roles(self):
+        first, second = self.applicants
+        self.assertEqual(role_in(self.fresh(first), self.group.id), GroupMember.MemberRole.PENDING)
+        self.assertEqual(role_in(self.fresh(second), self.group.id), GroupMember.MemberRole.PENDING)
+
+        self.client.force_login(self.leader)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse("Wiki:member_approve", kwargs={"group_id": self.group.id, "member_id": self.pending[0].id}))
+        self.assertTrue(is_active_member(self.fresh(first), self.group.id))
+
+        # bulk_update 로 처리되는 일괄 승인도 무효화된다
+        with self.captureOnCommitCallbacks(execute=True):
+            moderate_pending_members(self.group, APPROVE)
+        self.assertTrue(is_active_member(self.fresh(second), self.group.id))
+
+    def test_group_leader_without_leader_row_is_leader(self):
+        # LEADER 행이 생기기 전에 만들어진 모임: Group.leader 가 리더의 기준
+        GroupMember.objects.filter(user=self.leader, group=self.group).delete()
+        self.assertTrue(is_leader(self.fresh(self.leader), self.group.id))
+
+        self.client.force_login(self.leader)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse("Wiki:member_approve", kwargs={"group_id": self.group.id, "member_id": self.pending[0].id}))
+        self.assertTrue(is_active_member(self.fresh(self.applicants[0]), self.group.id))
+
+        # 리더를 넘기면(admin) 전후 리더의 역할 캐시가 함께 바뀐다
+        successor = self.applicants[0]
+        self.assertFalse(is_leader(self.fresh(successor), self.group.id))
+        group = Group.objects.get(pk=self.group.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            group.leader = successor
+            group.save()
+        self.assertTrue(is_leader(self.fresh(successor), self.group.id))
+        self.assertFalse(is_leader(self.fresh(self.leader), self.group.id))
+
+
+class SharedCacheTests(ClubTestCase):
+    """프로세스별 LocMem 캐시로 여러 워커를 돌리면 다른 워커의 버전 증가가 보이지 않으므로 버전 캐시를 끈다."""
+
+    @override_settings(CACHE_SINGLE_PROCESS=False)
+    def test_locmem_disables_version_cache(self):
+        self.assertFalse(shared_cache_enabled())
+        self.assertEqual([warning.id for warning in check_shared_cache(None)], ["club_management.W001"])
+        # 배포 점검에서만 (기본 설정으로 돌리는 관리 명령마다 뜨지 않도록)
+        self.assertIn(check_shared_cache, checks.registry.registry.get_checks(include_deployment_checks=True))
+        self.assertNotIn(check_shared_cache, checks.registry.registry.get_checks())
+
+        builds = []
+        for _ in range(2):
+            cached_group_section(self.group.id, "summary", lambda: builds.append(1))
+        self.assertEqual(len(builds), 2)
+
+        # 요청마다 DB 에서 역할을 읽는다 (같은 요청 안에서는 한 번)
+        for user in [User.objects.get(pk=self.leader.pk), User.objects.get(pk=self.leader.pk)]:
+            with self.assertNumQueries(1):
+                self.assertTrue(is_leader(user, self.group.id))
+                self.assertTrue(is_manager(user, self.group.id))
+
+    @override_settings(
+        CACHE_SINGLE_PROCESS=False,
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}},
+    )
+    def test_shared_backend_enables_version_cache(self):
+        self.assertTrue(shared_cache_enabled())
+        self.assertEqual(check_shared_cache(None), [])
+
+
+class CachedAuthTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("before", password="oldpass123")
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def current_user(self, client=None):
+        response = (client or self.client).get(reverse("Wiki:profile_edit"))
+        return response.wsgi_request.user
+
+    def edit_profile(self, **data):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(reverse("Wiki:profile_edit"), {"nickname": "before", **data})
+
+    def test_session_and_user_are_served_from_cache(self):
+        self.current_user()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.current_user().nickname, "before")
+
+    def test_profile_edit_invalidates_cached_user(self):
+        self.current_user()
+        self.edit_profile(nickname="after")
+        self.assertEqual(self.current_user().nickname, "after")
+
+    def test_password_change_keeps_own_session_and_logs_out_others(self):
+        other = Client()
+        other.force_login(self.user)
+        self.assertTrue(self.current_user(other).is_authenticated)
+
+        self.edit_profile(current_password="oldpass123", new_password="newpass456", confirm_password="newpass456")
+        self.assertTrue(self.current_user().is_authenticated)
+        self.assertFalse(self.current_user(other).is_authenticated)
+
+    def test_sessions_from_model_backend_stay_logged_in(self):
+        # 배포 전에 ModelBackend 로 로그인한 세션
+        client = Client()
+        client.force_login(self.user, backend="django.contrib.auth.backends.ModelBackend")
+        self.assertEqual(self.current_user(client).pk, self.user.pk)
+
+    @override_settings(CACHE_SINGLE_PROCESS=False)
+    def test_locmem_reads_user_from_database(self):
+        self.current_user()
+        # 다른 워커에서 바뀐 것처럼 (이 프로세스의 캐시 버전은 그대로)
+        User.objects.filter(pk=self.user.pk).update(nickname="elsewhere")
+        self.assertEqual(self.current_user().nickname, "elsewhere")
+
+
+class MyPageDashboardTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("me")
+        other = make_user("other")
+        cls.groups = {"내 모임": make_group(cls.user, "내 모임")}
+        for name, role in [("가입 모임", GroupMember.MemberRole.MEMBER), ("대기 모임", GroupMember.MemberRole.PENDING)]:
+            cls.groups[name] = make_group(other, name)
+            add_member(cls.groups[name], cls.user, role)
+
+        now = timezone.now()
+        for name, days in [("내 모임", -1), ("내 모임", 3), ("가입 모임", 1), ("대기 모임", 2)]:
+            cls.add_schedule(cls.groups[name], f"{name} {days}", now + timedelta(days=days))
+
+    @staticmethod
+    def add_schedule(group, title, date_time):
+        return ActivitySchedule.objects.create(group=group, title=title, date_time=date_time, location="공원", content="-")
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def my_page(self):
+        return self.client.get(reverse("Wiki:my_page")).context
+
+    def test_groups_and_feed_cover_active_memberships_only(self):
+        context = self.my_page()
+        self.assertEqual([g.name for g in context["leading_groups"]], ["내 모임"])
+        self.assertEqual([g.name for g in context["joined_groups"]], ["가입 모임"])
+        # 지난 일정과 가입 대기 모임의 일정은 빠지고 날짜순
+        self.assertEqual([s["title"] for s in context["upcoming_schedules"]], ["가입 모임 1", "내 모임 3"])
+        self.assertEqual(context["upcoming_schedules"][0]["group_name"], "가입 모임")
+
+    def test_group_leader_without_leader_row_is_leading(self):
+        # LEADER 행이 없는 예전 모임도 Group.leader 이면 "내가 만든 모임" 과 일정 피드에 나온다
+        GroupMember.objects.filter(user=self.user, group=self.groups["내 모임"]).delete()
+        context = self.my_page()
+        self.assertEqual([g.name for g in context["leading_groups"]], ["내 모임"])
+        self.assertIn("내 모임 3", [s["title"] for s in context["upcoming_schedules"]])
+
+    def test_repeat_visit_reads_only_group_cards(self):
+        self.my_page()
+        with self.assertNumQueries(1):
+            self.my_page()
+
+    def test_feed_follows_schedule_and_membership_changes(self):
+        self.my_page()
+        with self.captureOnCommitCallbacks(execute=True):
+            for n in range(FEED_LIMIT):
+                self.add_schedule(self.groups["가입 모임"], f"추가 {n}", timezone.now() + timedelta(hours=n + 1))
+        feed = self.my_page()["upcoming_schedules"]
+        self.assertEqual(len(feed), FEED_LIMIT)
+        self.assertEqual(feed[0]["title"], "추가 0")
+
+        member = GroupMember.objects.get(user=self.user, group=self.groups["대기 모임"])
+        with self.captureOnCommitCallbacks(execute=True):
+            member.member_role = GroupMember.MemberRole.MEMBER
+            member.save()
+        context = self.my_page()
+        self.assertEqual({g.name for g in context["joined_groups"]}, {"가입 모임", "대기 모임"})
+
+
+class CalendarFeedTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("cal", password="calpass123")
+        other = make_user("lead")
+        cls.groups = {}
+        for name, role in [("내 모임", GroupMember.MemberRole.MEMBER), ("대기 모임", GroupMember.MemberRole.PENDING)]:
+            cls.groups[name] = make_group(other, name)
+            add_member(cls.groups[name], cls.user, role)
+        for name in cls.groups:
+            ActivitySchedule.objects.create(
+                group=cls.groups[name], title=f"{name} 정기 모임, 아주 긴 제목으로 줄 접기를 확인합니다",
+                date_time=timezone.now() + timedelta(days=2), location="공원; 입구", content="준비물:\n물",
+            )
+
+    def setUp(self):
+        cache.clear()
+
+    def my_url(self, token=None):
+        return reverse("Wiki:calendar_my", kwargs={"token": token or calendar_token(self.user)})
+
+    def group_url(self, name):
+        return reverse("Wiki:calendar_group", kwargs={"token": calendar_token(self.user), "group_id": self.groups[name].id})
+
+    def body(self, response):
+        self.assertEqual(response.status_code, 200)
+        return b"".join(response.streaming_content).decode()
+
+    def test_feed_lists_active_group_schedules(self):
+        response = self.client.get(self.my_url())
+        self.assertEqual(response["Content-Type"], "text/calendar; charset=utf-8")
+        body = self.body(response)
+        self.assertTrue(body.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertEqual(body.count("BEGIN:VEVENT"), 1)
+        self.assertIn("LOCATION:공원\\; 입구", body)
+        # 접힌 줄을 포함해 모든 줄이 75 옥텟 이하
+        self.assertTrue(all(len(line.encode()) <= 75 for line in body.split("\r\n")))
+        self.assertIn("[내 모임] 내 모임 정기 모임\\,", body.replace("\r\n ", ""))
+
+    async def test_feed_streams_asynchronously_under_asgi(self):
+        response = await self.async_client.get(self.my_url())
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        body = b"".join([chunk async for chunk in response.streaming_content]).decode()
+        self.assertEqual(body.count("BEGIN:VEVENT"), 1)
+
+    def test_unchanged_feed_answers_304_without_reading_schedules(self):
+        etag = self.client.get(self.my_url())["ETag"]
+        with self.assertNumQueries(1):
+            response = self.client.get(self.my_url(), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ActivitySchedule.objects.create(
+                group=self.groups["내 모임"], title="추가 일정", date_time=timezone.now() + timedelta(days=3),
+                location="체육관", content="",
+            )
+        response = self.client.get(self.my_url(), HTTP_IF_NONE_MATCH=etag)
+        self.assertIn("추가 일정", self.body(response))
+
+    def test_tokens_are_checked(self):
+        self.assertEqual(self.client.get(self.my_url(f"{self.user.pk}-forged")).status_code, 404)
+        self.assertEqual(self.client.get(self.group_url("대기 모임")).status_code, 404)
+        self.assertEqual(self.body(self.client.get(self.group_url("내 모임"))).count("BEGIN:VEVENT"), 1)
+
+        old_url = self.my_url()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.set_password("changed456")
+            self.user.save()
+        self.assertEqual(self.client.get(old_url).status_code, 404)
+
+
+class RecommendationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("rec", region=User.RegionChoices.SEOUL)
+        leader = make_user("host")
+        cls.groups = {}
+        for name, category, region, status, max_members in [
+            ("내 축구", Group.GroupCategory.SPORTS, "서울", Group.GroupStatus.OPERATING, 10),
+            ("서울 축구", Group.GroupCategory.SPORTS, "서울 마포", Group.GroupStatus.RECRUITING, 10),
+            ("부산 축구", Group.GroupCategory.SPORTS, "부산", Group.GroupStatus.RECRUITING, 10),
+            ("서울 미술", Group.GroupCategory.ART, "서울", Group.GroupStatus.RECRUITING, 10),
+            ("부산 미술", Group.GroupCategory.ART, "부산", Group.GroupStatus.RECRUITING, 10),
+            # 리더 한 명으로 정원이 찬 모임
+            ("정원 찬 축구", Group.GroupCategory.SPORTS, "서울", Group.GroupStatus.RECRUITING, 1),
+            ("마감 축구", Group.GroupCategory.SPORTS, "서울", Group.GroupStatus.CLOSED, 10),
+        ]:
+            cls.groups[name] = make_group(
+                leader, name, category=category, region=region, status=status, max_members=max_members,
+            )
+        add_member(cls.groups["내 축구"], cls.user)
+
+    def setUp(self):
+        cache.clear()
+
+    def names(self, groups):
+        return [group.name for group in groups]
+
+    def test_ranks_by_region_and_category_affinity(self):
+        users, saved = compute_recommendations()
+        self.assertEqual(users, 2)
+        with self.assertNumQueries(1):
+            recommended = recommended_groups(self.user)
+        # 가입한 모임, 정원이 찬 모임, 노출되지 않는 모임은 빠진다
+        self.assertEqual(self.names(recommended), ["서울 축구", "부산 축구", "서울 미술", "부산 미술"])
+        self.assertEqual(GroupRecommendation.objects.filter(user=self.user).count(), 4)
+
+    def test_bucket_merge_matches_full_scoring(self):
+        index = CandidateIndex()
+        affinity = {Group.GroupCategory.ART: 0.25, Group.GroupCategory.SPORTS: 0.75}
+        expected = sorted(
+            (
+                (base + 2.0 * ("서울" in region) + 3.0 * affinity.get(category, 0), group_id)
+                for group_id, category, region, base in index.candidates
+            ),
+            reverse=True,
+        )
+        picked = top_groups(index, "서울", affinity, exclude=set(), count=3)
+        self.assertEqual([group_id for group_id, _ in picked], [group_id for _, group_id in expected[:3]])
+
+    def test_discovery_section_drops_groups_joined_after_compute(self):
+        compute_recommendations()
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("Wiki:discovery"))
+        self.assertEqual(self.names(response.context["recommended_clubs"])[0], "서울 축구")
+        # 필터를 고르면 추천 영역은 보이지 않는다
+        self.assertEqual(self.client.get(reverse("Wiki:discovery"), {"category": "ART"}).context["recommended_clubs"], [])
+
+        add_member(self.groups["서울 축구"], self.user, GroupMember.MemberRole.PENDING)
+        response = self.client.get(reverse("Wiki:discovery"))
+        self.assertNotIn("서울 축구", self.names(response.context["recommended_clubs"]))
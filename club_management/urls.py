@@ -1,17 +1,29 @@
 from django.urls import path
-from . import views
+from . import api, calendar_feeds, views
 
 app_name = 'Wiki'
 
 urlpatterns = [
     path('', views.discovery_page, name='discovery'),
     path('group/<int:group_id>/', views.group_detail_page, name='group_detail'),
+    path('group/<int:group_id>/tab/<str:tab_name>/', views.group_tab, name='group_tab'),
     path('group/<int:group_id>/join/', views.group_join, name='group_join'),
     path('group/<int:group_id>/members/<int:member_id>/approve/', views.member_approve, name='member_approve'),
     path('group/<int:group_id>/members/<int:member_id>/reject/', views.member_reject, name='member_reject'),
+    path('group/<int:group_id>/members/bulk/', views.member_bulk_moderate, name='member_bulk_moderate'),
     path('group/<int:group_id>/schedule/new/', views.schedule_create, name='schedule_create'),
+    path('group/<int:group_id>/schedule/<int:schedule_id>/attendance/', views.schedule_attendance, name='schedule_attendance'),
     path('group/<int:group_id>/board/new/', views.board_post_create, name='board_post_create'),
+    path('group/<int:group_id>/board/<int:post_id>/', views.board_post_detail, name='board_post_detail'),
     path('group/<int:group_id>/finance/new/', views.finance_create, name='finance_create'),
+    path('group/<int:group_id>/finance/export/', views.finance_export, name='finance_export'),
+    path('group/<int:group_id>/finance/import/', views.finance_import, name='finance_import'),
+
+    path('api/groups/', api.group_list, name='api_group_list'),
+    path('api/groups/<int:group_id>/', api.group_detail, name='api_group_detail'),
+
+    path('calendar/<str:token>/my.ics', calendar_feeds.my_calendar, name='calendar_my'),
+    path('calendar/<str:token>/group/<int:group_id>.ics', calendar_feeds.group_calendar, name='calendar_group'),
 
     path('auth/', views.AuthView.as_view(), name='auth'),
     path('logout/', views.user_logout, name='logout'),
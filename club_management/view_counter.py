@@ -0,0 +1,211 @@
+"""게시글 조회수 write-behind 버퍼.
+
+조회할 때마다 BoardPost 행을 UPDATE 하면 SQLite 에서 쓰기 잠금이 직렬화되므로,
+조회수는 캐시 카운터에 먼저 모아두고 일정 간격마다 F() UPDATE 로 한꺼번에 반영한다.
+
+- 반영 시점: 마지막 반영 후 VIEW_COUNT_FLUSH_INTERVAL 초가 지난 뒤의 조회 요청,
+  조회를 받은 프로세스의 종료(atexit, 버퍼가 비어 있으면 DB 를 건드리지 않음), `python manage.py flush_view_counts`
+- 반영은 요청의 DB 라우팅 상태와 분리해서 한다. 조회(GET) 요청이 반영을 맡아도 쓰기 요청으로 취급되어
+  primary 에 고정되지 않도록.
+- 여러 프로세스가 버퍼를 공유하려면 CACHES 가 Redis/Memcached 같은 공유 캐시여야 한다.
+  (기본 LocMemCache 는 프로세스별 버퍼로 동작)
+- 조회수는 근사값이다. 캐시가 비워지면 아직 반영되지 않은 조회수는 사라질 수 있다.
+
+동시 요청에서 조회수나 반영 대상이 빠지지 않도록 캐시의 원자적 연산(add / incr / decr)만 쓴다.
+- 게시글마다 카운터 키 하나. 카운터가 0 → 1 이 된 요청만 "반영 대상 로그"에 게시글을 올린다.
+- 반영 대상 로그는 순번 카운터(incr)로 칸을 받아 칸마다 게시글 id 를 적는다.
+  (목록 하나를 읽고-고치고-쓰면 동시에 쓴 요청의 표시가 사라진다)
+- 반영할 때는 읽은 값만큼 decr 하고 카운터 키는 지우지 않는다. 그 사이 들어온 조회는 남은 값으로 남고,
+  남은 값이 있으면 로그에 다시 올린다.
+- 순번만 받고 칸을 채우지 못한 요청(그 사이 프로세스 종료 등)의 칸은 HOLE_GRACE 뒤 건너뛴다.
+  그 칸의 게시글은 카운터가 0 이 아니라 다시 로그에 오르지 않으므로, 건너뛴 칸이 있으면
+  게시글 카운터 키를 전부 훑어 남은 조회수를 찾는다 (드문 예비 경로, 게시글 수에 비례).
+"""
+import atexit
+import logging
+import time
+from collections import defaultdict
+from itertools import islice
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from .models import BoardPost
+from .routers import routing_state
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "board_post_views"
+LOCK_KEY = f"{KEY_PREFIX}:flush_lock"
+# 반영 대상 로그: 마지막으로 받은 순번 / 반영을 마친 순번 / 비어 있는 칸을 처음 본 시점
+DIRTY_SEQ_KEY = f"{KEY_PREFIX}:dirty_seq"
+FLUSHED_SEQ_KEY = f"{KEY_PREFIX}:flushed_seq"
+HOLE_KEY = f"{KEY_PREFIX}:dirty_hole"
+
+# 반영되지 않은 카운터가 캐시에 남아 있을 최대 시간 (초)
+COUNTER_TIMEOUT = 60 * 60 * 24
+
+# 순번만 받고 칸을 채우지 못한 요청(그 사이 프로세스 종료 등)을 기다리는 시간 (초)
+HOLE_GRACE = 60
+
+# 한 번에 읽는 로그 칸 수
+FLUSH_BATCH = 5000
+
+_last_flush = time.monotonic()
+_shutdown_flush_registered = False
+
+
+def _flush_interval():
+    return getattr(settings, "VIEW_COUNT_FLUSH_INTERVAL", 30)
+
+
+def _counter_key(post_id):
+    return f"{KEY_PREFIX}:{post_id}"
+
+
+def _slot_key(seq):
+    return f"{KEY_PREFIX}:dirty:{seq}"
+
+
+def _incr(key, timeout=COUNTER_TIMEOUT):
+    """key 를 1 올린 값. 키가 없으면 1 로 만든다."""
+    try:
+        return cache.incr(key)
+    except ValueError:
+        if cache.add(key, 1, timeout):
+            return 1
+        return cache.incr(key)
+
+
+def _mark_dirty(post_id):
+    cache.set(_slot_key(_incr(DIRTY_SEQ_KEY, timeout=None)), post_id, COUNTER_TIMEOUT)
+
+
+def record_view(post_id):
+    """조회 1회를 버퍼에 더하고, 반영 주기가 지났으면 DB 로 반영한다."""
+    global _shutdown_flush_registered
+    if not _shutdown_flush_registered:
+        # 조회를 받은 프로세스만 종료 시 반영한다 (관리 명령, 마이그레이션에서는 등록하지 않는다)
+        _shutdown_flush_registered = True
+        atexit.register(flush_on_shutdown)
+
+    if _incr(_counter_key(post_id)) == 1:
+        # 0 → 1 로 만든 요청 하나만 로그에 올린다
+        _mark_dirty(post_id)
+
+    if time.monotonic() - _last_flush >= _flush_interval():
+        flush_view_counts()
+
+
+def buffered_views(post_id):
+    """아직 DB 에 반영되지 않은 조회수."""
+    return cache.get(_counter_key(post_id), 0)
+
+
+def _has_pending():
+    return cache.get(DIRTY_SEQ_KEY, 0) > cache.get(FLUSHED_SEQ_KEY, 0)
+
+
+def _buffered_posts():
+    """카운터에 조회수가 남아 있는 게시글 id 전체 (로그에서 빠진 게시글을 찾는 예비 경로)."""
+    post_ids = set()
+    all_ids = BoardPost.objects.order_by().values_list("pk", flat=True).iterator(chunk_size=FLUSH_BATCH)
+    while chunk := list(islice(all_ids, FLUSH_BATCH)):
+        counts = cache.get_many([_counter_key(post_id) for post_id in chunk])
+        post_ids.update(post_id for post_id in chunk if counts.get(_counter_key(post_id), 0) > 0)
+    return post_ids
+
+
+def _dirty_posts():
+    """반영할 게시글 id 집합과 여기까지 읽은 로그 순번."""
+    last = cache.get(DIRTY_SEQ_KEY, 0)
+    flushed = cache.get(FLUSHED_SEQ_KEY)
+    # 로그만으로 찾을 수 없는 게시글이 있을 수 있으면 카운터를 전부 훑는다
+    sweep = False
+    if flushed is None:
+        # 반영 위치가 캐시에서 밀려난 경우 최근 칸부터
+        flushed = max(last - FLUSH_BATCH, 0)
+        sweep = flushed > 0
+    seqs = range(flushed + 1, min(last, flushed + FLUSH_BATCH) + 1)
+    found = cache.get_many([_slot_key(seq) for seq in seqs])
+
+    hole = cache.get(HOLE_KEY)
+    # 오래 비어 있던 칸은 건너뛴다 (그 칸의 순번을 받은 요청은 HOLE_GRACE 초 넘게 끝나지 않았다)
+    skip_until = hole[0] if hole and time.time() - hole[1] >= HOLE_GRACE else 0
+
+    post_ids, upto = set(), flushed
+    for seq in seqs:
+        key = _slot_key(seq)
+        if key in found:
+            post_ids.add(found[key])
+        elif seq > skip_until:
+            # 순번은 받았지만 아직 칸을 채우는 중인 요청. 다음 반영에서 다시 본다
+            if hole is None:
+                cache.set(HOLE_KEY, (last, time.time()), COUNTER_TIMEOUT)
+            break
+        else:
+            sweep = True
+        upto = seq
+    if hole is not None and upto >= hole[0]:
+        cache.delete(HOLE_KEY)
+    if sweep:
+        post_ids |= _buffered_posts()
+    return post_ids, flushed, upto
+
+
+def flush_view_counts():
+    """버퍼에 쌓인 조회수를 DB 에 반영하고, 반영한 조회수 합계를 돌려준다."""
+    global _last_flush
+    _last_flush = time.monotonic()
+
+    # 다른 프로세스가 반영 중이면 건너뜀
+    if not cache.add(LOCK_KEY, 1, 60):
+        return 0
+    # 요청 안에서 불려도 그 요청의 라우팅 상태(쓰기 후 primary 고정)를 건드리지 않는다
+    with routing_state():
+        try:
+            return _flush()
+        finally:
+            cache.delete(LOCK_KEY)
+
+
+def _flush():
+    post_ids, flushed, upto = _dirty_posts()
+    if upto == flushed:
+        return 0
+
+    counts = cache.get_many([_counter_key(post_id) for post_id in post_ids])
+    by_count = defaultdict(list)
+    for post_id in post_ids:
+        count = counts.get(_counter_key(post_id), 0)
+        if count <= 0:
+            continue
+        # 읽은 만큼만 뺀다 (읽고 지우면 그 사이 들어온 조회수가 사라진다)
+        try:
+            remaining = cache.decr(_counter_key(post_id), count)
+        except ValueError:
+            continue
+        by_count[count].append(post_id)
+        if remaining > 0:
+            # 그 사이 들어온 조회는 0 → 1 을 거치지 않았으므로 직접 다시 올린다
+            _mark_dirty(post_id)
+
+    # 같은 증가량끼리 묶어서 UPDATE 한 번씩
+    with transaction.atomic():
+        for count, ids in by_count.items():
+            BoardPost.objects.filter(pk__in=ids).update(views=F("views") + count)
+
+    cache.set(FLUSHED_SEQ_KEY, upto, None)
+    cache.delete_many([_slot_key(seq) for seq in range(flushed + 1, upto + 1)])
+    return sum(count * len(ids) for count, ids in by_count.items())
+
+
+def flush_on_shutdown():
+    try:
+        # 반영할 것이 없으면 DB 에 연결하지 않는다
+        if _has_pending():
+            flush_view_counts()
+    except Exception:
+        logger.exception("종료 시 조회수 반영에 실패했습니다.")
@@ -4,19 +4,38 @@ from django.contrib.auth import authenticate, login, logout, get_user_model
 from django.contrib import messages
 from django.http import Http404, HttpResponse
 from django.utils import timezone
-from django.db.models import Q, Count, Sum
+from django.db import transaction
+from django.urls import reverse
 from django.contrib.auth.decorators import login_required
-from datetime import datetime
+import io
+from asgiref.sync import sync_to_async
+from datetime import date, datetime
 from django.contrib.auth import update_session_auth_hash
 from .models import (
     User, 
     Group,      
     GroupMember,
     ActivitySchedule,
-    RSVP,
     FinancialTransaction,
     BoardPost,
 )
+from .async_loaders import aload_group_detail, aload_group_tab
+from .attendance import CHECK_IN_STATUSES, attendance_sheet, record_attendance
+from .bank_import import ENCODINGS, StatementFormatError, import_statement
+from .calendar_feeds import calendar_token
+from .dashboard import load_my_page
+from .exports import finance_export_queryset, iter_finance_csv
+from .facets import VISIBLE_STATUSES, build_facets, facet_rows, visible_facet_rows
+from .ledger import record_transaction
+from .loaders import TAB_LOADERS
+from .membership import is_active_member, is_leader, is_manager, role_in
+from .moderation import APPROVE, REJECT, approve_pending_member, moderate_pending_members, reject_pending_member
+from .pagination import keyset_page, parse_page_size, rank_page
+from .recommendations import recommended_groups
+from .routers import replica_reads
+from .search import matching_groups, search_groups
+from .streaming import streaming_response
+from .view_counter import buffered_views, record_view
 
 
 def _group_to_card_dict(group: Group):
@@ -29,7 +48,7 @@ def _group_to_card_dict(group: Group):
         "OTHER": "bg-gray-100 text-gray-700",
     }
 
-    members_count = GroupMember.objects.filter(group=group).count()
+    members_count = group.member_count
     if members_count == 0:
         # 아직 멤버 테이블 안 쓰고 있으면 리더 한 명 있다고 가정
         members_count = 1
@@ -45,34 +64,50 @@ def _group_to_card_dict(group: Group):
     }
 
 
+@replica_reads
 def discovery_page(request):
-    groups = Group.objects.filter(status__in=[Group.GroupStatus.RECRUITING, Group.GroupStatus.OPERATING])
+    groups = Group.objects.filter(status__in=VISIBLE_STATUSES)
 
     query = request.GET.get('q', '')
     selected_category = request.GET.get("category", "")
     selected_region = request.GET.get("region", "")
 
-    # 필터링
-    if query:
-        groups = groups.filter(
-            Q(name__icontains=query) | 
-            Q(description__icontains=query)
-        )
+    # 필터 옵션별 모임 수: 검색어가 없으면 캐시된 집계, 있으면 검색어에 매칭되는 모임 전체를 한 번 집계
+    rows = facet_rows(matching_groups(groups, query)) if query else visible_facet_rows()
+    categories, regions = build_facets(rows, selected_category, selected_region)
 
+    # 필터링
     if selected_category:
         groups = groups.filter(category=selected_category)
 
     if selected_region:
         groups = groups.filter(region__icontains=selected_region)
-    groups = groups.order_by('-created_at')
 
-    # 카테고리 선택 옵션을 모델의 choices에서 가져오기
-    categories = Group.GroupCategory.choices
-    regions = Group.objects.values_list('region', flat=True).distinct()
+    # 검색어가 있으면 필터를 적용한 모임 안에서 검색 인덱스 랭킹 순, 없으면 최신순
+    ranked = False
+    if query:
+        groups, ranked = search_groups(groups, query)
+
+    # 랭킹 검색은 순위 위치 커서, 그 외에는 키셋 페이지네이션
+    page_size = parse_page_size(request.GET.get("size"))
+    paginate = rank_page if ranked else keyset_page
+    clubs, next_cursor = paginate(groups, request.GET.get("cursor"), page_size)
+
+    next_page_query = ""
+    if next_cursor:
+        params = request.GET.copy()
+        params["cursor"] = next_cursor
+        next_page_query = params.urlencode()
+
+    # 회원님을 위한 모임: 필터 없는 첫 화면에서만, 미리 계산된 목록을 읽기만 한다 (recommendations.py)
+    first_page = not (query or selected_category or selected_region or request.GET.get("cursor"))
+    recommended_clubs = recommended_groups(request.user) if first_page else []
 
     context = {
-        "clubs": groups,       
-        "categories": categories,  
+        "clubs": clubs,
+        "recommended_clubs": recommended_clubs,
+        "next_page_query": next_page_query,
+        "categories": categories,
         "regions": regions,
         "selected_category": selected_category,
         "selected_region": selected_region,
@@ -81,160 +116,30 @@ def discovery_page(request):
 
     return render(request, "discovery.html", context)
 
-def group_detail_page(request, group_id):
-    # 모임 객체 + 멤버 수 함께 가져오기
-    group = get_object_or_404(
-        Group.objects.annotate(member_count=Count("groupmember")),
-        pk=group_id,
-    )
+async def _auser(request):
+    """async 뷰에서 로그인 사용자를 조회한다.
 
-    # 리더 정보
-    if group.leader:
-        leader_nickname = group.leader.nickname
-        leader_id = group.leader.email
-    else:
-        leader_nickname = "리더 미지정"
-        leader_id = "-"
-
-    # 멤버 상세 정보
-    group_members = (
-        GroupMember.objects.filter(group=group)
-        .select_related("user")
-        .order_by("joined_date")
-    )
+    request.user(템플릿 컨텍스트 프로세서가 사용)는 auser() 와 캐시를 공유하지 않으므로 같이 채워둔다.
+    """
+    request.user = user = await request.auser()
+    return user
 
-    members_detail = []
-    for gm in group_members:
-        if gm.member_role == GroupMember.MemberRole.LEADER:
-            role = "리더"
-        elif gm.member_role == GroupMember.MemberRole.ADMIN:
-            role = "총무"
-        elif gm.member_role == GroupMember.MemberRole.MEMBER:
-            role = "일반 멤버"
-        elif gm.member_role == GroupMember.MemberRole.PENDING:
-            role = "가입 대기 중"
-        else:
-            role = gm.get_member_role_display()
-
-        members_detail.append(
-            {
-                "nickname": gm.user.nickname if gm.user else "(탈퇴 회원)",
-                "role": role,
-            }
-        )
 
-    # 일정 / 출석
-    schedules = ActivitySchedule.objects.filter(group=group).order_by("date_time")
-    activities = []
-    for s in schedules:
-        activities.append(
-            {
-                "title": s.title,
-                "date": s.date_time.strftime("%m월 %d일 %H:%M"),
-                "fee": f"{s.participation_fee:,}원",
-                "status": "예정",
-                "attendees": RSVP.objects.filter(
-                    schedule=s,
-                    attendance_status=RSVP.AttendanceStatus.ATTENDING,
-                ).count(),
-            }
-        )
+@replica_reads
+async def group_detail_page(request, group_id):
+    # 첫 응답은 소개 탭만, 나머지 탭은 group_tab 프래그먼트로 따로 불러온다 (async_loaders.py)
+    context = await aload_group_detail(group_id, await _auser(request))
+    return await sync_to_async(render)(request, "group_detail.html", context)
 
-    # 게시판 글 목록
-    board_posts = []
-    try:
-        from .models import BoardPost
-
-        posts_qs = (
-            BoardPost.objects.filter(group=group)
-            .select_related("author")
-            .order_by("-is_notice", "-created_at")
-        )
-        for post in posts_qs:
-            board_posts.append(
-                {
-                    "title": post.title,
-                    "author": post.author.nickname if post.author else "(탈퇴 회원)",
-                    "date": post.created_at.strftime("%Y-%m-%d %H:%M"),
-                    "views": post.views,
-                    "type": "공지" if getattr(post, "is_notice", False) else "일반",
-                }
-            )
-    except Exception:
-        board_posts = []
-
-    # 재정 요약 + 내역 전체
-    transactions_qs = FinancialTransaction.objects.filter(group=group).order_by(
-        "-transaction_date"
-    )
-    balance = transactions_qs.aggregate(total=Sum("amount"))["total"] or 0
-    last_tx = transactions_qs.first()
-    last_updated = (
-        last_tx.transaction_date.strftime("%Y-%m-%d") if last_tx else "-"
-    )
 
-    transactions = []
-    for tx in transactions_qs:
-        transactions.append(
-            {
-                "date": tx.transaction_date.strftime("%Y-%m-%d"),
-                "amount": tx.amount,
-                "description": tx.description,
-                "user_nickname": tx.user.nickname if tx.user else "(시스템)",
-            }
-        )
-
-    finance = {
-        "current_balance": balance,
-        "last_updated": last_updated,
-        "dues_status": [],         
-        "transactions": transactions,  
-    }
-
-    is_member = False
-    is_leader = False
-    is_treasurer = False
-
-    if request.user.is_authenticated:
-        membership = (
-            GroupMember.objects.filter(group=group, user=request.user)
-            .only("member_role")
-            .first()
-        )
-        if membership:
-            if membership.member_role in [
-                GroupMember.MemberRole.MEMBER,
-                GroupMember.MemberRole.LEADER,
-                GroupMember.MemberRole.ADMIN,
-            ]:
-                is_member = True
-            if membership.member_role == GroupMember.MemberRole.LEADER:
-                is_leader = True
-            if membership.member_role == GroupMember.MemberRole.ADMIN:
-                is_treasurer = True
-
-    club_context = {
-        "id": group.id,
-        "name": group.name,
-        "category": group.get_category_display(),
-        "region": group.region,
-        "members": group.member_count,
-        "description": group.description,
-        "leader_nickname": leader_nickname,
-        "leader_id": leader_id,
-        "activities": activities,
-        "board_posts": board_posts,         
-        "members_detail": members_detail,
-        "finance": finance,                 
-    }
+@replica_reads
+async def group_tab(request, group_id, tab_name):
+    """상세 페이지 탭 하나(일정/게시판/멤버/재정)의 HTML 조각 + 탭 내 페이지네이션"""
+    if tab_name not in TAB_LOADERS:
+        raise Http404("존재하지 않는 탭입니다.")
 
-    context = {
-        "club": club_context,
-        "is_member": is_member,
-        "is_leader": is_leader,
-        "is_treasurer": is_treasurer,
-    }
-    return render(request, "group_detail.html", context)
+    context = await aload_group_tab(group_id, tab_name, await _auser(request), request.GET.get("page"))
+    return await sync_to_async(render)(request, f"components/tabs/{tab_name}.html", context)
 
 
 @login_required(login_url="/auth/")
@@ -243,11 +148,13 @@ def group_join(request, group_id: int):
     group = get_object_or_404(Group, pk=group_id)
     user = request.user
 
-    member, created = GroupMember.objects.get_or_create(
-        group=group,
-        user=user,
-        defaults={"member_role": GroupMember.MemberRole.PENDING},
-    )
+    with transaction.atomic():
+        # 대기 수는 GroupMember 저장 시그널이 다시 센다 (signals.py)
+        member, created = GroupMember.objects.get_or_create(
+            group=group,
+            user=user,
+            defaults={"member_role": GroupMember.MemberRole.PENDING},
+        )
 
     # 이미 멤버인 경우
     if not created and member.member_role != GroupMember.MemberRole.PENDING:
@@ -269,18 +176,16 @@ def member_approve(request, group_id: int, member_id: int):
     group = get_object_or_404(Group, pk=group_id)
     user = request.user
 
-    if group.leader_id != user.id:
+    if not is_leader(user, group.id):
         messages.error(request, "가입 승인은 모임 리더만 가능합니다.")
         return redirect("Wiki:group_detail", group_id=group.id)
 
-    member = get_object_or_404(GroupMember, pk=member_id, group=group)
+    member = get_object_or_404(GroupMember.objects.select_related("user"), pk=member_id, group=group)
 
-    if member.member_role != GroupMember.MemberRole.PENDING:
+    # PENDING 확인과 변경을 한 문장으로 (동시 요청 중 하나만 반영)
+    if not approve_pending_member(member):
         messages.info(request, "이미 처리된 신청입니다.")
         return redirect("Wiki:group_detail", group_id=group.id)
-
-    member.member_role = GroupMember.MemberRole.MEMBER
-    member.save()
     messages.success(request, f"{member.user.nickname} 님을 멤버로 승인했습니다.")
     return redirect("Wiki:group_detail", group_id=group.id)
 
@@ -291,19 +196,57 @@ def member_reject(request, group_id: int, member_id: int):
     group = get_object_or_404(Group, pk=group_id)
     user = request.user
 
-    if group.leader_id != user.id:
+    if not is_leader(user, group.id):
         messages.error(request, "가입 거절은 모임 리더만 가능합니다.")
         return redirect("Wiki:group_detail", group_id=group.id)
 
-    member = get_object_or_404(GroupMember, pk=member_id, group=group)
+    member = get_object_or_404(GroupMember.objects.select_related("user"), pk=member_id, group=group)
 
-    if member.member_role != GroupMember.MemberRole.PENDING:
+    if not reject_pending_member(member):
         messages.info(request, "이미 처리된 신청입니다.")
         return redirect("Wiki:group_detail", group_id=group.id)
+    messages.info(request, f"{member.user.nickname} 님의 가입 신청을 거절했습니다.")
+    return redirect("Wiki:group_detail", group_id=group.id)
+
+
+@login_required(login_url="/auth/")
+def member_bulk_moderate(request, group_id: int):
+    """리더가 가입 대기 신청 여러 건(또는 전체)을 한 번에 승인/거절"""
+    group = get_object_or_404(Group, pk=group_id)
 
-    nickname = member.user.nickname
-    member.delete()
-    messages.info(request, f"{nickname} 님의 가입 신청을 거절했습니다.")
+    if not is_leader(request.user, group.id):
+        messages.error(request, "가입 승인/거절은 모임 리더만 가능합니다.")
+        return redirect("Wiki:group_detail", group_id=group.id)
+
+    if request.method != "POST":
+        return redirect("Wiki:group_detail", group_id=group.id)
+
+    action = request.POST.get("action")
+    if action not in (APPROVE, REJECT):
+        messages.error(request, "잘못된 요청입니다.")
+        return redirect("Wiki:group_detail", group_id=group.id)
+
+    member_ids = None
+    if not request.POST.get("all_pending"):
+        try:
+            member_ids = [int(pk) for pk in request.POST.getlist("member_ids")]
+        except ValueError:
+            member_ids = []
+        if not member_ids:
+            messages.info(request, "처리할 신청을 선택해주세요.")
+            return redirect("Wiki:group_detail", group_id=group.id)
+
+    result = moderate_pending_members(group, action, member_ids)
+
+    if action == APPROVE:
+        summary = f"{len(result['approved'])}명을 멤버로 승인했습니다."
+        if result["over_capacity"]:
+            summary += f" 최대 인원({group.max_members}명)을 넘어 {len(result['over_capacity'])}명은 대기 상태로 남겼습니다."
+    else:
+        summary = f"{len(result['rejected'])}명의 가입 신청을 거절했습니다."
+    if result["not_found"]:
+        summary += f" 이미 처리된 신청 {len(result['not_found'])}건은 건너뛰었습니다."
+    messages.success(request, summary)
     return redirect("Wiki:group_detail", group_id=group.id)
 
 
@@ -313,9 +256,7 @@ def schedule_create(request, group_id):
     user = request.user
 
     # 리더 / 총무만 가능
-    member = GroupMember.objects.filter(group=group, user=user).first()
-    allowed_roles = [GroupMember.MemberRole.LEADER, GroupMember.MemberRole.ADMIN]
-    if not member or member.member_role not in allowed_roles:
+    if not is_manager(user, group.id):
         messages.error(request, "일정 등록은 리더 또는 총무만 가능합니다.")
         return redirect('Wiki:group_detail', group_id=group.id)
 
@@ -358,14 +299,52 @@ def schedule_create(request, group_id):
     return render(request, "schedule_form.html", {"group": group})
 
 
+@login_required(login_url='/auth/')
+def schedule_attendance(request, group_id, schedule_id):
+    """운영진 출석 체크: 멤버 전체의 출석/결석을 한 번에 제출"""
+    schedule = get_object_or_404(
+        ActivitySchedule.objects.select_related("group"),
+        pk=schedule_id,
+        group_id=group_id,
+    )
+    group = schedule.group
+
+    # 리더 / 총무만 가능
+    if not is_manager(request.user, group.id):
+        messages.error(request, "출석 체크는 리더 또는 총무만 가능합니다.")
+        return redirect('Wiki:group_detail', group_id=group.id)
+
+    if request.method == "POST":
+        # 입력 이름: status_<user_id> = PRESENT / ABSENT
+        statuses = {}
+        for key, value in request.POST.items():
+            if not key.startswith("status_"):
+                continue
+            try:
+                statuses[int(key[len("status_"):])] = value
+            except ValueError:
+                continue
+
+        saved = record_attendance(schedule, statuses)
+        messages.success(request, f"{saved}명의 출석 상태를 저장했습니다.")
+        return redirect("Wiki:schedule_attendance", group_id=group.id, schedule_id=schedule.id)
+
+    context = {
+        "group": group,
+        "schedule": schedule,
+        "sheet": attendance_sheet(schedule),
+        "check_in_statuses": [(status.value, status.label) for status in CHECK_IN_STATUSES],
+    }
+    return render(request, "attendance_form.html", context)
+
+
 @login_required(login_url='/auth/')
 def board_post_create(request, group_id):
     group = get_object_or_404(Group, pk=group_id)
     user = request.user
 
     # 멤버(리더/총무/일반)만 가능, 가입 대기(PENDING)는 안 됨
-    member = GroupMember.objects.filter(group=group, user=user).first()
-    if not member or member.member_role == GroupMember.MemberRole.PENDING:
+    if not is_active_member(user, group.id):
         messages.error(request, "게시글 작성은 모임 멤버만 가능합니다.")
         return redirect('Wiki:group_detail', group_id=group.id)
 
@@ -390,15 +369,30 @@ def board_post_create(request, group_id):
 
     return render(request, "board_post_form.html", {"group": group})
 
+@replica_reads
+def board_post_detail(request, group_id, post_id):
+    """게시글 상세. 조회수는 버퍼에 모았다가 주기적으로 DB 에 반영한다 (view_counter.py)"""
+    post = get_object_or_404(
+        BoardPost.objects.select_related("group", "author"),
+        pk=post_id,
+        group_id=group_id,
+    )
+    record_view(post.id)
+
+    context = {
+        "group": post.group,
+        "post": post,
+        "views": post.views + buffered_views(post.id),
+    }
+    return render(request, "board_post_detail.html", context)
+
 @login_required(login_url='/auth/')
 def finance_create(request, group_id):
     group = get_object_or_404(Group, pk=group_id)
     user = request.user
 
     # 리더 / 총무만 가능
-    member = GroupMember.objects.filter(group=group, user=user).first()
-    allowed_roles = [GroupMember.MemberRole.LEADER, GroupMember.MemberRole.ADMIN]
-    if not member or member.member_role not in allowed_roles:
+    if not is_manager(user, group.id):
         messages.error(request, "재정 기록 관리는 리더 또는 총무만 가능합니다.")
         return redirect('Wiki:group_detail', group_id=group.id)
 
@@ -416,49 +410,93 @@ def finance_create(request, group_id):
             messages.error(request, "금액은 숫자로 입력해주세요.")
             return render(request, "finance_form.html", {"group": group})
 
-        FinancialTransaction.objects.create(
-            group=group,
-            user=user,
-            amount=amount,
-            description=description,
-        )
+        with transaction.atomic():
+            tx = FinancialTransaction.objects.create(
+                group=group,
+                user=user,
+                amount=amount,
+                description=description,
+            )
+            record_transaction(tx)
         messages.success(request, "재정 기록이 추가되었습니다.")
         return redirect("Wiki:group_detail", group_id=group.id)
 
     return render(request, "finance_form.html", {"group": group})
 
 
+def _parse_date(value):
+    try:
+        return date.fromisoformat(value.strip()) if value and value.strip() else None
+    except ValueError:
+        return None
 
 
 @login_required(login_url='/auth/')
-def my_page_view(request):
-    user = request.user 
+def finance_export(request, group_id):
+    """재정 내역 CSV 다운로드 (?start=YYYY-MM-DD&end=YYYY-MM-DD 로 기간 지정)"""
+    group = get_object_or_404(Group, pk=group_id)
 
-    leading_groups = (
-        Group.objects.filter(leader=user)
-        .annotate(member_count=Count("groupmember"))
-        .order_by("-created_at")
-    )
+    # 리더 / 총무만 가능
+    if not is_manager(request.user, group.id):
+        messages.error(request, "재정 내역 내보내기는 리더 또는 총무만 가능합니다.")
+        return redirect('Wiki:group_detail', group_id=group.id)
 
-    joined_groups = (
-        Group.objects.filter(
-            groupmember__user=user,
-            groupmember__member_role__in=[
-                GroupMember.MemberRole.LEADER,
-                GroupMember.MemberRole.ADMIN,
-                GroupMember.MemberRole.MEMBER,
-            ],
-        )
-        .exclude(leader=user)
-        .annotate(member_count=Count("groupmember"))
-        .distinct()
-        .order_by("-created_at")
-    )
+    start = _parse_date(request.GET.get("start"))
+    end = _parse_date(request.GET.get("end"))
+    transactions = finance_export_queryset(group, start, end)
 
-    context = {
-        "leading_groups": leading_groups,
-        "joined_groups": joined_groups,
-    }
+    response = streaming_response(request, iter_finance_csv(transactions), content_type="text/csv; charset=utf-8")
+    filename = f"finance-{group.id}-{start or 'all'}-{end or date.today()}.csv"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+@login_required(login_url='/auth/')
+def finance_import(request, group_id):
+    """은행 거래 내역 CSV 를 올려 재정 기록을 한 번에 추가"""
+    group = get_object_or_404(Group, pk=group_id)
+
+    # 리더 / 총무만 가능
+    if not is_manager(request.user, group.id):
+        messages.error(request, "재정 내역 가져오기는 리더 또는 총무만 가능합니다.")
+        return redirect('Wiki:group_detail', group_id=group.id)
+
+    context = {"group": group, "encodings": list(ENCODINGS)}
+    if request.method == "POST":
+        upload = request.FILES.get("statement")
+        encoding = ENCODINGS.get(request.POST.get("encoding"), ENCODINGS["utf-8"])
+        if not upload:
+            messages.error(request, "CSV 파일을 선택해주세요.")
+            return render(request, "finance_import.html", context)
+
+        # 업로드 파일을 한꺼번에 읽지 않고 줄 단위로 디코딩
+        lines = io.TextIOWrapper(upload.file, encoding=encoding, newline="")
+        try:
+            result = import_statement(group, lines, user=request.user, dry_run=bool(request.POST.get("dry_run")))
+        except StatementFormatError as exc:
+            messages.error(request, str(exc))
+            return render(request, "finance_import.html", context)
+        except UnicodeDecodeError:
+            messages.error(request, "파일 인코딩이 맞지 않습니다. 다른 인코딩을 선택해주세요.")
+            return render(request, "finance_import.html", context)
+        finally:
+            lines.detach()
+
+        context["result"] = result
+        context["dry_run"] = bool(request.POST.get("dry_run"))
+    return render(request, "finance_import.html", context)
+
+
+
+
+@login_required(login_url='/auth/')
+@replica_reads
+def my_page_view(request):
+    """마이페이지: 내가 만든 모임 / 참여 중인 모임 / 다가오는 일정 (dashboard.py)."""
+    context = load_my_page(request.user)
+    # 캘린더 앱 구독 주소 (calendar_feeds.py)
+    context["calendar_token"] = token = calendar_token(request.user)
+    context["calendar_url"] = request.build_absolute_uri(reverse("Wiki:calendar_my", kwargs={"token": token}))
     return render(request, "mypage.html", context)
 
 @login_required(login_url='/auth/')
@@ -519,22 +557,23 @@ def create_group_view(request):
         }
         region = region_map.get(region_raw, region_raw)
 
-        # 3) Group 생성 (리더 = 현재 로그인 유저)
-        group = Group.objects.create(
-            name=name,
-            category=group_category,
-            region=region,
-            description=description,
-            max_members=max_members,
-            leader=request.user,
-        )
+        with transaction.atomic():
+            # 3) Group 생성 (리더 = 현재 로그인 유저)
+            group = Group.objects.create(
+                name=name,
+                category=group_category,
+                region=region,
+                description=description,
+                max_members=max_members,
+                leader=request.user,
+            )
 
-        # 4) 그룹 멤버 테이블에 리더로 등록
-        GroupMember.objects.create(
-            user=request.user,
-            group=group,
-            member_role=GroupMember.MemberRole.LEADER,
-        )
+            # 4) 그룹 멤버 테이블에 리더로 등록
+            GroupMember.objects.create(
+                user=request.user,
+                group=group,
+                member_role=GroupMember.MemberRole.LEADER,
+            )
 
         messages.success(request, "새 모임이 성공적으로 생성되었습니다.")
         # 생성 후 바로 상세 페이지로 이동
@@ -552,16 +591,17 @@ def join_group(request, group_id):
     group = get_object_or_404(Group, id=group_id)
     
     # 이미 가입했는지 확인 (중복 가입 방지)
-    if GroupMember.objects.filter(group=group, user=request.user).exists():
+    if role_in(request.user, group.id) is not None:
         messages.warning(request, "이미 가입한 모임입니다.")
         return redirect('Wiki:group_detail', group_id=group.id)
 
     # 멤버로 추가 (기본값: 승인 대기 PENDING 또는 바로 가입 MEMBER)
-    GroupMember.objects.create(
-        group=group,
-        user=request.user,
-        member_role=GroupMember.MemberRole.PENDING # 또는 MEMBER
-    )
+    with transaction.atomic():
+        GroupMember.objects.create(
+            group=group,
+            user=request.user,
+            member_role=GroupMember.MemberRole.PENDING # 또는 MEMBER
+        )
     
     messages.success(request, "가입 신청이 완료되었습니다!")
     return redirect('Wiki:group_detail', group_id=group.id)
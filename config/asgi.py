@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+# ASGI 로 실행하면 상세 화면의 독립 섹션을 기본으로 동시에 조회 (club_management/async_loaders.py)
+os.environ.setdefault('ASYNC_PARALLEL_SECTIONS', 'True')
 
 application = get_asgi_application()
@@ -47,6 +47,10 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # 요청별 쿼리 수 / DB 시간 (Server-Timing 헤더 + club_management.sql 로그)
+    'club_management.middleware.QueryInstrumentationMiddleware',
+    # 쓰기 직후의 읽기를 primary DB 로 (복제본이 설정된 경우만)
+    'club_management.middleware.PrimaryPinningMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -78,13 +82,58 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# SQLite 운영 모드: WAL + 연결별 PRAGMA + 연결 재사용 (club_management/sqlite_pragmas.py)
+SQLITE_PRODUCTION = env.bool('SQLITE_PRODUCTION', default=False)
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # 요청마다 연결을 새로 열지 않고 재사용 (초)
+        'CONN_MAX_AGE': env.int('CONN_MAX_AGE', default=600 if SQLITE_PRODUCTION else 0),
+        'CONN_HEALTH_CHECKS': SQLITE_PRODUCTION,
+        'OPTIONS': {
+            # 쓰기 트랜잭션이 시작할 때 바로 쓰기 잠금을 잡는다.
+            # (DEFERRED 는 읽다가 쓰기로 올릴 때 busy_timeout 없이 바로 "database is locked")
+            'transaction_mode': 'IMMEDIATE',
+        } if SQLITE_PRODUCTION else {},
     }
 }
 
+# 새 연결마다 실행할 PRAGMA
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',          # 읽기가 쓰기를 기다리지 않음
+    'synchronous': 'NORMAL',        # WAL 에서는 체크포인트 때만 fsync (전원 장애 시 마지막 커밋 일부만 유실 가능)
+    'busy_timeout': env.int('SQLITE_BUSY_TIMEOUT', default=5000),  # 쓰기 잠금 대기 (ms)
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -64000,           # 음수는 KiB 단위 → 약 64MB
+    'temp_store': 'MEMORY',
+} if SQLITE_PRODUCTION else {}
+
+# 읽기 전용 복제본 (club_management/routers.py)
+# 예: REPLICA_DATABASE_URL=sqlite:////srv/club/replica.sqlite3
+if env('REPLICA_DATABASE_URL', default=''):
+    DATABASES['replica'] = {
+        **env.db_url('REPLICA_DATABASE_URL'),
+        'CONN_MAX_AGE': DATABASES['default']['CONN_MAX_AGE'],
+        'CONN_HEALTH_CHECKS': SQLITE_PRODUCTION,
+    }
+
+DATABASE_ROUTERS = ['club_management.routers.PrimaryReplicaRouter']
+# 쓰기 요청 뒤 이 시간(초) 동안은 같은 브라우저의 읽기를 primary 로 (복제 지연 대비)
+REPLICA_PIN_SECONDS = env.int('REPLICA_PIN_SECONDS', default=15)
+
+
+# 캐시
+# 모임/역할/로그인 사용자 캐시는 버전 번호로 무효화하므로 모든 워커가 같은 캐시를 봐야 한다.
+# 여러 워커로 실행하면 공유 캐시가 필수: 예) CACHE_URL=redis://127.0.0.1:6379/1
+# 기본값 LocMem 은 프로세스마다 따로라, CACHE_SINGLE_PROCESS 가 아니면 버전 캐시를 끈다 (club_management/cache_versions.py)
+CACHES = {
+    'default': env.cache_url('CACHE_URL', default='locmemcache://'),
+}
+# 한 프로세스로만 실행 (runserver 등): LocMem 이어도 버전 캐시 사용
+CACHE_SINGLE_PROCESS = env.bool('CACHE_SINGLE_PROCESS', default=DEBUG)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -105,6 +154,20 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 AUTH_USER_MODEL = 'club_management.User'
 
+# 요청마다 하던 세션 / 로그인 사용자 조회를 캐시로 (club_management/auth_backends.py)
+# 공유 캐시가 있을 때만: LocMem 이면 로그아웃·비밀번호 변경이 다른 워커의 캐시에 남는다
+SHARED_CACHE = CACHES['default']['BACKEND'] != 'django.core.cache.backends.locmem.LocMemCache' or CACHE_SINGLE_PROCESS
+# cached_db: 세션을 캐시에서 읽고, 캐시에 없으면 DB 에서 읽는다 (쓰기는 둘 다)
+SESSION_ENGINE = env(
+    'SESSION_ENGINE',
+    default='django.contrib.sessions.backends.cached_db' if SHARED_CACHE else 'django.contrib.sessions.backends.db',
+)
+AUTHENTICATION_BACKENDS = [
+    'club_management.auth_backends.CachedModelBackend',
+    # 배포 전에 ModelBackend 로 로그인한 세션이 로그아웃되지 않도록 남겨둔다
+    'django.contrib.auth.backends.ModelBackend',
+]
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -122,6 +185,34 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# 게시글 조회수 버퍼를 DB 에 반영하는 주기 (초)
+VIEW_COUNT_FLUSH_INTERVAL = env.int('VIEW_COUNT_FLUSH_INTERVAL', default=30)
+
+# async 뷰(ASGI)에서 상세 화면의 독립적인 섹션을 각자의 스레드/DB 연결로 동시에 조회 (club_management/async_loaders.py)
+# ASGI(config/asgi.py)에서는 기본 True, WSGI/runserver 에서는 기본 False
+# 워커 프로세스마다 스레드 풀 크기(min(32, CPU 수 + 4))만큼 DB 연결이 더 열릴 수 있다
+ASYNC_PARALLEL_SECTIONS = env.bool('ASYNC_PARALLEL_SECTIONS', default=False)
+
+# 요청별 SQL 계측 (club_management/middleware.py)
+SQL_INSTRUMENTATION = env.bool('SQL_INSTRUMENTATION', default=True)
+# 같은 모양의 쿼리가 한 요청에서 이 횟수 이상 실행되면 N+1 로 보고 경고 로그
+SQL_REPEATED_QUERY_THRESHOLD = env.int('SQL_REPEATED_QUERY_THRESHOLD', default=5)
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'club_management.sql': {
+            'handlers': ['console'],
+            'level': env('SQL_LOG_LEVEL', default='WARNING'),
+            'propagate': False,
+        },
+    },
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 